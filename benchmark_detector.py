@@ -0,0 +1,302 @@
+"""
+대기환자 모니터링 시스템 변화 감지 벤치마크
+- 합성 프레임 또는 녹화된 프레임을 ImageChangeDetector에 재생
+- 단계별(전처리, 변화량 계산, 전체 감지) 지연 시간 백분위수, 초당 프레임 수, 최대 메모리 측정
+- 결과는 JSON으로 출력하여 빌드 간 비교에 사용
+
+사용 예:
+    python benchmark_detector.py
+    python benchmark_detector.py --sizes 121x33 3840x2160 --frames 100 --output bench.json
+    python benchmark_detector.py --frames-dir recorded_frames/
+    python benchmark_detector.py --recording frame_recording.pqmrec
+    python benchmark_detector.py --import-time
+    python benchmark_detector.py --sizes 3840x2160 --detection-scale 1 0.5 0.25
+    python benchmark_detector.py --engine absdiff ssim histogram phash
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+import cv2
+import numpy as np
+
+from main_monitior import DETECTOR_ENGINES, ConfigManager, FileCaptureBackend, FrameReplaySource, ImageChangeDetector
+
+# 현재 설정 영역(121x33)부터 4K 전체 화면까지
+DEFAULT_SIZES = ["121x33", "640x480", "1920x1080", "3840x2160"]
+
+# 합성 시퀀스에서 변화가 생기는 간격 (프레임)
+CHANGE_EVERY = 20
+
+# main_monitior 모듈 import 시간 예산 (설정 GUI가 뜨기 전까지 걸리는 시간의 하한)
+IMPORT_TIME_BUDGET_MS = 150
+
+# 시작 시점에 import되면 안 되는 무거운 모듈 (처음 사용할 때 지연 import)
+LAZY_MODULES = ["cv2", "numpy", "PIL", "pygame", "pyautogui", "pytesseract", "mss", "tkinter"]
+
+
+def parse_size(text):
+    """'가로x세로' 문자열을 (가로, 세로)로 변환"""
+    width, height = text.lower().split("x")
+    return int(width), int(height)
+
+
+def make_synthetic_frames(width, height, count, seed=0):
+    """대기열 화면을 흉내 낸 합성 프레임 시퀀스 생성
+
+    대부분은 직전 프레임과 같은 프레임이고, 일부는 약한 노이즈가 섞이며,
+    CHANGE_EVERY 프레임마다 대기열 행이 하나씩 늘어납니다.
+    """
+    rng = np.random.default_rng(seed)
+    row_height = max(4, height // 8)
+    frames = []
+    base = None
+    for index in range(count):
+        if base is None or index % CHANGE_EVERY == 0:
+            base = np.full((height, width, 3), 255, dtype=np.uint8)
+            for row in range((index // CHANGE_EVERY) % 8 + 1):
+                top = row * row_height
+                base[top + 1:top + row_height - 1, 2:width - 2] = (60, 60, 60)
+
+        if index % 4 == 3:
+            # 안티앨리어싱 수준의 미세한 노이즈
+            noise = rng.integers(-3, 4, base.shape, dtype=np.int16)
+            frames.append(np.clip(base.astype(np.int16) + noise, 0, 255).astype(np.uint8))
+        else:
+            frames.append(base)
+    return frames
+
+
+def load_recorded_frames(frames_dir, count):
+    """녹화된 프레임 폴더(이미지 파일)에서 프레임 시퀀스 로드"""
+    backend = FileCaptureBackend(frames_dir)
+    return [backend.grab() for _ in range(min(count, len(backend.frames)))]
+
+
+def load_recording(path, count):
+    """FrameRecorder 녹화 파일에서 프레임 시퀀스 로드 (최대 속도 재생)"""
+    source = FrameReplaySource(path, realtime=False)
+    try:
+        # 녹화 파일 매핑을 닫기 전에 복사
+        return [frame.copy() for _, frame in list(source.iter_frames())[:count]]
+    finally:
+        source.close()
+
+
+def percentiles(samples):
+    """지연 시간 목록(초)을 밀리초 통계로 요약"""
+    values = np.asarray(samples) * 1000.0
+    return {
+        "p50_ms": round(float(np.percentile(values, 50)), 4),
+        "p90_ms": round(float(np.percentile(values, 90)), 4),
+        "p99_ms": round(float(np.percentile(values, 99)), 4),
+        "mean_ms": round(float(values.mean()), 4),
+        "max_ms": round(float(values.max()), 4),
+    }
+
+
+def measure(stage_fn, inputs, warmup):
+    """단계 함수를 입력마다 실행하며 지연 시간, 프로세스 CPU 시간, 최대 추적 메모리 측정"""
+    for item in inputs[:warmup]:
+        stage_fn(item)
+
+    samples = []
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    cpu_start = time.process_time()
+    for item in inputs:
+        start = time.perf_counter()
+        stage_fn(item)
+        samples.append(time.perf_counter() - start)
+    cpu_seconds = time.process_time() - cpu_start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    result = percentiles(samples)
+    result["fps"] = round(len(samples) / sum(samples), 2) if sum(samples) else None
+    result["cpu_ms_per_frame"] = round(cpu_seconds * 1000.0 / len(samples), 4)
+    result["peak_alloc_bytes"] = peak
+    return result
+
+
+def make_detector(options):
+    """벤치마크 옵션을 반영한 감지기 생성 (설정 파일은 읽거나 쓰지 않음)"""
+    config_manager = ConfigManager(initial_config={**options, "debug_mode": False})
+    detector = ImageChangeDetector(config_manager)
+    detector.set_sensitivity(0.01)
+    return detector
+
+
+def benchmark_sequence(name, frames, options, warmup):
+    """프레임 시퀀스 하나에 대해 단계별 측정"""
+    height, width = frames[0].shape[:2]
+
+    # 1) 전처리
+    detector = make_detector(options)
+    preprocess = measure(detector.preprocess_for_comparison, frames, warmup)
+
+    # 2) 변화량 계산 - 연속 프레임 쌍 (버퍼 재사용 모드의 결과 버퍼를 덮어쓰지 않도록 복사해 둠)
+    detector = make_detector(options)
+    processed = [detector.preprocess_for_comparison(frame).copy() for frame in frames]
+    pairs = list(zip(processed, processed[1:] + processed[:1]))
+    calculate = measure(lambda pair: detector.calculate_change(*pair), pairs, warmup)
+
+    # 3) 전체 감지 (지문 생략, 기준 갱신 포함)
+    detector = make_detector(options)
+    changes = []
+    detect = measure(lambda frame: changes.append(detector.detect_change(frame)), frames, warmup)
+
+    return {
+        "sequence": name,
+        "engine": detector.engine.name,
+        "detection_scale": options.get("detection_scale", 1.0),
+        "width": width,
+        "height": height,
+        "pixels": width * height,
+        "frames": len(frames),
+        "changes_detected": sum(changes),
+        "fingerprint": detector.get_fingerprint_stats(),
+        "engine_cost": detector.engine.get_cost_stats(),
+        "stages": {
+            "preprocess_for_comparison": preprocess,
+            "calculate_change": calculate,
+            "detect_change": detect,
+        },
+    }
+
+
+def measure_import_time(runs):
+    """새 인터프리터에서 main_monitior import 시간을 측정하고 예산과 비교"""
+    script = (
+        "import json, sys, time\n"
+        "start = time.perf_counter()\n"
+        "import main_monitior\n"
+        "elapsed = time.perf_counter() - start\n"
+        f"loaded = [name for name in {LAZY_MODULES!r} if name in sys.modules]\n"
+        "print(json.dumps({'ms': elapsed * 1000, 'loaded': loaded}))\n"
+    )
+    project_dir = os.path.dirname(os.path.abspath(__file__))
+
+    samples = []
+    loaded = set()
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, "-c", script], cwd=project_dir,
+                                capture_output=True, text=True, check=True).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        samples.append(result["ms"])
+        loaded.update(result["loaded"])
+
+    median_ms = float(np.median(samples))
+    return {
+        "budget_ms": IMPORT_TIME_BUDGET_MS,
+        "median_ms": round(median_ms, 2),
+        "min_ms": round(min(samples), 2),
+        "max_ms": round(max(samples), 2),
+        "runs": runs,
+        "eagerly_loaded_modules": sorted(loaded),
+        "within_budget": median_ms <= IMPORT_TIME_BUDGET_MS and not loaded,
+    }
+
+
+def max_rss_bytes():
+    """프로세스 최대 상주 메모리 (지원되는 플랫폼만)"""
+    try:
+        import resource
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux는 KB, macOS는 바이트 단위
+        return rss if sys.platform == "darwin" else rss * 1024
+    except ImportError:
+        return None
+
+
+def write_report(report, output):
+    """결과를 JSON으로 저장하거나 표준 출력에 출력"""
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if output:
+        with open(output, "w", encoding="utf-8") as f:
+            f.write(text)
+        print(f"✓ 결과 저장: {output}", file=sys.stderr)
+    else:
+        print(text)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="변화 감지 파이프라인 벤치마크")
+    parser.add_argument("--sizes", nargs="+", default=DEFAULT_SIZES, help="영역 크기 목록 (예: 121x33 3840x2160)")
+    parser.add_argument("--frames", type=int, default=200, help="크기별 재생 프레임 수")
+    parser.add_argument("--warmup", type=int, default=5, help="측정 전 예열 프레임 수")
+    parser.add_argument("--frames-dir", help="녹화된 프레임 이미지 폴더 (있으면 함께 측정)")
+    parser.add_argument("--recording", help="FrameRecorder 녹화 파일 (있으면 함께 측정)")
+    parser.add_argument("--no-reuse-buffers", action="store_true", help="버퍼 재사용 없이 측정")
+    parser.add_argument("--tile-grid", help="타일 격자 (예: 8x1)")
+    parser.add_argument("--engine", nargs="+", choices=list(DETECTOR_ENGINES), default=["absdiff"],
+                        help="감지 엔진 목록 (엔진마다 모든 시퀀스 측정)")
+    parser.add_argument("--detection-scale", nargs="+", type=float, default=[1.0],
+                        help="감지 해상도 배율 목록 (예: 1 0.5 0.25, 배율마다 모든 시퀀스 측정)")
+    parser.add_argument("--import-time", action="store_true",
+                        help=f"모듈 import 시간만 측정 (예산 {IMPORT_TIME_BUDGET_MS}ms 초과 시 종료 코드 1)")
+    parser.add_argument("--output", help="결과 JSON 파일 경로 (없으면 표준 출력)")
+    args = parser.parse_args()
+
+    if args.import_time:
+        report = measure_import_time(runs=7)
+        write_report(report, args.output)
+        if not report["within_budget"]:
+            print(f"✗ import 시간 예산 초과: {report['median_ms']}ms > {IMPORT_TIME_BUDGET_MS}ms, "
+                  f"시작 시 로드된 모듈: {report['eagerly_loaded_modules']}", file=sys.stderr)
+            sys.exit(1)
+        return
+
+    # 감지 로그가 측정을 왜곡하지 않도록 경고 이상만 출력
+    logging.getLogger().setLevel(logging.WARNING)
+
+    options = {"reuse_buffers": not args.no_reuse_buffers}
+    if args.tile_grid:
+        rows, cols = args.tile_grid.lower().split("x")
+        options["tile_grid"] = [int(rows), int(cols)]
+
+    sequences = []
+    for size in args.sizes:
+        width, height = parse_size(size)
+        sequences.append((f"synthetic-{size}", make_synthetic_frames(width, height, args.frames)))
+
+    if args.frames_dir:
+        sequences.append((f"recorded-{os.path.basename(os.path.normpath(args.frames_dir))}",
+                          load_recorded_frames(args.frames_dir, args.frames)))
+
+    if args.recording:
+        sequences.append((f"recording-{os.path.basename(args.recording)}", load_recording(args.recording, args.frames)))
+
+    results = []
+    for engine in args.engine:
+        for scale in args.detection_scale:
+            run_options = {**options, "detector_engine": engine, "detection_scale": scale}
+            for name, frames in sequences:
+                results.append(benchmark_sequence(name, frames, run_options, args.warmup))
+                print(f"✓ {name} ({engine}, 감지 배율 {scale}) 측정 완료", file=sys.stderr)
+
+    report = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "numpy": np.__version__,
+            "opencv": cv2.__version__,
+        },
+        "options": options,
+        "max_rss_bytes": max_rss_bytes(),
+        "results": results,
+    }
+
+    write_report(report, args.output)
+
+
+if __name__ == "__main__":
+    main()
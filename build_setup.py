@@ -29,6 +29,13 @@ def install_requirements():
         except subprocess.CalledProcessError:
             print(f"✗ {package} 설치 실패")
             return False
+    
+    # 대기 인원 OCR 엔진 - 설치하지 못하면 실행 파일은 만들되 OCR은 tesseract 실행 파일로 대체됨
+    try:
+        subprocess.run([sys.executable, "-m", "pip", "install", "tesserocr"], check=True)
+        print("✓ tesserocr 설치 완료")
+    except subprocess.CalledProcessError:
+        print("⚠ tesserocr 설치 실패 - 대기 인원 OCR은 느린 tesseract 실행 파일 방식으로 동작합니다")
     return True
 
 # PyInstaller로 실행 파일 생성
@@ -46,7 +53,8 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[('monitoring_voice.mp3', '.'), ('monitor_config.json', '.')],
-    hiddenimports=[],
+    # main_monitior.py는 무거운 라이브러리를 지연 import하므로 명시적으로 포함
+    hiddenimports=['cv2', 'numpy', 'PIL.ImageTk', 'pygame', 'pyautogui', 'pytesseract', 'tesserocr', 'mss', 'sqlite3', 'tkinter', 'tkinter.messagebox', 'tkinter.ttk', 'tkinter.filedialog', 'tkinter.simpledialog'],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
@@ -1,64 +1,202 @@
 # main_monitor.py - 개선된 대기환자 모니터링 시스템 (변화 감지 방식)
+from __future__ import annotations
+
 import time
 import threading
+import queue
 import logging
+import logging.handlers
+import atexit
+import importlib
+import importlib.util
+import argparse
+import signal
 from typing import Optional, Tuple, List
-import cv2
-import numpy as np
-from PIL import Image, ImageTk
-import tkinter as tk
-from tkinter import messagebox, ttk, filedialog
 import re
 import json
 import os
 import sys
-from datetime import datetime
+from datetime import datetime, timedelta
 import subprocess
-import urllib.request
-import zipfile
+import multiprocessing
+import shutil
+import zlib
+import mmap
+import pathlib
+import struct
+import collections
+import bisect
+import concurrent.futures
+
+class LazyModule:
+    """지연 import 모듈 - 처음 속성에 접근할 때 실제로 import
+    
+    설정 GUI를 띄우는 데 필요 없는 무거운 라이브러리(OpenCV, NumPy, pygame 등)를
+    시작 시점이 아니라 처음 사용하는 시점에 불러옵니다.
+    """
+    
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+    
+    def _load(self):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return self._module
+    
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+    
+    def __repr__(self):
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<LazyModule {self._name} ({state})>"
+
+def is_module_available(name: str) -> bool:
+    """모듈을 import하지 않고 설치 여부만 확인"""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+# 파이프라인 하위 프로세스(spawn)에서는 모듈을 다시 import하므로 안내 메시지를 반복하지 않음
+# 안내 메시지는 stderr로 출력 (benchmark_detector.py처럼 stdout을 결과 JSON으로 쓰는 도구를 깨지 않도록)
+IS_MAIN_PROCESS = multiprocessing.current_process().name == 'MainProcess'
+
+# GUI 모듈도 지연 import (헤드리스 모드에서는 tkinter를 전혀 불러오지 않음)
+tk = LazyModule('tkinter')
+messagebox = LazyModule('tkinter.messagebox')
+ttk = LazyModule('tkinter.ttk')
+filedialog = LazyModule('tkinter.filedialog')
+simpledialog = LazyModule('tkinter.simpledialog')
+
+# 이벤트 기록 DB (기록을 켤 때만 불러옴)
+sqlite3 = LazyModule('sqlite3')
+
+cv2 = LazyModule('cv2')
+np = LazyModule('numpy')
+ImageTk = LazyModule('PIL.ImageTk')
 
 # OCR 라이브러리 동적 import
-try:
-    import pytesseract
-    TESSERACT_AVAILABLE = True
-except ImportError:
-    TESSERACT_AVAILABLE = False
-    print("⚠️ pytesseract가 설치되지 않았습니다.")
-    print("설치: pip install pytesseract")
-
-try:
-    import pyautogui
-    PYAUTOGUI_AVAILABLE = True
-except ImportError:
-    PYAUTOGUI_AVAILABLE = False
-    print("⚠️ pyautogui가 설치되지 않았습니다.")
-    print("설치: pip install pyautogui")
-
-# 오디오 플레이어 import
-try:
-    import pygame
-    PYGAME_AVAILABLE = True
-    # Pygame 초기화
-    pygame.init()
-except ImportError:
-    PYGAME_AVAILABLE = False
-    print("⚠️ pygame이 설치되지 않았습니다.")
-    print("설치: pip install pygame")
+pytesseract = LazyModule('pytesseract')
+TESSERACT_AVAILABLE = is_module_available('pytesseract')
+if not TESSERACT_AVAILABLE and IS_MAIN_PROCESS:
+    print("⚠️ pytesseract가 설치되지 않았습니다.", file=sys.stderr)
+    print("설치: pip install pytesseract", file=sys.stderr)
+
+# Tesseract API 바인딩 (선택 사항, 있으면 OCR 엔진을 프로세스 안에 계속 열어 둠)
+tesserocr = LazyModule('tesserocr')
+TESSEROCR_AVAILABLE = is_module_available('tesserocr')
+
+pyautogui = LazyModule('pyautogui')
+PYAUTOGUI_AVAILABLE = is_module_available('pyautogui')
+if not PYAUTOGUI_AVAILABLE and IS_MAIN_PROCESS:
+    print("⚠️ pyautogui가 설치되지 않았습니다.", file=sys.stderr)
+    print("설치: pip install pyautogui", file=sys.stderr)
+
+# 고속 화면 캡처 라이브러리 (선택 사항, 없으면 pyautogui 사용)
+mss = LazyModule('mss')
+MSS_AVAILABLE = is_module_available('mss')
+
+# 오디오 플레이어 import (믹서는 처음 재생할 때 초기화)
+pygame = LazyModule('pygame')
+PYGAME_AVAILABLE = is_module_available('pygame')
+if not PYGAME_AVAILABLE and IS_MAIN_PROCESS:
+    print("⚠️ pygame이 설치되지 않았습니다.", file=sys.stderr)
+    print("설치: pip install pygame", file=sys.stderr)
 
 # 로깅 설정
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('patient_monitor.log', encoding='utf-8'),
-        logging.StreamHandler()
-    ]
-)
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
+def create_log_file_handler(log_file: str = 'patient_monitor.log', rotation: str = 'size',
+                            max_mb: float = 10, backup_count: int = 5) -> logging.Handler:
+    """회전 로그 파일 핸들러 생성 (size: 파일 크기 기준, daily: 자정 기준)"""
+    if rotation == 'daily':
+        handler = logging.handlers.TimedRotatingFileHandler(
+            log_file, when='midnight', backupCount=backup_count, encoding='utf-8', delay=True)
+    else:
+        handler = logging.handlers.RotatingFileHandler(
+            log_file, maxBytes=int(max_mb * 1024 * 1024), backupCount=backup_count,
+            encoding='utf-8', delay=True)
+    handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    return handler
+
+def setup_logging(config: Optional[dict] = None):
+    """큐 기반 비동기 로깅 설정
+    
+    로그 호출은 메시지를 큐에 넣기만 하고, 파일 쓰기와 콘솔 출력은 백그라운드
+    리스너 스레드 하나가 담당합니다. 설정을 바꿔 다시 호출하면 리스너를 교체합니다.
+    """
+    global _log_listener
+    config = config or {}
+    
+    # 출력 형식에 쓰지 않는 스레드/프로세스 정보는 수집하지 않음
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    
+    shutdown_logging()
+    
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    file_handler = create_log_file_handler(
+        config.get('log_file') or 'patient_monitor.log',
+        rotation=config.get('log_rotation', 'size'),
+        max_mb=float(config.get('log_max_mb', 10)),
+        backup_count=int(config.get('log_backup_count', 5)),
+    )
+    
+    log_queue = queue.SimpleQueue()
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    # 잘못된 log_level 때문에 시작이 중단되지 않도록 INFO로 기록하고 경고
+    level = logging.getLevelName(str(config.get('log_level', 'INFO')).upper())
+    valid_level = isinstance(level, int)
+    root.setLevel(level if valid_level else logging.INFO)
+    
+    _log_listener = logging.handlers.QueueListener(log_queue, file_handler, stream_handler)
+    _log_listener.start()
+    if not valid_level:
+        logging.getLogger(__name__).warning(f"알 수 없는 log_level {config.get('log_level')!r} - INFO로 기록합니다 "
+                                            f"(DEBUG, INFO, WARNING, ERROR 중 선택)")
+
+def shutdown_logging():
+    """로그 리스너를 멈추고 남은 로그를 모두 기록한 뒤 파일 닫기"""
+    global _log_listener
+    if _log_listener is None:
+        return
+    listener, _log_listener = _log_listener, None
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+def setup_worker_logging(log_queue, config: Optional[dict] = None):
+    """하위 프로세스 로깅 설정 - 로그 기록을 부모 프로세스 큐로 보냄 (로그 파일은 부모만 씀)"""
+    shutdown_logging()
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(str((config or {}).get('log_level', 'INFO')).upper())
+
+class ProcessLogForwarder(logging.Handler):
+    """하위 프로세스에서 받은 로그 기록을 이 프로세스의 로거로 다시 전달"""
+    
+    def emit(self, record):
+        logging.getLogger(record.name).handle(record)
+
+setup_logging()
+atexit.register(shutdown_logging)
 logger = logging.getLogger(__name__)
 
 class TesseractSetup:
     """Tesseract OCR 자동 설정 클래스"""
     
+    # 실행 파일/언어 데이터가 그대로면 외부 프로세스 실행 없이 이전 확인 결과 사용
+    PROBE_CACHE_FILE = 'tesseract_probe_cache.json'
+    
     @staticmethod
     def check_tesseract_installation():
         """Tesseract 설치 확인 및 자동 설정"""
@@ -66,42 +204,32 @@ class TesseractSetup:
             if not TESSERACT_AVAILABLE:
                 return False, "pytesseract 라이브러리가 설치되지 않았습니다."
             
-            # Tesseract 실행 파일 경로 확인
-            tesseract_cmd = pytesseract.pytesseract.tesseract_cmd
+            cache = TesseractSetup.load_probe_cache()
+            tesseract_cmd = TesseractSetup.resolve_tesseract_cmd(cache)
+            pytesseract.pytesseract.tesseract_cmd = tesseract_cmd
             
-            # Windows에서 기본 설치 경로 확인
-            if sys.platform.startswith('win'):
-                possible_paths = [
-                    r'C:\Program Files\Tesseract-OCR\tesseract.exe',
-                    r'C:\Program Files (x86)\Tesseract-OCR\tesseract.exe',
-                    r'C:\Users\{}\AppData\Local\Tesseract-OCR\tesseract.exe'.format(os.getenv('USERNAME')),
-                ]
-                
-                for path in possible_paths:
-                    if os.path.exists(path):
-                        pytesseract.pytesseract.tesseract_cmd = path
-                        tesseract_cmd = path
-                        break
+            # 캐시 확인: 실행 파일 경로, 수정 시각, 크기, tessdata 폴더 수정 시각이 모두 같아야 재사용
+            signature = TesseractSetup.get_probe_signature(tesseract_cmd)
+            if signature is None:
+                return False, "Tesseract가 설치되지 않았습니다."
             
-            # Tesseract 버전 확인
-            result = subprocess.run([tesseract_cmd, '--version'], 
-                                  capture_output=True, text=True, timeout=10)
+            entry = cache['entries'].get(signature['path'])
+            if entry and entry.get('signature') == signature:
+                logger.info("Tesseract 확인 결과 캐시 사용")
+                return entry['status'], entry['message']
             
-            if result.returncode == 0:
-                # 한국어 언어팩 확인
-                lang_result = subprocess.run([tesseract_cmd, '--list-langs'], 
-                                           capture_output=True, text=True, timeout=10)
-                
-                has_korean = 'kor' in lang_result.stdout
-                
-                if not has_korean:
-                    # 한국어 언어팩 자동 설치 시도
-                    install_msg = TesseractSetup.try_install_korean_pack(tesseract_cmd)
-                    return True, f"Tesseract 설치됨. 한국어팩: {install_msg}"
-                else:
-                    return True, f"Tesseract 설치됨. 한국어팩: 있음"
-            else:
-                return False, "Tesseract 실행 파일을 찾을 수 없습니다."
+            status, message, cacheable = TesseractSetup.probe_tesseract(tesseract_cmd)
+            
+            if cacheable:
+                cache['entries'][signature['path']] = {
+                    'signature': signature,
+                    'status': status,
+                    'message': message,
+                }
+                cache['last_cmd'] = signature['path']
+                TesseractSetup.save_probe_cache(cache)
+            
+            return status, message
                 
         except subprocess.TimeoutExpired:
             return False, "Tesseract 응답 시간 초과"
@@ -110,6 +238,105 @@ class TesseractSetup:
         except Exception as e:
             return False, f"Tesseract 확인 중 오류: {e}"
     
+    @staticmethod
+    def resolve_tesseract_cmd(cache: dict) -> str:
+        """Tesseract 실행 파일 경로 결정 (캐시된 경로가 유효하면 설치 경로 탐색 생략)"""
+        last_cmd = cache.get('last_cmd')
+        if last_cmd and os.path.isfile(last_cmd):
+            return last_cmd
+        
+        # Tesseract 실행 파일 경로 확인 (pytesseract 없이 실행 파일만 쓰는 경우도 있음)
+        tesseract_cmd = pytesseract.pytesseract.tesseract_cmd if TESSERACT_AVAILABLE else 'tesseract'
+        
+        # Windows에서 기본 설치 경로 확인
+        if sys.platform.startswith('win'):
+            possible_paths = [
+                r'C:\Program Files\Tesseract-OCR\tesseract.exe',
+                r'C:\Program Files (x86)\Tesseract-OCR\tesseract.exe',
+                r'C:\Users\{}\AppData\Local\Tesseract-OCR\tesseract.exe'.format(os.getenv('USERNAME')),
+            ]
+            
+            for path in possible_paths:
+                if os.path.exists(path):
+                    tesseract_cmd = path
+                    break
+        
+        return tesseract_cmd
+    
+    @staticmethod
+    def get_probe_signature(tesseract_cmd: str) -> Optional[dict]:
+        """실행 파일과 tessdata 폴더 상태 (바뀌면 다시 확인해야 함)"""
+        path = tesseract_cmd if os.path.isabs(tesseract_cmd) else shutil.which(tesseract_cmd)
+        if not path or not os.path.isfile(path):
+            return None
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        
+        tessdata_dir = TesseractSetup.find_tessdata_dir(path)
+        tessdata_mtime = os.stat(tessdata_dir).st_mtime_ns if tessdata_dir else None
+        
+        return {
+            'path': path,
+            'mtime': stat.st_mtime_ns,
+            'size': stat.st_size,
+            'tessdata_mtime': tessdata_mtime,
+        }
+    
+    @staticmethod
+    def find_tessdata_dir(tesseract_path: str) -> Optional[str]:
+        """언어 데이터 폴더 (TESSDATA_PREFIX 우선, 없으면 실행 파일 옆 tessdata)"""
+        for tessdata_dir in (os.environ.get('TESSDATA_PREFIX'), os.path.join(os.path.dirname(tesseract_path), 'tessdata')):
+            if tessdata_dir and os.path.isdir(tessdata_dir):
+                return tessdata_dir
+        return None
+    
+    @staticmethod
+    def probe_tesseract(tesseract_cmd: str) -> Tuple[bool, str, bool]:
+        """Tesseract 실행으로 버전/언어팩 확인 - (상태, 메시지, 캐시 가능 여부) 반환"""
+        # Tesseract 버전 확인
+        result = subprocess.run([tesseract_cmd, '--version'], 
+                              capture_output=True, text=True, timeout=10)
+        
+        if result.returncode == 0:
+            # 한국어 언어팩 확인
+            lang_result = subprocess.run([tesseract_cmd, '--list-langs'], 
+                                       capture_output=True, text=True, timeout=10)
+            
+            has_korean = 'kor' in lang_result.stdout
+            
+            if not has_korean:
+                # 한국어 언어팩 자동 설치 시도 (설치 후에는 tessdata가 바뀌므로 다음 실행 때 다시 확인)
+                install_msg = TesseractSetup.try_install_korean_pack(tesseract_cmd)
+                return True, f"Tesseract 설치됨. 한국어팩: {install_msg}", False
+            else:
+                return True, "Tesseract 설치됨. 한국어팩: 있음", True
+        else:
+            return False, "Tesseract 실행 파일을 찾을 수 없습니다.", True
+    
+    @staticmethod
+    def load_probe_cache() -> dict:
+        """Tesseract 확인 결과 캐시 로드"""
+        try:
+            if os.path.exists(TesseractSetup.PROBE_CACHE_FILE):
+                with open(TesseractSetup.PROBE_CACHE_FILE, 'r', encoding='utf-8') as f:
+                    cache = json.load(f)
+                if isinstance(cache.get('entries'), dict):
+                    return cache
+        except Exception as e:
+            logger.debug(f"Tesseract 캐시 로드 실패: {e}")
+        return {'entries': {}, 'last_cmd': None}
+    
+    @staticmethod
+    def save_probe_cache(cache: dict):
+        """Tesseract 확인 결과 캐시 저장 (임시 파일에 쓴 뒤 교체)"""
+        try:
+            temp_file = TesseractSetup.PROBE_CACHE_FILE + '.tmp'
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(cache, f, indent=2, ensure_ascii=False)
+            os.replace(temp_file, TesseractSetup.PROBE_CACHE_FILE)
+        except Exception as e:
+            logger.debug(f"Tesseract 캐시 저장 실패: {e}")
+    
     @staticmethod
     def try_install_korean_pack(tesseract_cmd):
         """한국어 언어팩 자동 설치 시도"""
@@ -145,6 +372,103 @@ class TesseractSetup:
             logger.error(f"한국어 언어팩 설치 실패: {e}")
             return f"설치 실패: {str(e)}"
 
+class OCRService:
+    """OCR 엔진을 한 번만 불러 두고 여러 영역 이미지를 묶음으로 인식하는 서비스
+    
+    대기 인원 OCR에는 tesserocr가 필요합니다. 프로세스 안에 Tesseract API를 열어 두고 이미지마다
+    바로 인식합니다. tesserocr를 설치할 수 없는 환경을 위한 cli 대체 경로는 이미지마다 tesseract를
+    실행하므로 프로세스 시작과 언어 모델 로딩 비용을 매번 냅니다. 두 경로 모두 이미지마다 따로
+    시간을 재고 시간 제한을 겁니다. API 객체는 스레드 안전하지 않으므로 한 번에 한 묶음씩 처리합니다.
+    """
+    
+    BACKENDS = ('auto', 'tesserocr', 'cli')
+    
+    def __init__(self, lang: str = 'kor+eng', psm: int = 6, timeout: float = 2.0, backend: str = 'auto'):
+        if backend not in self.BACKENDS:
+            raise ValueError(f"알 수 없는 OCR 백엔드: {backend}")
+        if backend == 'auto':
+            backend = 'tesserocr' if TESSEROCR_AVAILABLE else 'cli'
+        self.backend = backend
+        self.lang = lang
+        self.psm = psm
+        self.timeout = timeout
+        self.tesseract_cmd = TesseractSetup.resolve_tesseract_cmd(TesseractSetup.load_probe_cache())
+        self.api = None
+        self.lock = threading.Lock()
+    
+    def is_available(self) -> bool:
+        """선택된 백엔드를 쓸 수 있는지 (cli는 실행 파일 존재 여부)"""
+        if self.backend == 'tesserocr':
+            return TESSEROCR_AVAILABLE
+        return os.path.isfile(self.tesseract_cmd) or shutil.which(self.tesseract_cmd) is not None
+    
+    def recognize_batch(self, images: List[np.ndarray]) -> List[Tuple[str, float]]:
+        """이미지 묶음 인식 - 이미지마다 (문자열, 지연 시간 초) 반환, 실패한 이미지는 빈 문자열"""
+        if not images:
+            return []
+        with self.lock:
+            if self.backend == 'tesserocr':
+                return self._recognize_api(images)
+            return self._recognize_cli(images)
+    
+    def close(self):
+        """열어 둔 Tesseract API 해제"""
+        with self.lock:
+            if self.api is not None:
+                self.api.End()
+                self.api = None
+    
+    def _recognize_api(self, images: List[np.ndarray]) -> List[Tuple[str, float]]:
+        if self.api is None:
+            kwargs = {'lang': self.lang, 'psm': self.psm}
+            tessdata_dir = TesseractSetup.find_tessdata_dir(self.tesseract_cmd)
+            if tessdata_dir:
+                kwargs['path'] = tessdata_dir
+            self.api = tesserocr.PyTessBaseAPI(**kwargs)
+            logger.info(f"Tesseract API 로드 완료 (언어: {self.lang})")
+        
+        results = []
+        for image in images:
+            started_at = time.perf_counter()
+            try:
+                image = np.ascontiguousarray(image)
+                height, width = image.shape[:2]
+                channels = image.shape[2] if len(image.shape) == 3 else 1
+                self.api.SetImageBytes(image.tobytes(), width, height, channels, width * channels)
+                # 인식 단계에 시간 제한(밀리초)을 걸고, 넘기면 결과 없이 다음 이미지로
+                if self.api.Recognize(int(self.timeout * 1000)):
+                    text = self.api.GetUTF8Text()
+                else:
+                    logger.warning(f"OCR 시간 초과 ({self.timeout:.1f}초)")
+                    text = ""
+            except Exception as e:
+                logger.error(f"OCR 실패: {e}")
+                text = ""
+            results.append((text, time.perf_counter() - started_at))
+        return results
+    
+    def _recognize_cli(self, images: List[np.ndarray]) -> List[Tuple[str, float]]:
+        results = []
+        for image in images:
+            started_at = time.perf_counter()
+            text = ""
+            try:
+                # PNG를 표준 입력으로 넘겨 임시 파일 없이 실행 (Windows 한글 경로 문제도 없음)
+                result = subprocess.run(
+                    [self.tesseract_cmd, 'stdin', 'stdout', '-l', self.lang, '--psm', str(self.psm)],
+                    input=cv2.imencode('.png', image)[1].tobytes(), capture_output=True, timeout=self.timeout,
+                    creationflags=getattr(subprocess, 'CREATE_NO_WINDOW', 0))
+                if result.returncode != 0:
+                    logger.error(f"OCR 실패: {result.stderr.decode('utf-8', 'replace').strip()}")
+                else:
+                    text = result.stdout.decode('utf-8', 'replace')
+            except subprocess.TimeoutExpired:
+                logger.warning(f"OCR 시간 초과 ({self.timeout:.1f}초)")
+            except Exception as e:
+                logger.error(f"OCR 실패: {e}")
+            results.append((text, time.perf_counter() - started_at))
+        return results
+
 class ScreenRegionSelector:
     """화면 영역 선택 도구 - 마우스 드래그로 영역 선택"""
     
@@ -291,18 +615,80 @@ class ScreenRegionSelector:
             self.selection_window.destroy()
 
 class ConfigManager:
-    """설정 관리 클래스"""
+    """설정 관리 클래스
     
-    def __init__(self, config_file='monitor_config.json'):
+    save_config()는 저장을 예약만 하고, 백그라운드 스레드가 변경이 잠잠해진 뒤
+    임시 파일에 쓰고 교체하는 방식으로 한 번에 저장합니다. 종료 시에는 flush()를 호출합니다.
+    """
+    
+    WRITE_DELAY = 0.5       # 마지막 변경 후 이 시간(초) 동안 추가 변경이 없으면 저장
+    MAX_WRITE_DELAY = 3.0   # 변경이 계속되더라도 첫 변경 후 이 시간이 지나면 저장
+    
+    def __init__(self, config_file='monitor_config.json', initial_config: Optional[dict] = None):
         self.config_file = config_file
+        self._pending = threading.Condition()
+        self._file_lock = threading.Lock()
+        self._dirty_since = None
+        self._last_change = 0.0
+        self._writer_thread = None
         self.default_config = {
             'monitoring_region': None,
+            'monitoring_regions': [],    # [{"label": ..., "region": [x, y, w, h], "sensitivity": ...}, ...]
             'monitoring_interval': 2.0,
             'change_sensitivity': 0.05,
             'alert_duration': 5.0,
-            'debug_mode': False
+            'debug_mode': False,
+            'debug_dir': 'debug_images',     # 디버그 이미지 저장 폴더
+            'debug_max_mb': 50,              # 디버그 이미지 디스크 사용량 한도 (오래된 파일부터 삭제)
+            'debug_png_compression': 1,      # PNG 압축 수준 (0: 빠름/큼 ~ 9: 느림/작음)
+            'capture_backend': 'auto',   # auto, mss, pyautogui, file, synthetic, replay
+            'capture_source': None,      # file 백엔드용 이미지 파일/폴더, replay 백엔드용 녹화 파일 경로
+            'replay_realtime': True,     # replay 백엔드: 녹화 당시 간격대로 재생
+            'reuse_buffers': True,       # 변화 감지 시 프레임 버퍼 재사용 (프레임당 메모리 할당 없음)
+            'adaptive_polling': True,    # 변화 직후 빠르게, 오래 변화 없으면 느리게 캡처
+            'min_monitoring_interval': 0.5,
+            'max_monitoring_interval': 10.0,
+            'idle_backoff_after': 300.0, # 이 시간(초) 동안 변화가 없으면 최대 주기까지 점차 늘림
+            'frame_fingerprint': True,   # 직전 프레임과 완전히 같으면 전처리 생략
+            'fingerprint_stride': 1,     # 1이면 전체 픽셀, N이면 N픽셀 간격 샘플로 지문 계산
+            'fingerprint_full_check': 10, # 간격 샘플 지문(손실 있음)으로 연속 N번 생략하면 한 번은 전체 비교
+            'tile_grid': None,           # [행, 열] 지정 시 타일별 변화 위치 계산 (예: 대기열 8행이면 [8, 1])
+            'tile_min_pixels': 10,       # 타일을 "변화"로 볼 최소 변화 픽셀 수
+            'record_frames': False,      # 캡처 프레임을 링 파일에 녹화 (오탐/미탐 재현용)
+            'recording_file': 'frame_recording.pqmrec',
+            'recording_max_mb': 64,      # 녹화 파일 최대 크기 (가장 오래된 프레임부터 덮어씀)
+            'log_level': 'INFO',         # DEBUG, INFO, WARNING, ERROR (낮은 수준의 로그는 포맷하지 않음)
+            'log_file': 'patient_monitor.log',
+            'log_rotation': 'size',      # size: log_max_mb마다 회전, daily: 자정마다 회전
+            'log_max_mb': 10,
+            'log_backup_count': 5,       # 보관할 이전 로그 파일 수
+            'metrics_port': None,        # 지정 시 127.0.0.1:<포트>/metrics 에 단계별 통계 제공 (Prometheus 형식)
+            'alert_sinks': ['log'],      # 헤드리스 모드 알림 대상: log, sound, command
+            'alert_command': None,       # command 대상에서 알림마다 실행할 명령
+            'pipeline_mode': False,      # 캡처 프로세스 + 감지 작업 프로세스로 분리 (영역이 많을 때)
+            'pipeline_workers': 0,       # 감지 작업 프로세스 수 (0이면 CPU 코어 수 - 1, 영역 수 이하)
+            'detection_scale': 1.0,      # 감지 해상도 배율 (예: 0.25면 가로세로 1/4로 축소해 비교, 큰 영역용)
+            'baseline_mode': 'snapshot', # snapshot: 변화 시점 이미지와 비교, running_average: 이동 평균 배경과 비교
+            'background_alpha': 0.05,    # running_average 배경 갱신 비율 (클수록 빨리 적응)
+            'confirm_frames': 1,         # 이 프레임 수만큼 연속으로 변화가 보여야 알림 (1이면 즉시)
+            'detector_engine': 'absdiff', # absdiff, ssim, histogram, phash
+            'known_state_cache': False,  # 안정 상태의 지각 해시를 기억해 무시로 지정한 상태는 비교 없이 무시
+            'known_state_capacity': 64,  # 기억할 안정 상태 수 (가장 오래 안 본 상태부터 제거)
+            'ignored_states': {},        # 영역 라벨별 무시할 화면 상태의 지각 해시 (16진수, "현재 화면 상태 무시"로 추가)
+            'ocr_enabled': False,        # 변화가 감지된 프레임에서만 대기 인원 수를 OCR해 알림에 표시 (예: 3 → 4명 대기)
+            'ocr_lang': 'kor+eng',
+            'ocr_workers': 1,            # OCR 작업 스레드 수 (캡처 루프는 OCR을 기다리지 않음)
+            'ocr_timeout': 2.0,          # OCR 한 번의 최대 시간(초), 넘으면 인원 수 없이 알림
+            'ocr_backend': 'auto',       # auto, tesserocr(엔진을 프로세스 안에 유지), cli(tesserocr가 없을 때의 대체, 이미지마다 tesseract 실행)
+            'history_enabled': True,     # 감지된 변화를 SQLite DB에 기록 (일별 보고서용)
+            'history_db': 'event_history.db',
+            'history_thumbnails': False  # 변화 시점 영역 축소 이미지(JPEG)도 함께 저장
         }
-        self.config = self.load_config()
+        if initial_config is not None:
+            # 파일 대신 주어진 설정 사용 (벤치마크, 작업 프로세스 등)
+            self.config = {**self.default_config, **initial_config}
+        else:
+            self.config = self.load_config()
     
     def load_config(self) -> dict:
         """설정 파일 로드"""
@@ -321,43 +707,476 @@ class ConfigManager:
             return self.default_config.copy()
     
     def save_config(self):
-        """설정 파일 저장"""
+        """설정 파일 저장 예약 (슬라이더 조작처럼 연속된 변경은 한 번의 쓰기로 합침)"""
+        with self._pending:
+            now = time.monotonic()
+            if self._dirty_since is None:
+                self._dirty_since = now
+            self._last_change = now
+            
+            if self._writer_thread is None:
+                self._writer_thread = threading.Thread(target=self._writer_loop, name="ConfigWriter", daemon=True)
+                self._writer_thread.start()
+                # 데몬 스레드는 종료 시 중단되므로 남은 변경은 종료 시점에 저장
+                atexit.register(self.flush)
+            self._pending.notify()
+    
+    def flush(self):
+        """예약된 설정을 즉시 저장 (프로그램 종료 시 호출)"""
+        with self._file_lock:
+            with self._pending:
+                if self._dirty_since is None:
+                    return
+                self._dirty_since = None
+                snapshot = self._snapshot()
+            self._write_file(snapshot)
+    
+    def _writer_loop(self):
+        """백그라운드 저장 스레드 - 변경이 잠잠해지면 저장"""
+        while True:
+            with self._pending:
+                while self._dirty_since is None:
+                    self._pending.wait()
+                
+                now = time.monotonic()
+                due = min(self._last_change + self.WRITE_DELAY, self._dirty_since + self.MAX_WRITE_DELAY)
+                if now < due:
+                    self._pending.wait(due - now)
+                    continue
+            self.flush()
+    
+    def _snapshot(self) -> str:
+        """현재 설정을 JSON 문자열로 직렬화 (GUI 스레드가 바꾸는 중일 수 있으므로 복사본 사용)"""
+        return json.dumps(dict(self.config), indent=2, ensure_ascii=False)
+    
+    def _write_file(self, text: str):
+        """임시 파일에 쓴 뒤 교체 (쓰는 도중 종료되어도 기존 설정 파일 유지)"""
+        temp_file = f"{self.config_file}.tmp"
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=2, ensure_ascii=False)
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                f.write(text)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_file, self.config_file)
             logger.info("설정 저장 완료")
         except Exception as e:
             logger.error(f"설정 저장 실패: {e}")
 
+class CaptureBackend:
+    """화면 캡처 백엔드 기본 클래스 - grab()은 BGR 이미지를 반환"""
+    
+    name = 'base'
+    
+    def grab(self, region: Optional[Tuple[int, int, int, int]] = None) -> Optional[np.ndarray]:
+        """지정 영역 캡처 (region이 None이면 전체 화면)"""
+        raise NotImplementedError
+    
+    def close(self):
+        """백엔드 자원 정리"""
+        pass
+
+class PyAutoGUICaptureBackend(CaptureBackend):
+    """pyautogui 기반 캡처 (기존 방식, 최종 대체 경로)"""
+    
+    name = 'pyautogui'
+    
+    def __init__(self):
+        if not PYAUTOGUI_AVAILABLE:
+            raise RuntimeError("pyautogui가 설치되지 않았습니다.")
+    
+    def grab(self, region: Optional[Tuple[int, int, int, int]] = None) -> Optional[np.ndarray]:
+        if region:
+            x, y, w, h = region
+            screenshot = pyautogui.screenshot(region=(x, y, w, h))
+        else:
+            screenshot = pyautogui.screenshot()
+        
+        # PIL Image를 OpenCV 형식으로 변환
+        img_array = np.array(screenshot)
+        return cv2.cvtColor(img_array, cv2.COLOR_RGB2BGR)
+
+class MSSCaptureBackend(CaptureBackend):
+    """mss 기반 고속 캡처 - 캡처 컨텍스트와 출력 버퍼 재사용"""
+    
+    name = 'mss'
+    
+    def __init__(self):
+        if not MSS_AVAILABLE:
+            raise RuntimeError("mss가 설치되지 않았습니다.")
+        # mss 인스턴스는 생성한 스레드에서만 사용해야 하므로 스레드별로 유지
+        self._local = threading.local()
+        self._buffer = None
+    
+    def _get_grabber(self):
+        """현재 스레드의 캡처 컨텍스트 반환 (최초 1회 생성, X11에서는 XShm 사용)"""
+        grabber = getattr(self._local, 'grabber', None)
+        if grabber is None:
+            grabber = mss.mss()
+            self._local.grabber = grabber
+        return grabber
+    
+    def grab(self, region: Optional[Tuple[int, int, int, int]] = None) -> Optional[np.ndarray]:
+        grabber = self._get_grabber()
+        if region:
+            x, y, w, h = region
+            monitor = {'left': int(x), 'top': int(y), 'width': int(w), 'height': int(h)}
+        else:
+            monitor = grabber.monitors[1]
+        
+        shot = grabber.grab(monitor)
+        
+        # BGRA 원본 버퍼를 복사 없이 감싼 뒤 BGR 출력 버퍼에 한 번만 변환
+        bgra = np.frombuffer(shot.raw, dtype=np.uint8).reshape(shot.height, shot.width, 4)
+        if self._buffer is None or self._buffer.shape[:2] != (shot.height, shot.width):
+            self._buffer = np.empty((shot.height, shot.width, 3), dtype=np.uint8)
+        cv2.cvtColor(bgra, cv2.COLOR_BGRA2BGR, dst=self._buffer)
+        return self._buffer
+    
+    def close(self):
+        grabber = getattr(self._local, 'grabber', None)
+        if grabber is not None:
+            grabber.close()
+            self._local.grabber = None
+
+class FileCaptureBackend(CaptureBackend):
+    """이미지 파일/폴더 기반 캡처 (테스트 및 재현용) - 파일을 순서대로 반복 재생"""
+    
+    name = 'file'
+    image_extensions = ('.png', '.jpg', '.jpeg', '.bmp')
+    
+    def __init__(self, source: str):
+        if not source or not os.path.exists(source):
+            raise RuntimeError(f"캡처 소스를 찾을 수 없습니다: {source}")
+        
+        if os.path.isdir(source):
+            paths = sorted(
+                os.path.join(source, name) for name in os.listdir(source)
+                if name.lower().endswith(self.image_extensions)
+            )
+        else:
+            paths = [source]
+        
+        self.frames = [frame for frame in (cv2.imread(path, cv2.IMREAD_COLOR) for path in paths) if frame is not None]
+        if not self.frames:
+            raise RuntimeError(f"읽을 수 있는 이미지가 없습니다: {source}")
+        self.index = 0
+    
+    def grab(self, region: Optional[Tuple[int, int, int, int]] = None) -> Optional[np.ndarray]:
+        frame = self.frames[self.index % len(self.frames)]
+        self.index += 1
+        if region:
+            # 파일 이미지를 화면 전체로 보고 영역을 잘라냄 (복사 없는 뷰)
+            x, y, w, h = region
+            return frame[y:y + h, x:x + w]
+        return frame
+
+class SyntheticCaptureBackend(CaptureBackend):
+    """합성 프레임 캡처 (테스트용) - change_every 프레임마다 내용 변경"""
+    
+    name = 'synthetic'
+    
+    def __init__(self, change_every: int = 10, noise: int = 0, seed: int = 0):
+        self.change_every = max(1, change_every)
+        self.noise = noise
+        self.rng = np.random.default_rng(seed)
+        self.frame_index = 0
+        self.state = 0
+        self._frame = None
+    
+    def _render(self, height: int, width: int):
+        """현재 상태에 맞는 대기열 모양 프레임 생성 (상태마다 행이 하나씩 늘어남)"""
+        frame = np.full((height, width, 3), 255, dtype=np.uint8)
+        row_height = max(4, height // 8)
+        for row in range(self.state % 8):
+            top = row * row_height
+            frame[top + 1:top + row_height - 1, 2:width - 2] = (60, 60, 60)
+        return frame
+    
+    def grab(self, region: Optional[Tuple[int, int, int, int]] = None) -> Optional[np.ndarray]:
+        width, height = (region[2], region[3]) if region else (640, 480)
+        
+        if self.frame_index > 0 and self.frame_index % self.change_every == 0:
+            self.state += 1
+            self._frame = None
+        self.frame_index += 1
+        
+        if self._frame is None or self._frame.shape[:2] != (height, width):
+            self._frame = self._render(height, width)
+        
+        if self.noise:
+            noise = self.rng.integers(-self.noise, self.noise + 1, self._frame.shape, dtype=np.int16)
+            return np.clip(self._frame.astype(np.int16) + noise, 0, 255).astype(np.uint8)
+        return self._frame
+
+class FrameRecorder:
+    """캡처 프레임 링 녹화 - 크기가 고정된 메모리 매핑 파일에 타임스탬프와 함께 기록
+    
+    파일 구조: 헤더(64바이트) + 슬롯 N개 [타임스탬프(float64) + 프레임 원본 바이트].
+    슬롯이 모두 차면 가장 오래된 슬롯부터 덮어쓰므로 파일 크기는 max_bytes를 넘지 않습니다.
+    다시 시작할 때 기존 파일의 프레임 크기/원점/슬롯 구성이 같으면 이어서 기록하고, 다르면
+    기존 파일을 시각이 붙은 이름으로 옮겨 둔 뒤 새로 만듭니다 (놓친 알림 재현용 프레임 보존).
+    """
+    
+    MAGIC = b'PQMREC01'
+    HEADER_FORMAT = '<8sIIIIIQii'   # magic, 가로, 세로, 채널, 슬롯 수, 슬롯 크기, 기록 수, 원점 x, y
+    HEADER_SIZE = 64
+    TIMESTAMP_SIZE = 8
+    
+    def __init__(self, path: str, max_bytes: int):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.file = None
+        self.mm = None
+        self.shape = None
+        self.slot_count = 0
+        self.slot_size = 0
+        self.write_count = 0
+        self.origin = (0, 0)
+    
+    def _open(self, shape: tuple, origin: Tuple[int, int]):
+        """프레임 크기에 맞는 링 파일 열기 (구성이 같은 기존 파일은 이어서 기록)"""
+        self.close()
+        height, width = shape[:2]
+        channels = shape[2] if len(shape) == 3 else 1
+        frame_bytes = height * width * channels
+        # 다음 슬롯의 타임스탬프가 8바이트 정렬되도록 슬롯 크기 정렬
+        self.slot_size = (self.TIMESTAMP_SIZE + frame_bytes + 7) // 8 * 8
+        self.slot_count = max(1, (self.max_bytes - self.HEADER_SIZE) // self.slot_size)
+        self.shape = shape
+        self.origin = origin
+        self.write_count = 0
+        file_size = self.HEADER_SIZE + self.slot_count * self.slot_size
+        
+        header = self.read_header(self.path)
+        if header is not None and header[1:6] == (width, height, channels, self.slot_count, self.slot_size) \
+                and header[7:9] == origin and os.path.getsize(self.path) == file_size:
+            self.write_count = header[6]
+            self.file = open(self.path, 'r+b')
+            self.mm = mmap.mmap(self.file.fileno(), 0)
+            logger.info(f"🎞️ 프레임 녹화 이어서 기록: {self.path} (기존 {min(self.write_count, self.slot_count)}프레임)")
+            return
+        
+        if os.path.exists(self.path):
+            self.rotate_existing()
+        
+        self.file = open(self.path, 'w+b')
+        self.file.truncate(file_size)
+        self.mm = mmap.mmap(self.file.fileno(), 0)
+        self._write_header()
+        logger.info(f"🎞️ 프레임 녹화 시작: {self.path} ({width}x{height}, 최대 {self.slot_count}프레임)")
+    
+    @classmethod
+    def read_header(cls, path: str) -> Optional[tuple]:
+        """녹화 파일 헤더 (파일이 없거나 형식이 다르면 None)"""
+        try:
+            with open(path, 'rb') as f:
+                data = f.read(cls.HEADER_SIZE)
+            header = struct.unpack_from(cls.HEADER_FORMAT, data, 0)
+        except (OSError, struct.error):
+            return None
+        return header if header[0] == cls.MAGIC else None
+    
+    def rotate_existing(self):
+        """구성이 다른 기존 녹화 파일을 덮어쓰지 않고 시각이 붙은 이름으로 옮김"""
+        base, ext = os.path.splitext(self.path)
+        rotated = f"{base}_{datetime.now().strftime('%Y%m%d_%H%M%S')}{ext}"
+        suffix = 1
+        while os.path.exists(rotated):
+            rotated = f"{base}_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{suffix}{ext}"
+            suffix += 1
+        os.replace(self.path, rotated)
+        logger.info(f"🎞️ 이전 녹화 파일 보관: {rotated}")
+    
+    def _write_header(self):
+        height, width = self.shape[:2]
+        channels = self.shape[2] if len(self.shape) == 3 else 1
+        struct.pack_into(self.HEADER_FORMAT, self.mm, 0, self.MAGIC, width, height, channels,
+                         self.slot_count, self.slot_size, self.write_count, self.origin[0], self.origin[1])
+    
+    def record(self, frame: np.ndarray, origin: Tuple[int, int] = (0, 0), timestamp: float = None):
+        """프레임 한 장 기록 (크기가 바뀌면 파일을 새로 시작)"""
+        try:
+            if self.mm is None or frame.shape != self.shape or tuple(origin) != self.origin:
+                self._open(frame.shape, tuple(origin))
+            
+            offset = self.HEADER_SIZE + (self.write_count % self.slot_count) * self.slot_size
+            struct.pack_into('<d', self.mm, offset, timestamp if timestamp is not None else time.time())
+            slot = np.ndarray(self.shape, dtype=np.uint8, buffer=self.mm, offset=offset + self.TIMESTAMP_SIZE)
+            np.copyto(slot, frame)
+            
+            # 프레임을 다 쓴 뒤 기록 수를 올려 중간에 종료되어도 파일이 일관되게 유지
+            self.write_count += 1
+            self._write_header()
+        except Exception as e:
+            logger.error(f"프레임 녹화 실패: {e}")
+            self.close()
+    
+    def close(self):
+        """녹화 파일 닫기"""
+        if self.mm is not None:
+            self.mm.flush()
+            self.mm.close()
+            self.mm = None
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+class FrameReplaySource(CaptureBackend):
+    """FrameRecorder 녹화 파일 재생 - 실제 시간 간격 또는 최대 속도로 프레임 공급"""
+    
+    name = 'replay'
+    
+    def __init__(self, path: str, realtime: bool = True):
+        if not path or not os.path.exists(path):
+            raise RuntimeError(f"녹화 파일을 찾을 수 없습니다: {path}")
+        
+        self.realtime = realtime
+        self.file = open(path, 'rb')
+        self.mm = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, width, height, channels, self.slot_count, self.slot_size,
+         write_count, origin_x, origin_y) = struct.unpack_from(FrameRecorder.HEADER_FORMAT, self.mm, 0)
+        if magic != FrameRecorder.MAGIC:
+            self.close()
+            raise RuntimeError(f"녹화 파일 형식이 아닙니다: {path}")
+        
+        self.shape = (height, width, channels) if channels > 1 else (height, width)
+        self.origin = (origin_x, origin_y)
+        self.frame_count = min(write_count, self.slot_count)
+        # 링이 한 바퀴 이상 돌았으면 가장 오래된 슬롯부터 재생
+        self.first_slot = write_count % self.slot_count if write_count > self.slot_count else 0
+        self.position = 0
+        self.replay_start = None
+        self.first_timestamp = None
+    
+    def __len__(self):
+        return self.frame_count
+    
+    def read_frame(self, index: int) -> Tuple[float, np.ndarray]:
+        """index번째(오래된 순) 프레임과 타임스탬프 반환 (파일 매핑 뷰, 복사 없음)"""
+        offset = FrameRecorder.HEADER_SIZE + ((self.first_slot + index) % self.slot_count) * self.slot_size
+        timestamp = struct.unpack_from('<d', self.mm, offset)[0]
+        frame = np.ndarray(self.shape, dtype=np.uint8, buffer=self.mm, offset=offset + FrameRecorder.TIMESTAMP_SIZE)
+        return timestamp, frame
+    
+    def iter_frames(self):
+        """남은 프레임을 (타임스탬프, 프레임)으로 순서대로 반환"""
+        while True:
+            item = self.next_frame()
+            if item is None:
+                return
+            yield item
+    
+    def next_frame(self) -> Optional[Tuple[float, np.ndarray]]:
+        """다음 프레임 반환 (실시간 모드에서는 녹화 당시 간격만큼 대기)"""
+        if self.position >= self.frame_count:
+            return None
+        
+        timestamp, frame = self.read_frame(self.position)
+        self.position += 1
+        
+        if self.realtime:
+            if self.replay_start is None:
+                self.replay_start = time.monotonic()
+                self.first_timestamp = timestamp
+            delay = (timestamp - self.first_timestamp) - (time.monotonic() - self.replay_start)
+            if delay > 0:
+                time.sleep(delay)
+        return timestamp, frame
+    
+    def grab(self, region: Optional[Tuple[int, int, int, int]] = None) -> Optional[np.ndarray]:
+        item = self.next_frame()
+        if item is None:
+            return None
+        frame = item[1]
+        
+        if region:
+            # 녹화 영역 안에 있는 영역이면 해당 부분만 잘라냄
+            x, y, w, h = region
+            left, top = x - self.origin[0], y - self.origin[1]
+            if left >= 0 and top >= 0 and left + w <= frame.shape[1] and top + h <= frame.shape[0]:
+                return frame[top:top + h, left:left + w]
+        return frame
+    
+    def close(self):
+        if self.mm is not None:
+            self.mm.close()
+            self.mm = None
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+# 설정 이름 → 백엔드 생성 함수
+CAPTURE_BACKENDS = {
+    'mss': lambda config: MSSCaptureBackend(),
+    'pyautogui': lambda config: PyAutoGUICaptureBackend(),
+    'file': lambda config: FileCaptureBackend(config.get('capture_source')),
+    'synthetic': lambda config: SyntheticCaptureBackend(),
+    'replay': lambda config: FrameReplaySource(config.get('capture_source'), config.get('replay_realtime', True)),
+}
+
+def create_capture_backend(config: dict) -> Optional[CaptureBackend]:
+    """설정에 맞는 캡처 백엔드 생성 (실패 시 mss → pyautogui 순으로 대체)"""
+    requested = config.get('capture_backend', 'auto') or 'auto'
+    
+    candidates = ['mss', 'pyautogui'] if requested == 'auto' else [requested, 'mss', 'pyautogui']
+    for name in dict.fromkeys(candidates):
+        factory = CAPTURE_BACKENDS.get(name)
+        if factory is None:
+            logger.warning(f"알 수 없는 캡처 백엔드: {name}")
+            continue
+        try:
+            backend = factory(config)
+            logger.info(f"캡처 백엔드: {backend.name}")
+            return backend
+        except Exception as e:
+            logger.warning(f"캡처 백엔드 '{name}' 사용 불가: {e}")
+    
+    logger.error("사용 가능한 캡처 백엔드가 없습니다.")
+    return None
+
 class ScreenCapture:
     """화면 캡처 클래스"""
     
     def __init__(self, config_manager: ConfigManager):
         self.config = config_manager
+        self.backend = None
+    
+    def get_backend(self) -> Optional[CaptureBackend]:
+        """캡처 백엔드 반환 (최초 호출 시 생성)"""
+        if self.backend is None:
+            self.backend = create_capture_backend(self.config.config)
+        return self.backend
         
     def capture_region(self, region: Optional[Tuple[int, int, int, int]] = None) -> Optional[np.ndarray]:
-        """지정 영역 화면 캡처"""
+        """지정 영역 화면 캡처
+        
+        고속 백엔드는 내부 버퍼를 재사용하므로 반환된 이미지는 다음 캡처 전까지만 유효합니다.
+        """
         try:
-            if not PYAUTOGUI_AVAILABLE:
-                logger.error("pyautogui가 설치되지 않았습니다.")
+            backend = self.get_backend()
+            if backend is None:
                 return None
             
-            if region:
-                x, y, w, h = region
-                screenshot = pyautogui.screenshot(region=(x, y, w, h))
-            else:
-                screenshot = pyautogui.screenshot()
-            
-            # PIL Image를 OpenCV 형식으로 변환
-            img_array = np.array(screenshot)
-            img_bgr = cv2.cvtColor(img_array, cv2.COLOR_RGB2BGR)
-            
-            return img_bgr
+            return backend.grab(region)
             
         except Exception as e:
             logger.error(f"화면 캡처 실패: {e}")
+            # 고속 백엔드 오류 시 pyautogui로 대체
+            if self.backend is not None and self.backend.name == 'mss' and PYAUTOGUI_AVAILABLE:
+                logger.warning("캡처 백엔드를 pyautogui로 전환합니다.")
+                self.close()
+                self.backend = PyAutoGUICaptureBackend()
             return None
     
+    def close(self):
+        """캡처 백엔드 정리"""
+        if self.backend is not None:
+            try:
+                self.backend.close()
+            except Exception as e:
+                logger.debug(f"캡처 백엔드 정리 실패: {e}")
+            self.backend = None
+    
     # 자동 영역 탐지 기능 주석 처리 (요청사항 #1)
     """
     def auto_detect_region(self, template_text: str = "대기") -> Optional[Tuple[int, int, int, int]]:
@@ -420,47 +1239,560 @@ class ScreenCapture:
             return None
     """
 
+class DebugArtifactWriter:
+    """디버그 이미지 백그라운드 저장기 - 감지 루프는 큐에 넣기만 하고 저장은 별도 스레드에서 수행
+    
+    큐가 가득 차면 가장 오래된 이미지를 버리고, 저장 폴더는 시각이 붙은 파일로 채우되
+    debug_max_mb를 넘으면 오래된 파일부터 지웁니다.
+    """
+    
+    MAX_QUEUE = 16
+    
+    def __init__(self, config_manager: ConfigManager):
+        self.config = config_manager
+        self.pending = collections.deque(maxlen=self.MAX_QUEUE)
+        self.condition = threading.Condition()
+        self.thread = None
+        self.files = collections.deque()
+        self.total_bytes = 0
+        self.dropped_count = 0
+        self.written_count = 0
+    
+    def submit(self, name: str, image: np.ndarray):
+        """이미지 저장 요청 (버퍼가 재사용되므로 복사본을 큐에 넣음)"""
+        with self.condition:
+            if len(self.pending) == self.pending.maxlen:
+                self.dropped_count += 1
+            self.pending.append((name, datetime.now(), image.copy()))
+            
+            if self.thread is None:
+                self._scan_existing_files()
+                self.thread = threading.Thread(target=self._run, name="DebugArtifactWriter", daemon=True)
+                self.thread.start()
+            self.condition.notify()
+    
+    def _scan_existing_files(self):
+        """이전 실행에서 남은 디버그 이미지도 용량 한도에 포함"""
+        debug_dir = self.config.config.get('debug_dir', 'debug_images')
+        try:
+            os.makedirs(debug_dir, exist_ok=True)
+            entries = [os.path.join(debug_dir, name) for name in os.listdir(debug_dir) if name.endswith('.png')]
+            for path in sorted(entries, key=os.path.getmtime):
+                size = os.path.getsize(path)
+                self.files.append((path, size))
+                self.total_bytes += size
+        except Exception as e:
+            logger.error(f"디버그 폴더 확인 실패: {e}")
+    
+    def _run(self):
+        """저장 스레드 - 큐에서 꺼내 PNG로 저장하고 용량 한도 유지"""
+        while True:
+            with self.condition:
+                while not self.pending:
+                    self.condition.wait()
+                name, timestamp, image = self.pending.popleft()
+            
+            try:
+                self._write(name, timestamp, image)
+            except Exception as e:
+                logger.error(f"디버그 이미지 저장 실패: {e}")
+    
+    def _write(self, name: str, timestamp: datetime, image: np.ndarray):
+        debug_dir = self.config.config.get('debug_dir', 'debug_images')
+        os.makedirs(debug_dir, exist_ok=True)
+        path = os.path.join(debug_dir, f"debug_{name}_{timestamp.strftime('%Y%m%d_%H%M%S_%f')}.png")
+        
+        compression = int(self.config.config.get('debug_png_compression', 1))
+        ok, encoded = cv2.imencode('.png', image, [cv2.IMWRITE_PNG_COMPRESSION, max(0, min(9, compression))])
+        if not ok:
+            raise RuntimeError("PNG 인코딩 실패")
+        # cv2.imwrite는 Windows에서 한글 경로를 처리하지 못하므로 직접 기록
+        with open(path, 'wb') as f:
+            f.write(encoded.tobytes())
+        
+        self.files.append((path, len(encoded)))
+        self.total_bytes += len(encoded)
+        self.written_count += 1
+        
+        budget = float(self.config.config.get('debug_max_mb', 50)) * 1024 * 1024
+        while self.total_bytes > budget and len(self.files) > 1:
+            old_path, old_size = self.files.popleft()
+            self.total_bytes -= old_size
+            try:
+                os.remove(old_path)
+            except OSError:
+                pass
+
+_debug_writer = None
+_debug_writer_lock = threading.Lock()
+
+def get_debug_writer(config_manager: ConfigManager) -> DebugArtifactWriter:
+    """모든 감지기가 공유하는 디버그 이미지 저장기 반환"""
+    global _debug_writer
+    with _debug_writer_lock:
+        if _debug_writer is None:
+            _debug_writer = DebugArtifactWriter(config_manager)
+        return _debug_writer
+
+def compute_phash(image: np.ndarray) -> int:
+    """64비트 지각 해시 (32x32로 축소한 뒤 DCT 저주파 8x8 계수를 중앙값과 비교)"""
+    if len(image.shape) == 3:
+        image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    small = cv2.resize(image, (32, 32), interpolation=cv2.INTER_AREA).astype(np.float32)
+    low = cv2.dct(small)[:8, :8].flatten()
+    # 직류 성분(평균 밝기)은 중앙값 계산에서 제외
+    bits = low > np.median(low[1:])
+    return int.from_bytes(np.packbits(bits).tobytes(), 'big')
+
+def hamming_distance(a: int, b: int) -> int:
+    """두 해시의 다른 비트 수"""
+    return bin(a ^ b).count('1')
+
+class KnownStateCache:
+    """최근에 본 안정 상태의 LRU 캐시 - 지각 해시 → (동작, 처음 변화했을 때의 변화 정보)
+    
+    동작은 'alert'(알림) 또는 'ignore'(무시)이며, 넘칠 때는 무시 상태보다 알림 상태를 먼저 지웁니다.
+    모니터링 스레드와 GUI 스레드가 함께 쓰므로 잠금으로 보호합니다.
+    """
+    
+    ACTIONS = ('alert', 'ignore')
+    
+    def __init__(self, capacity: int = 64, ignored: Optional[List[int]] = None):
+        self.capacity = max(1, int(capacity))
+        self.states = collections.OrderedDict()
+        self.lock = threading.Lock()
+        for state_hash in ignored or []:
+            self.states[state_hash] = ('ignore', {})
+    
+    def __len__(self) -> int:
+        return len(self.states)
+    
+    def lookup(self, state_hash: int) -> Optional[Tuple[str, dict]]:
+        """알려진 상태면 (동작, 변화 정보), 아니면 None"""
+        with self.lock:
+            entry = self.states.get(state_hash)
+            if entry is not None:
+                self.states.move_to_end(state_hash)
+            return entry
+    
+    def remember(self, state_hash: int, info: Optional[dict] = None):
+        """안정 상태를 알림 상태로 기록 (이미 무시로 지정한 상태는 그대로 유지)"""
+        with self.lock:
+            entry = self.states.get(state_hash)
+            if entry is not None and entry[0] == 'ignore':
+                self.states.move_to_end(state_hash)
+                return
+            self.states[state_hash] = ('alert', dict(info or {}))
+            self.states.move_to_end(state_hash)
+            self._evict()
+    
+    def mark(self, state_hash: int, action: str):
+        """상태의 동작 지정 ('alert' 또는 'ignore')"""
+        if action not in self.ACTIONS:
+            raise ValueError(f"알 수 없는 상태 동작: {action}")
+        with self.lock:
+            _, info = self.states.get(state_hash, (None, {}))
+            self.states[state_hash] = (action, info)
+            self.states.move_to_end(state_hash)
+            self._evict()
+    
+    def _evict(self):
+        while len(self.states) > self.capacity:
+            victim = next((state_hash for state_hash, (action, _) in self.states.items() if action == 'alert'), None)
+            if victim is None:
+                victim = next(iter(self.states))
+            del self.states[victim]
+
+def parse_state_hashes(values) -> List[int]:
+    """설정 파일의 16진수 상태 해시 목록을 정수로 변환 (잘못된 값은 건너뜀)"""
+    hashes = []
+    for value in values or []:
+        try:
+            hashes.append(int(value, 16))
+        except (TypeError, ValueError):
+            logger.warning(f"잘못된 상태 해시 무시: {value!r}")
+    return hashes
+
+def get_ignored_states(config: dict, label: Optional[str]) -> List[int]:
+    """영역 라벨에 등록된 무시 상태 해시 (예전 목록 형식은 모든 영역에 적용)"""
+    ignored = config.get('ignored_states') or {}
+    if isinstance(ignored, dict):
+        return parse_state_hashes(ignored.get(label)) if label is not None else []
+    return parse_state_hashes(ignored)
+
+class ChangeEngine:
+    """변화 감지 엔진 기본 클래스 - 전처리된 두 이미지의 변화 픽셀 수 계산과 프레임당 비용 집계"""
+    
+    name = 'base'
+    
+    def __init__(self, detector: ImageChangeDetector):
+        self.detector = detector
+        self.frames = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.recent = collections.deque(maxlen=256)
+        # 디버그 모드에서 저장할 중간 이미지 (이름 → 이미지)
+        self.last_debug_images = {}
+    
+    def compare(self, prev_img: np.ndarray, curr_img: np.ndarray) -> Tuple[int, dict]:
+        """(감지 해상도 기준 변화 픽셀 수, 추가 정보) 반환"""
+        raise NotImplementedError
+    
+    def run(self, prev_img: np.ndarray, curr_img: np.ndarray) -> Tuple[int, dict]:
+        """비교 실행 및 소요 시간 기록"""
+        started_at = time.perf_counter()
+        result = self.compare(prev_img, curr_img)
+        elapsed = time.perf_counter() - started_at
+        self.frames += 1
+        self.total_seconds += elapsed
+        self.max_seconds = max(self.max_seconds, elapsed)
+        self.recent.append(elapsed)
+        return result
+    
+    def get_cost_state(self) -> tuple:
+        """비용 집계 원자료 (파이프라인 작업 프로세스에서 부모로 전달)"""
+        return self.frames, self.total_seconds, self.max_seconds, list(self.recent)
+    
+    def set_cost_state(self, state: tuple):
+        """get_cost_state로 받은 비용 집계로 교체"""
+        self.frames, self.total_seconds, self.max_seconds, recent = state
+        self.recent.clear()
+        self.recent.extend(recent)
+    
+    def get_cost_stats(self) -> dict:
+        """프레임당 비교 비용 (최근 256프레임 백분위수 포함)"""
+        values = sorted(self.recent)
+        last = len(values) - 1
+        return {
+            'engine': self.name,
+            'frames': self.frames,
+            'mean_ms': self.total_seconds * 1000.0 / self.frames if self.frames else 0.0,
+            'p50_ms': values[int(last * 0.5)] * 1000.0 if values else 0.0,
+            'p99_ms': values[int(last * 0.99)] * 1000.0 if values else 0.0,
+            'max_ms': self.max_seconds * 1000.0,
+        }
+
+class AbsDiffEngine(ChangeEngine):
+    """픽셀 절대 차이 엔진 - 밝기 차이가 임계값 이상인 픽셀 수 (기본)"""
+    
+    name = 'absdiff'
+    PIXEL_THRESHOLD = 30  # 0-255 범위에서 30 이상 차이만 인정
+    
+    def compare(self, prev_img: np.ndarray, curr_img: np.ndarray) -> Tuple[int, dict]:
+        detector = self.detector
+        diff_dst = thresh_dst = None
+        if detector.reuse_buffers:
+            diff_dst = detector._get_buffer('diff', prev_img.shape)
+            thresh_dst = detector._get_buffer('thresh', prev_img.shape)
+        
+        # 절대 차이 계산 후 임계값 적용 (작은 변화 제거)
+        diff = cv2.absdiff(prev_img, curr_img, dst=diff_dst)
+        _, thresh = cv2.threshold(diff, self.PIXEL_THRESHOLD, 255, cv2.THRESH_BINARY, dst=thresh_dst)
+        
+        self.last_debug_images = {'diff': diff, 'thresh': thresh}
+        return detector.count_changed_pixels(thresh)
+
+class SSIMEngine(ChangeEngine):
+    """구조적 유사도 엔진 - 박스 필터 평균으로 구한 국소 SSIM이 기준 미만인 픽셀 수
+    
+    밝기 차이보다 글자/테두리 같은 구조 변화에 반응하므로 전체 밝기나 대비가 조금 바뀌어도 둔감합니다.
+    모든 중간 결과는 영구 float32 버퍼에서 제자리 연산합니다.
+    """
+    
+    name = 'ssim'
+    WINDOW = 7
+    CHANGE_LEVEL = 0.8   # 국소 SSIM이 이 값 미만이면 변화 픽셀
+    C1 = (0.01 * 255) ** 2
+    C2 = (0.03 * 255) ** 2
+    
+    def compare(self, prev_img: np.ndarray, curr_img: np.ndarray) -> Tuple[int, dict]:
+        detector = self.detector
+        shape = prev_img.shape
+        ksize = (self.WINDOW, self.WINDOW)
+        
+        def buffer(name):
+            return detector._get_buffer(f'ssim_{name}', shape, np.float32)
+        
+        x = buffer('x')
+        y = buffer('y')
+        np.copyto(x, prev_img, casting='unsafe')
+        np.copyto(y, curr_img, casting='unsafe')
+        
+        mu_x = cv2.boxFilter(x, -1, ksize, dst=buffer('mu_x'))
+        mu_y = cv2.boxFilter(y, -1, ksize, dst=buffer('mu_y'))
+        sigma_xy = cv2.boxFilter(cv2.multiply(x, y, dst=buffer('xy')), -1, ksize, dst=buffer('sigma_xy'))
+        sigma_x = cv2.boxFilter(cv2.multiply(x, x, dst=x), -1, ksize, dst=buffer('sigma_x'))
+        sigma_y = cv2.boxFilter(cv2.multiply(y, y, dst=y), -1, ksize, dst=buffer('sigma_y'))
+        
+        # 분산/공분산 = E[xy] - E[x]E[y]
+        mu_xy = cv2.multiply(mu_x, mu_y, dst=buffer('mu_xy'))
+        cv2.multiply(mu_x, mu_x, dst=mu_x)
+        cv2.multiply(mu_y, mu_y, dst=mu_y)
+        cv2.subtract(sigma_x, mu_x, dst=sigma_x)
+        cv2.subtract(sigma_y, mu_y, dst=sigma_y)
+        cv2.subtract(sigma_xy, mu_xy, dst=sigma_xy)
+        
+        # 분자 (2 mu_x mu_y + C1)(2 sigma_xy + C2) → mu_xy, 분모 (mu_x^2 + mu_y^2 + C1)(sigma_x + sigma_y + C2) → mu_x
+        mu_xy *= 2
+        mu_xy += self.C1
+        sigma_xy *= 2
+        sigma_xy += self.C2
+        mu_xy *= sigma_xy
+        mu_x += mu_y
+        mu_x += self.C1
+        sigma_x += sigma_y
+        sigma_x += self.C2
+        mu_x *= sigma_x
+        ssim_map = cv2.divide(mu_xy, mu_x, dst=x)
+        
+        mask = cv2.compare(ssim_map, self.CHANGE_LEVEL, cv2.CMP_LT,
+                           dst=detector._get_buffer('ssim_mask', shape))
+        changed_pixels, info = detector.count_changed_pixels(mask)
+        info['similarity'] = float(cv2.mean(ssim_map)[0])
+        
+        self.last_debug_images = {'ssim_mask': mask}
+        return changed_pixels, info
+
+class HistogramEngine(ChangeEngine):
+    """히스토그램 거리 엔진 - 타일별 밝기 히스토그램에서 다른 구간으로 옮겨 간 픽셀 수
+    
+    전처리에서 전체 히스토그램을 평활화하므로 타일 단위로 비교합니다 (tile_grid가 없으면 4x4).
+    픽셀 위치 이동에는 둔감하고 새 행처럼 밝기 분포가 바뀌는 변화에 반응합니다.
+    """
+    
+    name = 'histogram'
+    BINS = 32
+    DEFAULT_GRID = (4, 4)
+    
+    def compare(self, prev_img: np.ndarray, curr_img: np.ndarray) -> Tuple[int, dict]:
+        detector = self.detector
+        height, width = prev_img.shape[:2]
+        rows, cols = detector.tile_grid or self.DEFAULT_GRID
+        rows = min(rows, height)
+        cols = min(cols, width)
+        row_edges = list(detector._tile_edges('row_edges', height, rows)) + [height]
+        col_edges = list(detector._tile_edges('col_edges', width, cols)) + [width]
+        
+        changed_pixels = 0
+        tiles = []
+        for row in range(rows):
+            for col in range(cols):
+                tile = (slice(row_edges[row], row_edges[row + 1]), slice(col_edges[col], col_edges[col + 1]))
+                prev_hist = cv2.calcHist([prev_img[tile]], [0], None, [self.BINS], [0, 256])
+                curr_hist = cv2.calcHist([curr_img[tile]], [0], None, [self.BINS], [0, 256])
+                # 두 히스토그램의 L1 거리의 절반 = 다른 구간으로 옮겨 간 픽셀 수
+                moved = int(cv2.norm(prev_hist, curr_hist, cv2.NORM_L1)) // 2
+                changed_pixels += moved
+                if moved >= detector.detection_tile_min_pixels:
+                    tiles.append((row, col))
+        
+        info = {}
+        if detector.tile_grid:
+            info = {'changed_tiles': tiles, 'changed_rows': sorted({r for r, c in tiles})}
+        return changed_pixels, info
+
+class PerceptualHashEngine(ChangeEngine):
+    """지각 해시 엔진 - 64비트 DCT 해시의 해밍 거리 (가장 저렴, 화면 전체가 바뀌는 큰 변화용)
+    
+    변화 픽셀 수는 다른 비트 비율에 영역 픽셀 수를 곱한 추정값입니다.
+    """
+    
+    name = 'phash'
+    
+    def compare(self, prev_img: np.ndarray, curr_img: np.ndarray) -> Tuple[int, dict]:
+        distance = hamming_distance(compute_phash(prev_img), compute_phash(curr_img))
+        total_pixels = prev_img.shape[0] * prev_img.shape[1]
+        return int(total_pixels * distance / 64), {'hash_distance': distance}
+
+# 감지 엔진 등록표 (설정의 detector_engine 값 → 엔진 클래스)
+DETECTOR_ENGINES = {
+    'absdiff': AbsDiffEngine,
+    'ssim': SSIMEngine,
+    'histogram': HistogramEngine,
+    'phash': PerceptualHashEngine,
+}
+
+def create_detector_engine(detector: ImageChangeDetector) -> ChangeEngine:
+    """설정에 맞는 감지 엔진 생성 (알 수 없는 이름이면 absdiff)"""
+    name = detector.config.config.get('detector_engine', 'absdiff') or 'absdiff'
+    engine_cls = DETECTOR_ENGINES.get(name)
+    if engine_cls is None:
+        logger.warning(f"알 수 없는 감지 엔진 '{name}', absdiff를 사용합니다. (사용 가능: {', '.join(DETECTOR_ENGINES)})")
+        engine_cls = AbsDiffEngine
+    return engine_cls(detector)
+
 class ImageChangeDetector:
     """영역 변화 감지 클래스"""
     
-    def __init__(self, config_manager: ConfigManager):
+    def __init__(self, config_manager: ConfigManager, name: Optional[str] = None):
         self.config = config_manager
+        # 영역 이름 (디버그 파일 이름, 영역별 무시 상태 등에 사용)
+        self.name = name
         self.previous_image = None
         self.change_threshold = 0.05  # 5% 이상 변화 시 감지
         self.min_change_pixels = 100   # 최소 변화 픽셀 수
         
+        # 버퍼 재사용 모드: 프레임마다 새 배열을 만들지 않고 dst 버퍼에 덮어씀
+        self.reuse_buffers = self.config.config.get('reuse_buffers', True)
+        self._buffers = {}
+        
+        # 프레임 지문: 직전 원본 프레임과 동일하면 전처리/비교 생략
+        self.use_fingerprint = self.config.config.get('frame_fingerprint', True)
+        self.fingerprint_stride = max(1, int(self.config.config.get('fingerprint_stride', 1)))
+        # 간격 샘플 지문은 샘플하지 않은 픽셀의 변화를 놓칠 수 있으므로 N번 연속 생략 후에는 전체 비교
+        self.fingerprint_full_check = max(1, int(self.config.config.get('fingerprint_full_check', 10)))
+        self.fingerprint_streak = 0
+        self.last_fingerprint = None
+        self.fingerprint_checks = 0
+        self.fingerprint_hits = 0
+        
+        # 타일 격자 변화 위치 (마지막 calculate_change 결과)
+        tile_grid = self.config.config.get('tile_grid')
+        self.tile_grid = (max(1, int(tile_grid[0])), max(1, int(tile_grid[1]))) if tile_grid else None
+        self.tile_min_pixels = int(self.config.config.get('tile_min_pixels', 10))
+        self.last_change_info = None
+        
+        # 축소 감지: 전처리 전에 한 번만 축소하고, 픽셀 수와 변화 범위는 원본 해상도로 환산
+        self.detection_scale = min(1.0, max(0.05, float(self.config.config.get('detection_scale', 1.0) or 1.0)))
+        self.scale_factors = (1.0, 1.0)
+        
+        # 기준 모델: snapshot(변화 시점 이미지) 또는 running_average(지수 가중 이동 평균 배경)
+        self.baseline_mode = self.config.config.get('baseline_mode', 'snapshot')
+        self.background_alpha = min(1.0, max(0.001, float(self.config.config.get('background_alpha', 0.05))))
+        
+        # N프레임 연속 변화일 때만 알림 (한 프레임짜리 깜빡임 무시)
+        self.confirm_frames = max(1, int(self.config.config.get('confirm_frames', 1)))
+        self.confirm_ring = collections.deque(maxlen=self.confirm_frames)
+        self.suppressed_changes = 0
+        
+        # 변화량 계산 엔진 (detector_engine 설정)
+        self.engine = create_detector_engine(self)
+        
+        # 알려진 안정 상태 캐시: 전처리 이미지의 지각 해시로 무시 상태를 O(1)로 확인
+        # (꺼져 있어도 이 영역에 "현재 화면 상태 무시"로 등록한 상태가 있으면 사용)
+        self.known_states = None
+        ignored = get_ignored_states(self.config.config, name)
+        if self.config.config.get('known_state_cache', False) or ignored:
+            self.known_states = KnownStateCache(self.config.config.get('known_state_capacity', 64), ignored)
+        self.baseline_hash = None
+        self.known_state_hits = {'alert': 0, 'ignore': 0}
+        
+        # 단계별 소요 시간 기록 (PatientQueueMonitor가 연결)
+        self.metrics: Optional[CycleMetrics] = None
+    
+    def _get_buffer(self, name: str, shape: tuple, dtype=None) -> np.ndarray:
+        """이름별 영구 버퍼 반환 (크기가 바뀔 때만 새로 할당)"""
+        dtype = dtype or np.uint8
+        buffer = self._buffers.get(name)
+        if buffer is None or buffer.shape != shape or buffer.dtype != dtype:
+            buffer = np.empty(shape, dtype=dtype)
+            self._buffers[name] = buffer
+        return buffer
+    
+    def _next_output_buffer(self, shape: tuple) -> np.ndarray:
+        """전처리 결과용 이중 버퍼 중 기준 이미지가 아닌 쪽 반환"""
+        for name in ('frame_a', 'frame_b'):
+            buffer = self._get_buffer(name, shape)
+            if buffer is not self.previous_image:
+                return buffer
+        
+    def debug_name(self, kind: str) -> str:
+        """디버그 이미지 이름 (영역 이름이 있으면 앞에 붙임)"""
+        return f"{self.name}_{kind}" if self.name else kind
+    
+    def compute_fingerprint(self, image: np.ndarray) -> tuple:
+        """원본 캡처 이미지의 빠른 지문 (크기 + CRC32)"""
+        if self.fingerprint_stride > 1:
+            image = np.ascontiguousarray(image[::self.fingerprint_stride, ::self.fingerprint_stride])
+        
+        if image.flags.c_contiguous:
+            checksum = zlib.crc32(image)
+        else:
+            # 공통 캡처에서 잘라낸 뷰는 행 단위로만 연속이므로 행마다 누적 (복사 없음)
+            checksum = 0
+            for row in image:
+                checksum = zlib.crc32(row, checksum)
+        return (image.shape, checksum)
+    
+    def get_fingerprint_stats(self) -> dict:
+        """프레임 지문 적중 통계"""
+        hit_rate = self.fingerprint_hits / self.fingerprint_checks if self.fingerprint_checks else 0.0
+        return {
+            'checks': self.fingerprint_checks,
+            'hits': self.fingerprint_hits,
+            'hit_rate': hit_rate,
+        }
+    
     def detect_change(self, current_image: np.ndarray) -> bool:
         """이미지 변화 감지"""
         try:
             if current_image is None:
                 return False
             
+            # 직전 프레임과 바이트 단위로 같으면 결과도 같으므로 바로 "변화 없음"
+            # (변화 확인 대기 중에는 같은 프레임도 확인 횟수에 포함해야 하므로 생략하지 않음)
+            # fingerprint_stride > 1이면 지문이 같아도 프레임이 같다는 보장이 없으므로 주기적으로 전체 비교
+            if self.use_fingerprint:
+                fingerprint = self.compute_fingerprint(current_image)
+                self.fingerprint_checks += 1
+                if (fingerprint == self.last_fingerprint and self.previous_image is not None
+                        and not self.confirmation_pending
+                        and (self.fingerprint_stride == 1 or self.fingerprint_streak < self.fingerprint_full_check)):
+                    self.fingerprint_hits += 1
+                    self.fingerprint_streak += 1
+                    return False
+                self.fingerprint_streak = 0
+                self.last_fingerprint = fingerprint
+            
             # 전처리: 그레이스케일 변환 및 크기 정규화
+            stage_start = time.perf_counter()
             processed_current = self.preprocess_for_comparison(current_image)
+            if self.metrics is not None:
+                self.metrics.observe('preprocess', time.perf_counter() - stage_start)
+            
+            state_hash = compute_phash(processed_current) if self.known_states is not None else None
             
             # 첫 번째 실행 시 기준 이미지 저장
             if self.previous_image is None:
-                self.previous_image = processed_current.copy()
+                self.set_baseline(processed_current, state_hash)
                 logger.info("🔍 기준 이미지 설정 완료")
                 return False
             
+            # 기준과 다른 알려진 상태: 무시 상태면 비교 없이 "변화 없음", 알림 상태는 평소처럼 비교해 임계값 적용
+            # (기준과 해시가 같으면 숫자 하나만 바뀐 경우일 수 있으므로 항상 비교)
+            if state_hash is not None and state_hash != self.baseline_hash:
+                known = self.known_states.lookup(state_hash)
+                if known is not None and self.suppress_known_state(known):
+                    return False
+            
             # 이미지 크기가 다르면 리사이즈
             if processed_current.shape != self.previous_image.shape:
                 processed_current = cv2.resize(processed_current, 
                                              (self.previous_image.shape[1], self.previous_image.shape[0]))
             
             # 변화량 계산
-            change_detected = self.calculate_change(self.previous_image, processed_current)
+            stage_start = time.perf_counter()
+            frame_changed = self.calculate_change(self.previous_image, processed_current)
+            if self.metrics is not None:
+                self.metrics.observe('calculate', time.perf_counter() - stage_start)
+            
+            change_detected = self.confirm_change(frame_changed)
             
             # 변화 감지된 경우 기준 이미지 업데이트
             if change_detected:
+                # confirm_frames 확인을 통과한 변화만 기록 (확인 중 사라진 깜빡임은 기록하지 않음)
+                logger.info("✅ 변화 감지됨! 변화율: %.3f (임계값: %.3f)",
+                            self.last_change_info['change_ratio'], self.change_threshold)
                 logger.info("📸 변화 감지! 기준 이미지 업데이트")
-                self.previous_image = processed_current.copy()
+                self.set_baseline(processed_current, state_hash)
                 
                 # 디버그 모드에서 비교 이미지 저장
                 if self.config.config.get('debug_mode', False):
-                    cv2.imwrite('debug_change_detected.png', processed_current)
-                    logger.info("디버그: 변화 감지 시점 이미지 저장됨")
+                    get_debug_writer(self.config).submit(self.debug_name('change_detected'), processed_current)
+                    logger.info("디버그: 변화 감지 시점 이미지 저장 요청")
+            elif not frame_changed and self.baseline_mode == 'running_average':
+                # 변화가 없는 프레임만 배경에 섞어 서서히 바뀌는 화면(깜빡임, 밝기 변화)을 흡수
+                self.update_background(processed_current)
             
             return change_detected
             
@@ -468,9 +1800,127 @@ class ImageChangeDetector:
             logger.error(f"변화 감지 실패: {e}")
             return False
     
+    def detection_shape(self, shape: tuple) -> Tuple[int, int]:
+        """detection_scale을 적용한 감지 해상도 (세로, 가로)"""
+        if self.detection_scale >= 1.0:
+            return shape[0], shape[1]
+        return max(1, int(round(shape[0] * self.detection_scale))), max(1, int(round(shape[1] * self.detection_scale)))
+    
+    def downscale_for_detection(self, image: np.ndarray) -> np.ndarray:
+        """감지 해상도로 축소 (2배 단위 INTER_AREA 축소를 반복한 뒤 남은 비율만 한 번 더 축소)
+        
+        OpenCV의 INTER_AREA는 정확히 절반으로 줄일 때 가장 빠르므로 피라미드처럼 절반씩 줄입니다.
+        컬러 이미지도 먼저 줄인 뒤 그레이스케일로 바꾸므로 원본 해상도에서는 축소만 한 번 수행합니다.
+        """
+        height, width = image.shape[:2]
+        target_h, target_w = self.detection_shape((height, width))
+        self.scale_factors = (width / target_w, height / target_h)
+        if (target_h, target_w) == (height, width):
+            return image
+        
+        level = 0
+        while image.shape[0] // 2 >= target_h and image.shape[1] // 2 >= target_w:
+            half = (image.shape[0] // 2, image.shape[1] // 2) + image.shape[2:]
+            dst = self._get_buffer(f'pyramid_{level}', half) if self.reuse_buffers else None
+            image = cv2.resize(image, (half[1], half[0]), dst=dst, interpolation=cv2.INTER_AREA)
+            level += 1
+        
+        if image.shape[:2] != (target_h, target_w):
+            shape = (target_h, target_w) + image.shape[2:]
+            dst = self._get_buffer('scaled', shape) if self.reuse_buffers else None
+            image = cv2.resize(image, (target_w, target_h), dst=dst, interpolation=cv2.INTER_AREA)
+        return image
+    
+    @property
+    def confirmation_pending(self) -> bool:
+        """변화가 감지되어 연속 프레임 확인을 기다리는 중인지"""
+        return bool(self.confirm_ring)
+    
+    def confirm_change(self, frame_changed: bool) -> bool:
+        """confirm_frames 프레임 연속으로 변화가 있을 때만 변화로 확정
+        
+        확인 링에는 연속으로 변화한 프레임의 변화율만 담기며, 변화 없는 프레임이 오면 비웁니다.
+        """
+        if self.confirm_frames <= 1:
+            return frame_changed
+        
+        if not frame_changed:
+            if self.confirm_ring:
+                self.suppressed_changes += 1
+                self.confirm_ring.clear()
+            return False
+        
+        self.confirm_ring.append(self.last_change_info['change_ratio'])
+        if len(self.confirm_ring) < self.confirm_frames:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"변화 확인 대기 {len(self.confirm_ring)}/{self.confirm_frames}")
+            return False
+        
+        self.confirm_ring.clear()
+        return True
+    
+    def suppress_known_state(self, known: Tuple[str, dict]) -> bool:
+        """알려진 상태로 돌아온 프레임을 비교 없이 무시할지 (ignore 상태만 True)
+        
+        alert 상태는 재등장 횟수만 세고, 변화 여부는 평소처럼 비교해 민감도 임계값으로 판단합니다.
+        """
+        action, _ = known
+        self.known_state_hits[action] += 1
+        if action != 'ignore':
+            return False
+        # 툴팁/강조 표시 등: 기준을 그대로 두어 원래 화면으로 돌아와도 알림이 없음
+        self.confirm_ring.clear()
+        return True
+    
+    def ignore_state(self, state_hash: int):
+        """상태를 무시로 지정 (캐시가 꺼져 있었으면 이때 생성)"""
+        if self.known_states is None:
+            self.known_states = KnownStateCache(self.config.config.get('known_state_capacity', 64))
+        self.known_states.mark(state_hash, 'ignore')
+    
+    def state_hash(self, image: np.ndarray) -> int:
+        """원본 캡처 이미지를 감지와 같은 방식으로 전처리한 뒤의 지각 해시"""
+        return compute_phash(self.preprocess_for_comparison(image))
+    
+    def set_baseline(self, processed: np.ndarray, state_hash: Optional[int] = None):
+        """비교 기준 설정 (running_average 모드에서는 배경 모델도 현재 화면으로 초기화)"""
+        self.baseline_hash = state_hash
+        if state_hash is not None and self.known_states is not None:
+            self.known_states.remember(state_hash, self.last_change_info)
+        if self.baseline_mode == 'running_average':
+            # 배경은 미리 할당한 float32 버퍼에 누적하고, 비교용 uint8 버퍼로 변환해 둠
+            background = self._get_buffer('background', processed.shape, np.float32)
+            np.copyto(background, processed, casting='unsafe')
+            self.previous_image = self._get_buffer('background_u8', processed.shape)
+            np.copyto(self.previous_image, processed)
+        else:
+            # 버퍼 재사용 모드: 복사 대신 기준/작업 버퍼 교체
+            self.previous_image = processed if self.reuse_buffers else processed.copy()
+    
+    def update_background(self, processed: np.ndarray):
+        """배경 모델에 현재 프레임을 background_alpha 비율로 누적 (프레임당 고정 비용, 추가 할당 없음)"""
+        background = self._get_buffer('background', processed.shape, np.float32)
+        cv2.accumulateWeighted(processed, background, self.background_alpha)
+        cv2.convertScaleAbs(background, dst=self.previous_image)
+    
     def preprocess_for_comparison(self, image: np.ndarray) -> np.ndarray:
-        """비교용 이미지 전처리"""
+        """비교용 이미지 전처리
+        
+        버퍼 재사용 모드에서는 내부 버퍼를 반환하므로 다음 호출 이후 내용이 바뀔 수 있습니다.
+        """
         try:
+            # 축소 감지 모드에서는 블러/평활화/비교를 모두 축소된 이미지에서 수행
+            image = self.downscale_for_detection(image)
+            
+            if self.reuse_buffers:
+                shape = image.shape[:2]
+                if len(image.shape) == 3:
+                    gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY, dst=self._get_buffer('gray', shape))
+                else:
+                    gray = image
+                blurred = cv2.GaussianBlur(gray, (5, 5), 0, dst=self._get_buffer('blurred', shape))
+                return cv2.equalizeHist(blurred, dst=self._next_output_buffer(shape))
+            
             # 그레이스케일 변환
             if len(image.shape) == 3:
                 gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
@@ -490,37 +1940,43 @@ class ImageChangeDetector:
             return image
     
     def calculate_change(self, prev_img: np.ndarray, curr_img: np.ndarray) -> bool:
-        """두 이미지 간 변화량 계산"""
+        """두 이미지 간 변화량 계산 (설정된 감지 엔진 사용)"""
         try:
-            # 절대 차이 계산
-            diff = cv2.absdiff(prev_img, curr_img)
-            
-            # 임계값 적용 (작은 변화 제거)
-            threshold_value = 30  # 0-255 범위에서 30 이상 차이만 인정
-            _, thresh = cv2.threshold(diff, threshold_value, 255, cv2.THRESH_BINARY)
-            
-            # 변화된 픽셀 수 계산
-            changed_pixels = cv2.countNonZero(thresh)
+            changed_pixels, tile_info = self.engine.run(prev_img, curr_img)
             total_pixels = prev_img.shape[0] * prev_img.shape[1]
             change_ratio = changed_pixels / total_pixels
             
+            # 축소 감지 시 최소 변화 픽셀 수와 변화 범위는 원본 해상도 기준으로 환산 (변화율은 그대로)
+            scale_x, scale_y = self.scale_factors
+            if (scale_x, scale_y) != (1.0, 1.0):
+                changed_pixels = int(round(changed_pixels * scale_x * scale_y))
+                total_pixels = int(round(total_pixels * scale_x * scale_y))
+                if tile_info.get('bbox'):
+                    x, y, w, h = tile_info['bbox']
+                    tile_info['bbox'] = (int(x * scale_x), int(y * scale_y), int(round(w * scale_x)), int(round(h * scale_y)))
+            
+            self.last_change_info = {
+                'changed_pixels': changed_pixels,
+                'change_ratio': change_ratio,
+                **tile_info,
+            }
+            
             # 디버그 정보
             if self.config.config.get('debug_mode', False):
-                logger.info(f"변화 분석: {changed_pixels}/{total_pixels} 픽셀 ({change_ratio:.3f}%), "
-                          f"임계값: {self.change_threshold:.3f}")
+                logger.info("변화 분석: %d/%d 픽셀 (%.3f%%), 임계값: %.3f",
+                            changed_pixels, total_pixels, change_ratio, self.change_threshold)
                 
-                # 변화 이미지 저장
-                cv2.imwrite('debug_diff.png', diff)
-                cv2.imwrite('debug_thresh.png', thresh)
+                # 엔진 중간 이미지 저장 (백그라운드 저장기에 전달)
+                debug_writer = get_debug_writer(self.config)
+                for kind, image in self.engine.last_debug_images.items():
+                    debug_writer.submit(self.debug_name(kind), image)
             
             # 변화 조건 확인
-            change_detected = (
-                change_ratio >= self.change_threshold and 
-                changed_pixels >= self.min_change_pixels
-            )
+            change_detected = self.exceeds_threshold(change_ratio, changed_pixels)
             
             if change_detected:
-                logger.info(f"✅ 변화 감지됨! 변화율: {change_ratio:.3f}% (임계값: {self.change_threshold:.3f}%)")
+                # 프레임마다 호출되므로 지연 포맷 (DEBUG가 꺼져 있으면 문자열을 만들지 않음)
+                logger.debug("임계값 초과: 변화율 %.3f (임계값 %.3f)", change_ratio, self.change_threshold)
             
             return change_detected
             
@@ -528,9 +1984,93 @@ class ImageChangeDetector:
             logger.error(f"변화량 계산 실패: {e}")
             return False
     
+    def count_changed_pixels(self, mask: np.ndarray) -> Tuple[int, dict]:
+        """변화 마스크(0/255)의 변화 픽셀 수 (타일 모드에서는 임계값을 넘은 프레임만 타일별 위치 정보 포함)
+        
+        대부분의 프레임은 변화가 없으므로 countNonZero 한 번으로 판단하고, 변화로 볼 만큼 바뀐
+        프레임에서만 locate_changes로 마스크를 다시 훑어 위치를 계산합니다.
+        """
+        changed_pixels = cv2.countNonZero(mask)
+        if self.tile_grid:
+            scale_x, scale_y = self.scale_factors
+            if self.exceeds_threshold(changed_pixels / mask.size, int(round(changed_pixels * scale_x * scale_y))):
+                _, tile_info = self.locate_changes(mask)
+                return changed_pixels, tile_info
+        return changed_pixels, {}
+    
+    def exceeds_threshold(self, change_ratio: float, changed_pixels: int) -> bool:
+        """변화율과 변화 픽셀 수(원본 해상도 기준)가 모두 감도 임계값 이상인지"""
+        return change_ratio >= self.change_threshold and changed_pixels >= self.min_change_pixels
+    
+    def locate_changes(self, thresh: np.ndarray) -> Tuple[int, dict]:
+        """임계값 마스크를 타일 격자로 나눠 타일별 변화 픽셀 수 계산
+        
+        행 타일(연속된 메모리 구간)마다 cv2.reduce로 열 합계를 구한 뒤 작은 합계 행렬만 열 타일
+        단위로 묶습니다. 행 수만큼 호출이 늘어나므로 비용은 격자가 클수록 커집니다 (4K 마스크에서
+        countNonZero 0.34ms 대비 [8, 1] 약 0.6ms, [32, 32] 약 1.1ms 추가). 그래서
+        count_changed_pixels는 임계값을 넘은 프레임에서만 호출합니다.
+        """
+        rows, cols = self.tile_grid
+        height, width = thresh.shape
+        rows = min(rows, height)
+        cols = min(cols, width)
+        
+        row_edges = self._tile_edges('row_edges', height, rows)
+        col_edges = self._tile_edges('col_edges', width, cols)
+        
+        # 행 타일별 픽셀 열 합계 (열마다 255 * height 이하이므로 int32로 충분)
+        column_sums = self._get_buffer('tile_column_sums', (rows, width), np.int32)
+        for row in range(rows):
+            top = row_edges[row]
+            bottom = row_edges[row + 1] if row + 1 < rows else height
+            cv2.reduce(thresh[top:bottom], 0, cv2.REDUCE_SUM, dst=column_sums[row:row + 1], dtype=cv2.CV_32S)
+        
+        tile_sums = np.add.reduceat(column_sums, col_edges, axis=1, dtype=np.int64,
+                                    out=self._get_buffer('tile_sums', (rows, cols), np.int64))
+        tile_counts = tile_sums // 255
+        changed_pixels = int(tile_counts.sum())
+        
+        changed = np.argwhere(tile_counts >= self.detection_tile_min_pixels)
+        tiles = [(int(r), int(c)) for r, c in changed]
+        bbox = None
+        if tiles:
+            top = int(row_edges[changed[:, 0].min()])
+            left = int(col_edges[changed[:, 1].min()])
+            bottom_row = changed[:, 0].max() + 1
+            right_col = changed[:, 1].max() + 1
+            bottom = int(row_edges[bottom_row]) if bottom_row < rows else height
+            right = int(col_edges[right_col]) if right_col < cols else width
+            bbox = (left, top, right - left, bottom - top)
+        
+        return changed_pixels, {
+            'changed_tiles': tiles,
+            'changed_rows': sorted({r for r, c in tiles}),
+            'bbox': bbox,
+        }
+    
+    @property
+    def detection_tile_min_pixels(self) -> float:
+        """감지 해상도 기준 타일 최소 변화 픽셀 수 (tile_min_pixels는 min_change_pixels처럼 원본 해상도 기준)"""
+        scale_x, scale_y = self.scale_factors
+        return self.tile_min_pixels / (scale_x * scale_y)
+    
+    def _tile_edges(self, name: str, length: int, count: int) -> np.ndarray:
+        """길이를 count개 타일로 나눈 시작 위치 (영역 크기가 같으면 재사용)"""
+        key = (name, length, count)
+        edges = self._buffers.get(key)
+        if edges is None:
+            edges = (np.arange(count) * length // count).astype(np.intp)
+            self._buffers[key] = edges
+        return edges
+    
     def reset_baseline(self):
         """기준 이미지 리셋"""
         self.previous_image = None
+        self.last_fingerprint = None
+        self.fingerprint_streak = 0
+        self.baseline_hash = None
+        self.confirm_ring.clear()
+        self._buffers.clear()
         logger.info("🔄 기준 이미지 리셋됨")
     
     def set_sensitivity(self, threshold: float, min_pixels: int = None):
@@ -538,9 +2078,90 @@ class ImageChangeDetector:
         self.change_threshold = max(0.01, min(1.0, threshold))  # 1%~100% 범위
         if min_pixels:
             self.min_change_pixels = max(10, min_pixels)
+        # 기준이 바뀌었으므로 같은 프레임이라도 다시 비교
+        self.last_fingerprint = None
         
         logger.info(f"🎛️ 감도 조정: 임계값={self.change_threshold:.3f}, 최소픽셀={self.min_change_pixels}")
 
+class AlertSoundPlayer:
+    """알림음 재생기 - 알림음을 한 번만 디코딩해 메모리 버퍼에서 바로 재생"""
+    
+    # 믹서 출력 버퍼 (샘플 수) - 작을수록 재생 지연이 짧음 (512 / 44100Hz ≈ 12ms)
+    MIXER_FREQUENCY = 44100
+    MIXER_BUFFER = 512
+    
+    def __init__(self, sound_path: Optional[str] = None):
+        self.sound_path = sound_path or os.path.join(os.path.dirname(os.path.abspath(__file__)), "monitoring_voice.mp3")
+        self.sound = None
+        self.channel = None
+        self.load_failed = False
+        self.lock = threading.Lock()
+        self.latencies = []
+    
+    def preload(self) -> bool:
+        """믹서만 초기화하고 알림음을 메모리로 디코딩 (최초 1회)"""
+        with self.lock:
+            if self.sound is not None:
+                return True
+            if self.load_failed:
+                return False
+            try:
+                if not PYGAME_AVAILABLE:
+                    logger.warning("pygame이 설치되지 않아 알림음을 재생할 수 없습니다.")
+                elif not os.path.exists(self.sound_path):
+                    logger.warning(f"알림음 파일을 찾을 수 없음: {self.sound_path}")
+                else:
+                    # pygame 전체가 아닌 믹서만 초기화
+                    if not pygame.mixer.get_init():
+                        pygame.mixer.init(frequency=self.MIXER_FREQUENCY, buffer=self.MIXER_BUFFER)
+                    pygame.mixer.set_reserved(1)
+                    self.channel = pygame.mixer.Channel(0)
+                    self.sound = pygame.mixer.Sound(self.sound_path)
+                    logger.info(f"알림음 미리 로드 완료: {self.sound_path} ({self.sound.get_length():.1f}초)")
+                    return True
+            except Exception as e:
+                logger.error(f"알림음 로드 실패: {e}")
+            self.load_failed = True
+            return False
+    
+    def preload_async(self):
+        """시작 화면을 막지 않도록 백그라운드 스레드에서 미리 로드"""
+        threading.Thread(target=self.preload, name="AlertSoundPreload", daemon=True).start()
+    
+    def play(self, triggered_at: Optional[float] = None) -> bool:
+        """알림음 재생 - triggered_at(time.perf_counter 기준 감지 시각)이 있으면 지연 시간 기록"""
+        if self.sound is None and not self.preload():
+            return False
+        
+        # 전용 채널에서 재생하므로 이전 알림음이 울리는 중이면 처음부터 다시 재생
+        self.channel.play(self.sound)
+        
+        if triggered_at is not None:
+            # 감지부터 재생 요청까지의 시간 + 믹서 출력 버퍼 지연
+            latency_ms = (time.perf_counter() - triggered_at) * 1000 + self.MIXER_BUFFER / self.MIXER_FREQUENCY * 1000
+            self.latencies.append(latency_ms)
+            del self.latencies[:-100]
+            logger.info(f"알림음 재생: 감지 후 약 {latency_ms:.1f}ms")
+        return True
+    
+    def stop(self):
+        """알림음 중지"""
+        if self.channel is not None and self.channel.get_busy():
+            self.channel.stop()
+            logger.info("알림음 중지됨")
+    
+    def get_latency_stats(self) -> dict:
+        """최근 알림음 지연 시간 통계 (ms)"""
+        if not self.latencies:
+            return {'count': 0}
+        ordered = sorted(self.latencies)
+        return {
+            'count': len(ordered),
+            'mean_ms': sum(ordered) / len(ordered),
+            'p50_ms': ordered[len(ordered) // 2],
+            'max_ms': ordered[-1],
+        }
+
 class NotificationGUI:
     """알림 GUI 클래스 - 완전히 새로 작성"""
     
@@ -548,25 +2169,15 @@ class NotificationGUI:
         """초기화 메서드 - config_manager는 선택적 매개변수"""
         self.alert_windows = []
         self.config = config_manager
-        self.sound_player = None
+        self.sound_player = AlertSoundPlayer()
+        # 알림 시점에 파일을 읽고 디코딩하지 않도록 미리 로드
+        self.sound_player.preload_async()
         logger.info(f"NotificationGUI 초기화 완료: config={config_manager is not None}")
     
-    def play_alert_sound(self):
+    def play_alert_sound(self, triggered_at: Optional[float] = None):
         """알림음 재생 함수"""
         try:
-            if PYGAME_AVAILABLE:
-                sound_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "monitoring_voice.mp3")
-                
-                if os.path.exists(sound_path):
-                    pygame.mixer.music.load(sound_path)
-                    pygame.mixer.music.play()
-                    logger.info(f"알림음 재생: {sound_path}")
-                    return True
-                else:
-                    logger.warning(f"알림음 파일을 찾을 수 없음: {sound_path}")
-            else:
-                logger.warning("pygame이 설치되지 않아 알림음을 재생할 수 없습니다.")
-            return False
+            return self.sound_player.play(triggered_at)
         except Exception as e:
             logger.error(f"알림음 재생 실패: {e}")
             return False
@@ -574,21 +2185,22 @@ class NotificationGUI:
     def stop_alert_sound(self):
         """알림음 중지 함수"""
         try:
-            if PYGAME_AVAILABLE and pygame.mixer.music.get_busy():
-                pygame.mixer.music.stop()
-                logger.info("알림음 중지됨")
+            self.sound_player.stop()
         except Exception as e:
             logger.error(f"알림음 중지 실패: {e}")
     
-    def show_change_alert(self, change_number: int):
-        """영역 변화 알림 창 표시"""
+    def show_change_alert(self, change_number: int, master=None, detail: str = None, play_sound: bool = True):
+        """영역 변화 알림 창 표시 (master가 주어지면 해당 Tk 루프 위에 표시)"""
         try:
-            root = tk.Tk()
-            root.withdraw()  # 메인 창 숨기기
+            # master가 없으면 기존처럼 자체 루트와 이벤트 루프 사용
+            root = None
+            if master is None:
+                root = tk.Tk()
+                root.withdraw()  # 메인 창 숨기기
             
-            alert_window = tk.Toplevel(root)
+            alert_window = tk.Toplevel(master if master is not None else root)
             alert_window.title("영역 변화 감지")
-            alert_window.geometry("350x180")
+            alert_window.geometry("350x180" if not detail else "350x210")
             alert_window.configure(bg='#fff3cd')
             
             alert_window.attributes('-topmost', True)
@@ -618,13 +2230,15 @@ class NotificationGUI:
             # 메시지
             message_label = tk.Label(
                 msg_frame,
-                text=f"모니터링 영역에 변화가 감지되었습니다!\n\n변화 횟수: {change_number}회",
+                text=self.format_alert_message(change_number, detail),
                 font=('맑은 고딕', 12),
                 bg='#fff3cd',
                 fg='#333333',
                 justify='center'
             )
             message_label.pack(pady=(0, 15))
+            # OCR 인원 수처럼 나중에 도착하는 설명을 덧붙일 수 있도록 보관
+            alert_window.message_label = message_label
             
             # 시간
             time_label = tk.Label(
@@ -636,14 +2250,18 @@ class NotificationGUI:
             )
             time_label.pack(pady=(0, 15))
             
-            # 알림음 재생
-            self.play_alert_sound()
+            # 알림음 재생 (디스패처는 감지 즉시 미리 재생)
+            if play_sound:
+                self.play_alert_sound()
             
             # 알림창 닫기 함수
             def close_alert():
+                if not alert_window.winfo_exists():
+                    return
                 self.stop_alert_sound()
                 alert_window.destroy()
-                root.destroy()
+                if root is not None:
+                    root.destroy()
             
             # 확인 버튼
             ok_button = tk.Button(
@@ -667,30 +2285,1143 @@ class NotificationGUI:
             alert_window.after(alert_duration, close_alert)
             
             self.alert_windows.append(alert_window)
+            # 확인 버튼, 자동 닫기, 디스패처의 창 교체 등 어떤 경로로 닫혀도 목록에서 제거
+            # (Toplevel의 <Destroy>는 자식 위젯 파괴에도 오므로 창 자신일 때만)
+            alert_window.bind('<Destroy>', lambda event: self.forget_window(alert_window)
+                              if event.widget is alert_window else None)
             logger.info(f"알림 창 표시: 영역 변화 #{change_number}")
             
-            # 별도 이벤트 루프로 실행
-            alert_window.mainloop()
+            # 별도 이벤트 루프로 실행 (master가 없을 때만)
+            if root is not None:
+                alert_window.mainloop()
+            
+            return alert_window
+            
+        except Exception as e:
+            logger.error(f"알림 창 표시 실패: {e}")
+            return None
+    
+    @staticmethod
+    def format_alert_message(change_number: int, detail: str = None) -> str:
+        """알림 창 본문"""
+        message_text = f"모니터링 영역에 변화가 감지되었습니다!\n\n변화 횟수: {change_number}회"
+        if detail:
+            message_text += f"\n{detail}"
+        return message_text
+    
+    def update_alert_detail(self, alert_window, change_number: int, detail: str):
+        """이미 표시된 알림 창의 설명 교체 (창이 닫혔으면 무시)"""
+        try:
+            if alert_window is None or not alert_window.winfo_exists():
+                return
+            alert_window.message_label.config(text=self.format_alert_message(change_number, detail))
+            alert_window.geometry("350x210")
+        except Exception as e:
+            logger.error(f"알림 창 갱신 실패: {e}")
+    
+    def forget_window(self, alert_window):
+        """닫힌 알림 창을 목록에서 제거"""
+        if alert_window in self.alert_windows:
+            self.alert_windows.remove(alert_window)
+    
+    def close_all_alerts(self):
+        """열려 있는 알림 창 모두 닫기"""
+        for window in list(self.alert_windows):
+            try:
+                if window.winfo_exists():
+                    window.destroy()
+            except Exception:
+                pass
+        self.alert_windows.clear()
+        self.stop_alert_sound()
+    
+    def show_patient_alert(self, count: int):
+        """대기환자 알림 (호환성 유지)"""
+        self.show_change_alert(count)
+
+def get_monitoring_regions(config: dict) -> List[dict]:
+    """설정에서 모니터링 영역 목록 반환 (단일 monitoring_region 설정도 지원)"""
+    regions = []
+    for index, entry in enumerate(config.get('monitoring_regions') or []):
+        if isinstance(entry, dict):
+            region = entry.get('region')
+            label = entry.get('label') or f"영역 {index + 1}"
+            sensitivity = entry.get('sensitivity')
+        else:
+            region, label, sensitivity = entry, f"영역 {index + 1}", None
+        if region and len(region) == 4:
+            regions.append({
+                'label': label,
+                'region': tuple(int(v) for v in region),
+                'sensitivity': sensitivity,
+            })
+    
+    if not regions and config.get('monitoring_region'):
+        regions.append({
+            'label': '기본 영역',
+            'region': tuple(int(v) for v in config['monitoring_region']),
+            'sensitivity': None,
+        })
+    return regions
+
+def get_bounding_region(regions: List[Tuple[int, int, int, int]]) -> Tuple[int, int, int, int]:
+    """여러 영역을 모두 포함하는 최소 사각형 계산"""
+    left = min(x for x, y, w, h in regions)
+    top = min(y for x, y, w, h in regions)
+    right = max(x + w for x, y, w, h in regions)
+    bottom = max(y + h for x, y, w, h in regions)
+    return (left, top, right - left, bottom - top)
+
+class MonitoringRegion:
+    """개별 모니터링 영역 - 영역마다 별도의 감지기, 민감도, 라벨 보유"""
+    
+    def __init__(self, config_manager: ConfigManager, label: str, region: Tuple[int, int, int, int],
+                 sensitivity: Optional[float] = None):
+        self.label = label
+        self.region = region
+        self.sensitivity = sensitivity
+        self.detector = ImageChangeDetector(config_manager, label)
+        self.change_count = 0
+        
+        if sensitivity is not None:
+            self.detector.set_sensitivity(sensitivity)
+    
+    def crop(self, frame: np.ndarray, origin: Tuple[int, int]) -> np.ndarray:
+        """공통 캡처 이미지에서 이 영역만 잘라낸 뷰 반환 (복사 없음)"""
+        x, y, w, h = self.region
+        left = x - origin[0]
+        top = y - origin[1]
+        return frame[top:top + h, left:left + w]
+
+class AlertDispatcher:
+    """알림 디스패처 - 모니터 스레드는 큐에 이벤트만 넣고 GUI 스레드가 표시"""
+    
+    def __init__(self, notification_gui: NotificationGUI, max_pending: int = 100, poll_ms: int = 100):
+        self.notification_gui = notification_gui
+        self.events = queue.Queue(maxsize=max_pending)
+        self.poll_ms = poll_ms
+        self.root = None
+        self.owns_root = False
+        self.log_only = False
+        self.poll_id = None
+        self.running = False
+        self.active_window = None
+        self.active_change_number = None
+        self.active_extra = None
+        self.dropped_count = 0
+        self.metrics: Optional[CycleMetrics] = None
+    
+    def attach(self, root):
+        """이미 실행 중인 Tk 루프(메인 스레드)에 소비자 연결 (여러 번 호출해도 폴링은 하나)"""
+        self.running = True
+        self.log_only = False
+        if self.root is root and self.poll_id is not None:
+            # stop() 뒤 아직 실행되지 않은 폴링이 남아 있으면 그대로 이어서 사용
+            return
+        if self.poll_id is not None and self.root is not None:
+            self.root.after_cancel(self.poll_id)
+        self.root = root
+        self.owns_root = False
+        self._schedule_poll()
+    
+    def start(self):
+        """소비자 시작 - 연결된 Tk 루프가 없으면 메인 스레드에 숨겨진 루트 생성
+        
+        Tk는 메인 스레드에서만 안전하게 쓸 수 있으므로 다른 스레드에서 호출되면 창을 만들지 않고
+        알림을 로그로만 남깁니다 (알림음은 submit()에서 바로 재생). 숨겨진 루트의 이벤트는 호출한
+        쪽이 메인 스레드에서 mainloop()로 처리합니다.
+        """
+        if self.running:
+            return
+        self.running = True
+        if threading.current_thread() is not threading.main_thread():
+            self.log_only = True
+            logger.warning("알림 디스패처: 메인 스레드가 아니므로 알림 창 없이 로그로만 알립니다 (attach()로 Tk 루프 연결 필요)")
+            return
+        self.root = tk.Tk()
+        self.root.withdraw()
+        self.owns_root = True
+        self._schedule_poll()
+    
+    def mainloop(self):
+        """start()로 만든 숨겨진 루트의 이벤트 루프 실행 (stop() 후 다음 폴링 때 반환)"""
+        if self.owns_root and self.root is not None:
+            self.root.mainloop()
+    
+    def stop(self):
+        """소비자 중지 (직접 만든 루트는 다음 폴링 때 닫음)"""
+        self.running = False
+        self.log_only = False
+    
+    def _schedule_poll(self):
+        self.poll_id = self.root.after(self.poll_ms, self._poll)
+    
+    def submit(self, change_number: int, detail: str = None, detected_at: Optional[float] = None) -> bool:
+        """알림 이벤트 등록 - 모니터 스레드에서 호출되며 절대 대기하지 않음"""
+        if self.log_only:
+            self.notification_gui.play_alert_sound(detected_at if detected_at is not None else time.perf_counter())
+            logger.info(f"🔔 영역 변화 #{change_number}" + (f" ({detail})" if detail else ""))
+            return True
+        
+        event = {
+            'change_number': change_number,
+            'detail': detail,
+            'timestamp': time.time(),
+        }
+        
+        # 알림음은 GUI 폴링을 기다리지 않고 감지 즉시 재생 (메모리의 소리를 재생하므로 대기 없음)
+        self.notification_gui.play_alert_sound(detected_at if detected_at is not None else time.perf_counter())
+        try:
+            self.events.put_nowait(event)
+            return True
+        except queue.Full:
+            # 가장 오래된 이벤트를 버리고 최신 이벤트 보존
+            try:
+                self.events.get_nowait()
+                self.dropped_count += 1
+            except queue.Empty:
+                pass
+            try:
+                self.events.put_nowait(event)
+            except queue.Full:
+                self.dropped_count += 1
+            if self.metrics is not None:
+                self.metrics.increment('alerts_dropped')
+            logger.warning(f"알림 큐가 가득 차 오래된 알림을 버렸습니다 (누적 {self.dropped_count}건)")
+            return False
+    
+    def update_detail(self, change_number: int, detail: str) -> bool:
+        """이미 등록한 알림의 설명 교체 (OCR 인원 수 등) - 큐가 가득 차면 버림"""
+        if self.log_only:
+            logger.info(f"🔔 영역 변화 #{change_number}: {detail}")
+            return True
+        try:
+            self.events.put_nowait({'change_number': change_number, 'detail': detail, 'update': True})
+            return True
+        except queue.Full:
+            return False
+    
+    def _poll(self):
+        """GUI 스레드에서 큐를 비우고 알림 표시"""
+        self.poll_id = None
+        if not self.running:
+            if self.owns_root and self.root is not None:
+                self.notification_gui.close_all_alerts()
+                self.root.destroy()
+                self.root = None
+                self.owns_root = False
+            return
+        
+        pending = []
+        while True:
+            try:
+                pending.append(self.events.get_nowait())
+            except queue.Empty:
+                break
+        
+        alerts = [event for event in pending if not event.get('update')]
+        if alerts:
+            self._show(alerts)
+        for event in pending:
+            if event.get('update') and event['change_number'] == self.active_change_number:
+                detail = event['detail']
+                if self.active_extra:
+                    detail = f"{detail}\n{self.active_extra}"
+                self.notification_gui.update_alert_detail(self.active_window, event['change_number'], detail)
+        
+        self._schedule_poll()
+    
+    def _show(self, pending: list):
+        """대기 중 알림을 하나의 창으로 합쳐 표시 (이전 창은 교체)"""
+        started_at = time.perf_counter()
+        try:
+            latest = pending[-1]
+            details = [event['detail'] for event in pending if event['detail']]
+            detail = details[-1] if details else None
+            self.active_extra = None
+            if len(pending) > 1:
+                self.active_extra = f"(표시 대기 중 추가 변화 {len(pending) - 1}건)"
+                detail = f"{detail}\n{self.active_extra}" if detail else self.active_extra
+            
+            if self.active_window is not None:
+                try:
+                    if self.active_window.winfo_exists():
+                        self.active_window.destroy()
+                except Exception:
+                    pass
+            
+            self.active_window = self.notification_gui.show_change_alert(
+                latest['change_number'], master=self.root, detail=detail, play_sound=False
+            )
+            self.active_change_number = latest['change_number']
+            if self.metrics is not None:
+                self.metrics.observe('alert_display', time.perf_counter() - started_at)
+        except Exception as e:
+            logger.error(f"알림 표시 실패: {e}")
+
+class HeadlessAlertDispatcher:
+    """GUI 없는 알림 디스패처 - AlertDispatcher와 같은 인터페이스로 알림을 로그/알림음/외부 명령에 전달
+    
+    헤드리스 서비스 모드에서 사용하며 tkinter를 불러오지 않습니다. 외부 명령은 전용 스레드에서
+    실행하므로 모니터 스레드는 명령이 끝나기를 기다리지 않습니다.
+    """
+    
+    SINKS = ('log', 'sound', 'command')
+    COMMAND_TIMEOUT = 30.0
+    
+    def __init__(self, sinks: Optional[List[str]] = None, command: Optional[str] = None, max_pending: int = 100):
+        self.sinks = tuple(sinks or ('log',))
+        unknown = [sink for sink in self.sinks if sink not in self.SINKS]
+        if unknown:
+            raise ValueError(f"알 수 없는 알림 대상: {', '.join(unknown)}")
+        if 'command' in self.sinks and not command:
+            raise ValueError("command 알림 대상에는 실행할 명령(alert_command)이 필요합니다")
+        
+        self.command = command
+        self.events = queue.Queue(maxsize=max_pending)
+        self.notification_gui = None
+        self.owns_root = False
+        self.running = False
+        self.worker = None
+        self.dropped_count = 0
+        self.metrics: Optional[CycleMetrics] = None
+        
+        self.sound_player = None
+        if 'sound' in self.sinks:
+            self.sound_player = AlertSoundPlayer()
+            self.sound_player.preload_async()
+    
+    def start(self):
+        """외부 명령 실행 스레드 시작 (command 대상이 있을 때만)"""
+        if self.running:
+            return
+        self.running = True
+        if 'command' in self.sinks:
+            self.worker = threading.Thread(target=self._run_commands, name="AlertCommand", daemon=True)
+            self.worker.start()
+    
+    def stop(self):
+        """명령 실행 스레드 중지 (실행 중인 명령은 끝날 때까지 최대 2초 대기)"""
+        self.running = False
+        if self.worker and self.worker is not threading.current_thread():
+            self.worker.join(timeout=2)
+        self.worker = None
+    
+    def submit(self, change_number: int, detail: str = None, detected_at: Optional[float] = None) -> bool:
+        """알림 이벤트 전달 - 모니터 스레드에서 호출되며 절대 대기하지 않음"""
+        if self.sound_player is not None:
+            self.sound_player.play(detected_at if detected_at is not None else time.perf_counter())
+        
+        if 'log' in self.sinks:
+            logger.info(f"🔔 알림: 영역 변화 #{change_number}" + (f" - {detail}" if detail else ""))
+        
+        if 'command' not in self.sinks:
+            return True
+        
+        event = {
+            'change_number': change_number,
+            'detail': detail,
+            'timestamp': time.time(),
+        }
+        try:
+            self.events.put_nowait(event)
+            return True
+        except queue.Full:
+            # 가장 오래된 이벤트를 버리고 최신 이벤트 보존
+            try:
+                self.events.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                self.events.put_nowait(event)
+            except queue.Full:
+                pass
+            self.dropped_count += 1
+            if self.metrics is not None:
+                self.metrics.increment('alerts_dropped')
+            logger.warning(f"알림 명령 큐가 가득 차 오래된 알림을 버렸습니다 (누적 {self.dropped_count}건)")
+            return False
+    
+    def update_detail(self, change_number: int, detail: str) -> bool:
+        """이미 전달한 알림의 추가 설명 (OCR 인원 수 등)을 로그로 남김"""
+        if 'log' in self.sinks:
+            logger.info(f"🔔 알림 #{change_number} 추가 정보: {detail}")
+        return True
+    
+    def _run_commands(self):
+        """알림마다 외부 명령 실행 (PQM_CHANGE_NUMBER, PQM_DETAIL, PQM_TIMESTAMP 환경 변수 전달)"""
+        while self.running:
+            try:
+                event = self.events.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            
+            started_at = time.perf_counter()
+            env = {
+                **os.environ,
+                'PQM_CHANGE_NUMBER': str(event['change_number']),
+                'PQM_DETAIL': event['detail'] or '',
+                'PQM_TIMESTAMP': datetime.fromtimestamp(event['timestamp']).isoformat(timespec='seconds'),
+            }
+            try:
+                result = subprocess.run(self.command, shell=True, env=env, timeout=self.COMMAND_TIMEOUT)
+                if result.returncode != 0:
+                    logger.warning(f"알림 명령 종료 코드 {result.returncode}: {self.command}")
+            except subprocess.TimeoutExpired:
+                logger.warning(f"알림 명령 시간 초과 ({self.COMMAND_TIMEOUT:.0f}초): {self.command}")
+            except Exception as e:
+                logger.error(f"알림 명령 실행 실패: {e}")
+            
+            if self.metrics is not None:
+                self.metrics.observe('alert_display', time.perf_counter() - started_at)
+
+class WaitingCountReader:
+    """변화가 감지된 프레임의 대기 인원 수 OCR - 작업 스레드 풀에서 실행하고 결과는 프레임 해시로 캐시
+    
+    알림과 알림음은 OCR을 기다리지 않고 감지 즉시 나가며, 모니터 스레드는 잘라낸 영역 이미지만
+    넘기고 바로 돌아갑니다. OCR이 끝나면 작업 스레드가 "3 → 4명 대기" 같은 설명으로 이미 띄운
+    알림을 갱신합니다. 작업 스레드마다 OCR 엔진을 하나씩 두고, 모든 엔진이 바쁘면 요청은 건너뛰지
+    않고 엔진이 빌 때까지 기다립니다. 대기 중인 작업이 max_pending을 넘으면 그 알림은 인원 수 없이 남습니다.
+    """
+    
+    # 대기 인원 수 추출: "4명"처럼 단위가 붙은 숫자를 우선하고 없으면 첫 번째 숫자
+    COUNT_PATTERNS = (re.compile(r'(\d+)\s*명'), re.compile(r'(\d+)'))
+    CACHE_SIZE = 128
+    
+    def __init__(self, config_manager: ConfigManager, max_pending: int = 4):
+        self.max_pending = max_pending
+        self.workers = max(1, int(config_manager.config.get('ocr_workers', 1)))
+        # Tesseract API는 스레드 안전하지 않으므로 작업 스레드 수만큼 엔진을 따로 둠
+        self.services = [
+            OCRService(lang=config_manager.config.get('ocr_lang', 'kor+eng'),
+                       timeout=float(config_manager.config.get('ocr_timeout', 2.0)),
+                       backend=config_manager.config.get('ocr_backend', 'auto') or 'auto')
+            for _ in range(self.workers)
+        ]
+        self.service = self.services[0]
+        self.timeout = self.service.timeout
+        self.executor = None
+        # 엔진 호출은 엔진별 전용 스레드에서 실행하고 작업 스레드는 timeout까지만 기다림
+        self.service_executors = [None] * self.workers
+        self.idle_services = queue.Queue()
+        for index in range(self.workers):
+            self.idle_services.put(index)
+        self.lock = threading.Lock()
+        self.pending = 0
+        self.sequence = 0
+        self.cache = collections.OrderedDict()
+        self.cache_hits = 0
+        # 영역별 (요청 순번, 인원 수) - 작업 스레드 여러 개가 동시에 갱신하므로 lock으로 보호
+        self.last_counts = {}
+        self.metrics: Optional[CycleMetrics] = None
+    
+    def submit(self, change_number: int, detail: Optional[str], detected_at: float,
+               crops: List[Tuple[str, np.ndarray]], deliver) -> bool:
+        """영역별 이미지를 OCR한 뒤 인원 수를 읽었으면 deliver(change_number, detail) 호출 (대기 작업이 많으면 False)"""
+        sequence = self._reserve()
+        if sequence is None:
+            logger.warning(f"OCR 작업이 {self.max_pending}개 밀려 있어 변화 #{change_number} 알림은 인원 수 없이 표시합니다")
+            return False
+        # 캡처 버퍼가 재사용될 수 있으므로 작은 영역 이미지만 복사해 넘김
+        crops = [(label, np.ascontiguousarray(crop)) for label, crop in crops]
+        self._get_executor().submit(self._run_alert, sequence, change_number, detail, detected_at, crops, deliver)
+        return True
+    
+    def prime(self, crops: List[Tuple[str, np.ndarray]]) -> bool:
+        """기준 화면의 영역별 인원 수를 한 묶음으로 미리 읽어 첫 알림에도 이전 값을 표시"""
+        if not crops:
+            return False
+        sequence = self._reserve()
+        if sequence is None:
+            return False
+        crops = [(label, np.ascontiguousarray(crop)) for label, crop in crops]
+        self._get_executor().submit(self._run_prime, sequence, crops)
+        return True
+    
+    def shutdown(self):
+        """작업 스레드 정리 (남은 작업이 끝나기를 기다리지 않으며, 다시 submit하면 새 풀 생성)"""
+        with self.lock:
+            executor, self.executor = self.executor, None
+            service_executors, self.service_executors = self.service_executors, [None] * self.workers
+        if executor is not None:
+            executor.shutdown(wait=False)
+        for service, service_executor in zip(self.services, service_executors):
+            if service_executor is not None:
+                # 남은 인식이 끝난 뒤 엔진 스레드에서 API 해제
+                service_executor.submit(service.close)
+                service_executor.shutdown(wait=False)
+    
+    def _get_executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        with self.lock:
+            if self.executor is None:
+                self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.workers,
+                                                                      thread_name_prefix="OCR")
+            return self.executor
+    
+    def _recognize_with_deadline(self, images: List[np.ndarray]) -> Optional[List[Tuple[str, float]]]:
+        """빈 엔진의 전용 스레드에서 묶음 인식 - 엔진을 기다리거나 이미지당 timeout 안에 끝나지 않으면 None
+        
+        모든 엔진이 바쁘면 앞선 인식이 끝날 때까지 기다립니다. 엔진은 인식이 실제로 끝난 뒤에야
+        다시 빈 엔진이 되므로, 시간 초과로 포기한 인식이 같은 API를 쓰는 다음 요청과 겹치지 않습니다.
+        """
+        try:
+            # 앞선 작업은 모두 각자의 timeout 안에 끝나므로 밀린 작업 수만큼만 기다림
+            index = self.idle_services.get(timeout=self.timeout * self.max_pending)
+        except queue.Empty:
+            logger.warning(f"OCR 엔진 {self.workers}개가 모두 응답하지 않아 인원 수 없이 알림 유지")
+            return None
+        with self.lock:
+            if self.service_executors[index] is None:
+                self.service_executors[index] = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix=f"OCREngine{index}")
+            future = self.service_executors[index].submit(self.services[index].recognize_batch, images)
+        future.add_done_callback(lambda _: self.idle_services.put(index))
+        try:
+            return future.result(timeout=self.timeout * len(images))
+        except concurrent.futures.TimeoutError:
+            logger.warning(f"OCR 시간 초과 ({len(images)}개, {self.timeout * len(images):.1f}초) - 인원 수 없이 알림 유지")
+            return None
+    
+    def _reserve(self) -> Optional[int]:
+        """대기 작업 자리를 잡고 요청 순번 반환 (max_pending을 넘으면 None)"""
+        with self.lock:
+            if self.pending >= self.max_pending:
+                return None
+            self.pending += 1
+            self.sequence += 1
+            return self.sequence
+    
+    def _release(self):
+        with self.lock:
+            self.pending -= 1
+    
+    def _update_count(self, label: str, sequence: int, count: int) -> Optional[int]:
+        """영역의 최신 인원 수를 갱신하고 이전 값 반환
+        
+        작업 스레드가 여러 개면 나중 요청이 먼저 끝날 수 있으므로, 더 나중 요청의 값이 이미 있으면
+        갱신하지 않고 이전 값도 모르는 것으로 처리합니다.
+        """
+        with self.lock:
+            latest = self.last_counts.get(label)
+            if latest is not None and latest[0] > sequence:
+                return None
+            self.last_counts[label] = (sequence, count)
+            return latest[1] if latest is not None else None
+    
+    def get_last_count(self, label: str) -> Optional[int]:
+        """영역에서 마지막으로 읽은 대기 인원 수"""
+        with self.lock:
+            latest = self.last_counts.get(label)
+        return latest[1] if latest is not None else None
+    
+    def _run_prime(self, sequence: int, crops: List[Tuple[str, np.ndarray]]):
+        try:
+            counts = self.read_counts([crop for _, crop in crops])
+            for (label, _), count in zip(crops, counts):
+                if count is not None:
+                    self._update_count(label, sequence, count)
+        except Exception as e:
+            logger.error(f"기준 화면 인원 OCR 실패: {e}")
+        finally:
+            self._release()
+    
+    def _run_alert(self, sequence: int, change_number: int, detail: Optional[str], detected_at: float,
+                   crops: List[Tuple[str, np.ndarray]], deliver):
+        try:
+            parts = []
+            # 바뀐 영역 이미지를 한 묶음으로 인식
+            counts = self.read_counts([crop for _, crop in crops])
+            for (label, _), count in zip(crops, counts):
+                if count is None:
+                    continue
+                previous = self._update_count(label, sequence, count)
+                text = f"{previous} → {count}명 대기" if previous is not None else f"{count}명 대기"
+                parts.append(f"{label} {text}" if len(crops) > 1 else text)
+            if parts:
+                deliver(change_number, " / ".join(parts) + (f" · {detail}" if detail else ""))
+            else:
+                logger.info(f"변화 #{change_number}: 대기 인원 수를 읽지 못해 알림을 그대로 둡니다")
+        except Exception as e:
+            logger.error(f"대기 인원 OCR 실패: {e}")
+        finally:
+            self._release()
+    
+    def read_counts(self, images: List[np.ndarray]) -> List[Optional[int]]:
+        """영역 이미지들의 대기 인원 수 (같은 이미지는 캐시된 결과 사용, 나머지는 한 묶음으로 OCR)"""
+        keys = [(image.shape, zlib.crc32(image)) for image in images]
+        counts = [None] * len(images)
+        missing = []
+        with self.lock:
+            for index, key in enumerate(keys):
+                if key in self.cache:
+                    self.cache.move_to_end(key)
+                    self.cache_hits += 1
+                    counts[index] = self.cache[key]
+                else:
+                    missing.append(index)
+        if not missing:
+            return counts
+        
+        results = self._recognize_with_deadline([self.prepare(images[index]) for index in missing])
+        if results is None:
+            # 시간 초과는 캐시하지 않음 (같은 화면을 다음에 다시 읽을 수 있도록)
+            return counts
+        for index, (text, latency) in zip(missing, results):
+            counts[index] = self.parse_count(text)
+            if self.metrics is not None:
+                self.metrics.observe('ocr', latency)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"OCR {latency * 1000:.0f}ms ({self.service.backend}): {text.strip()!r}")
+        
+        with self.lock:
+            for index in missing:
+                self.cache[keys[index]] = counts[index]
+            while len(self.cache) > self.CACHE_SIZE:
+                self.cache.popitem(last=False)
+        return counts
+    
+    @staticmethod
+    def prepare(image: np.ndarray) -> np.ndarray:
+        """OCR용 전처리 (그레이스케일, 2배 확대, 이진화)"""
+        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if len(image.shape) == 3 else image
+        gray = cv2.resize(gray, None, fx=2, fy=2, interpolation=cv2.INTER_CUBIC)
+        _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+        return binary
+    
+    @classmethod
+    def parse_count(cls, text: str) -> Optional[int]:
+        """인식된 문자열에서 대기 인원 수 추출"""
+        for pattern in cls.COUNT_PATTERNS:
+            match = pattern.search(text or "")
+            if match:
+                return int(match.group(1))
+        return None
+
+class CycleMetrics:
+    """감지 주기 단계별 소요 시간과 카운터
+    
+    모니터 스레드가 기록하고 통계 패널/HTTP 엔드포인트가 조회합니다. 단계마다
+    누적 히스토그램(Prometheus 형식)과 백분위수 계산용 최근 표본 링을 유지합니다.
+    """
+    
+    STAGES = ('capture', 'preprocess', 'calculate', 'detect', 'alert', 'alert_display', 'ocr', 'cycle')
+    STAGE_LABELS = {
+        'capture': '캡처',
+        'preprocess': '전처리',
+        'calculate': '변화량 계산',
+        'detect': '전체 감지',
+        'alert': '알림 등록',
+        'alert_display': '알림 표시',
+        'ocr': 'OCR',
+        'cycle': '주기 전체',
+    }
+    BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+    COUNTERS = ('cycles', 'cycle_overruns', 'capture_failures', 'changes', 'alerts_dropped', 'skipped_cycles')
+    
+    def __init__(self, window: int = 512):
+        self.window = window
+        self.reset()
+    
+    def reset(self):
+        """통계 초기화 (모니터링 시작 시)"""
+        self.started_at = time.time()
+        self.recent = {stage: collections.deque(maxlen=self.window) for stage in self.STAGES}
+        self.bucket_counts = {stage: [0] * (len(self.BUCKETS) + 1) for stage in self.STAGES}
+        self.sums = dict.fromkeys(self.STAGES, 0.0)
+        self.counts = dict.fromkeys(self.STAGES, 0)
+        self.counters = dict.fromkeys(self.COUNTERS, 0)
+    
+    def observe(self, stage: str, seconds: float):
+        """단계 소요 시간(초) 기록"""
+        self.recent[stage].append(seconds)
+        self.bucket_counts[stage][bisect.bisect_left(self.BUCKETS, seconds)] += 1
+        self.sums[stage] += seconds
+        self.counts[stage] += 1
+    
+    def increment(self, name: str, amount: int = 1):
+        """카운터 증가"""
+        self.counters[name] += amount
+    
+    def summary(self) -> dict:
+        """최근 표본 기준 단계별 백분위수(ms)와 카운터"""
+        stages = {}
+        for stage in self.STAGES:
+            values = sorted(self.recent[stage])
+            if not values:
+                continue
+            last = len(values) - 1
+            stages[stage] = {
+                'p50_ms': values[int(last * 0.5)] * 1000.0,
+                'p90_ms': values[int(last * 0.9)] * 1000.0,
+                'p99_ms': values[int(last * 0.99)] * 1000.0,
+                'max_ms': values[-1] * 1000.0,
+                'count': self.counts[stage],
+            }
+        
+        attempts = self.counters['cycles']
+        return {
+            'stages': stages,
+            **self.counters,
+            'capture_failure_rate': self.counters['capture_failures'] / attempts if attempts else 0.0,
+            'uptime': time.time() - self.started_at,
+        }
+    
+    def render_prometheus(self) -> str:
+        """Prometheus 텍스트 형식으로 출력"""
+        lines = [
+            "# HELP patient_monitor_stage_seconds Time spent in each monitoring cycle stage.",
+            "# TYPE patient_monitor_stage_seconds histogram",
+        ]
+        for stage in self.STAGES:
+            cumulative = 0
+            for bound, count in zip(self.BUCKETS + ('+Inf',), self.bucket_counts[stage]):
+                cumulative += count
+                lines.append(f'patient_monitor_stage_seconds_bucket{{stage="{stage}",le="{bound}"}} {cumulative}')
+            lines.append(f'patient_monitor_stage_seconds_sum{{stage="{stage}"}} {self.sums[stage]:.6f}')
+            lines.append(f'patient_monitor_stage_seconds_count{{stage="{stage}"}} {self.counts[stage]}')
+        
+        lines.append("# HELP patient_monitor_stage_recent_seconds Quantiles over the most recent samples.")
+        lines.append("# TYPE patient_monitor_stage_recent_seconds gauge")
+        for stage, stats in self.summary()['stages'].items():
+            for quantile, key in (('0.5', 'p50_ms'), ('0.9', 'p90_ms'), ('0.99', 'p99_ms')):
+                lines.append(f'patient_monitor_stage_recent_seconds{{stage="{stage}",quantile="{quantile}"}} '
+                             f'{stats[key] / 1000.0:.6f}')
+        
+        for name in self.COUNTERS:
+            lines.append(f"# TYPE patient_monitor_{name}_total counter")
+            lines.append(f"patient_monitor_{name}_total {self.counters[name]}")
+        
+        lines.append("# TYPE patient_monitor_start_time_seconds gauge")
+        lines.append(f"patient_monitor_start_time_seconds {self.started_at:.0f}")
+        return "\n".join(lines) + "\n"
+
+class MetricsServer:
+    """로컬 전용 통계 엔드포인트 - http://127.0.0.1:<metrics_port>/metrics"""
+    
+    def __init__(self, metrics: CycleMetrics, port: int, host: str = '127.0.0.1'):
+        self.metrics = metrics
+        self.port = port
+        self.host = host
+        self.server = None
+        self.thread = None
+    
+    def start(self) -> bool:
+        """백그라운드 스레드에서 HTTP 서버 시작 (포트 사용 중이면 False)"""
+        # 엔드포인트를 켤 때만 필요하므로 여기서 import
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        
+        metrics = self.metrics
+        
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] not in ('/', '/metrics'):
+                    self.send_error(404)
+                    return
+                body = metrics.render_prometheus().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
             
+            def log_message(self, format, *args):
+                # 수집 요청마다 로그를 남기지 않음
+                pass
+        
+        try:
+            self.server = ThreadingHTTPServer((self.host, self.port), Handler)
+        except OSError as e:
+            logger.error(f"통계 엔드포인트 시작 실패 ({self.host}:{self.port}): {e}")
+            return False
+        
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(target=self.server.serve_forever, name="MetricsServer", daemon=True)
+        self.thread.start()
+        logger.info(f"📊 통계 엔드포인트: http://{self.host}:{self.port}/metrics")
+        return True
+    
+    def stop(self):
+        """HTTP 서버 종료"""
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+        self.thread = None
+
+class EventHistoryStore:
+    """감지 이벤트 기록 - 로컬 SQLite DB(WAL 모드)에 백그라운드 스레드가 묶음으로 저장
+    
+    모니터 스레드는 record()로 큐에 넣기만 하고, 쓰기 스레드가 batch_size개 또는 flush_interval초마다
+    한 트랜잭션으로 저장합니다. 조회는 호출한 스레드에서 별도 읽기 전용 연결로 읽으므로 쓰기와 동시에 가능합니다.
+    """
+    
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS events (
+            id INTEGER PRIMARY KEY,
+            ts REAL NOT NULL,
+            region TEXT NOT NULL,
+            change_number INTEGER,
+            change_ratio REAL,
+            changed_pixels INTEGER,
+            thumbnail BLOB
+        );
+        CREATE INDEX IF NOT EXISTS idx_events_ts ON events (ts);
+        CREATE INDEX IF NOT EXISTS idx_events_region_ts ON events (region, ts);
+    """
+    THUMBNAIL_WIDTH = 160
+    
+    def __init__(self, path: str = 'event_history.db', thumbnails: bool = False, batch_size: int = 100,
+                 flush_interval: float = 1.0, max_pending: int = 10000):
+        self.path = path
+        self.thumbnails = thumbnails
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.events = queue.Queue(maxsize=max_pending)
+        self.worker = None
+        self.written_count = 0
+        self.dropped_count = 0
+    
+    def start(self):
+        """쓰기 스레드 시작"""
+        if self.worker is None:
+            self.worker = threading.Thread(target=self._run, name="EventHistory", daemon=True)
+            self.worker.start()
+    
+    def stop(self, timeout: float = 5.0):
+        """남은 이벤트를 저장한 뒤 쓰기 스레드 종료 (쓰기가 막혀 있으면 timeout초 뒤 남은 이벤트를 버림)"""
+        if self.worker is None:
+            return
+        if self.worker.is_alive():
+            try:
+                self.events.put(None, timeout=timeout)
+            except queue.Full:
+                # 큐가 가득 찬 채 줄지 않으면(DB 잠김 등) 종료가 멈추지 않도록 남은 이벤트를 비우고 종료 신호를 넣음
+                dropped = self._drain()
+                self.dropped_count += dropped
+                logger.warning(f"이벤트 기록 종료 지연: 저장하지 못한 이벤트 {dropped}건 버림")
+                try:
+                    self.events.put_nowait(None)
+                except queue.Full:
+                    pass
+            self.worker.join(timeout=timeout)
+        self.worker = None
+    
+    def _drain(self) -> int:
+        """대기 중인 이벤트를 모두 버리고 버린 수 반환"""
+        dropped = 0
+        while True:
+            try:
+                self.events.get_nowait()
+            except queue.Empty:
+                return dropped
+            dropped += 1
+    
+    def record(self, region: str, change_ratio: Optional[float], changed_pixels: Optional[int],
+               change_number: Optional[int] = None, image: Optional[np.ndarray] = None,
+               timestamp: Optional[float] = None) -> bool:
+        """이벤트를 저장 대기열에 추가 - 모니터 스레드에서 호출되며 대기하지 않음 (가득 차면 버림)"""
+        if image is not None and self.thumbnails:
+            # 축소/인코딩은 쓰기 스레드에서 하므로 캡처 버퍼와 분리된 복사본만 넘김
+            image = image.copy()
+        else:
+            image = None
+        try:
+            self.events.put_nowait((timestamp or time.time(), region, change_number, change_ratio,
+                                    changed_pixels, image))
+            return True
+        except queue.Full:
+            self.dropped_count += 1
+            return False
+    
+    def _connect(self):
+        connection = sqlite3.connect(self.path, timeout=5)
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.execute('PRAGMA synchronous=NORMAL')
+        connection.executescript(self.SCHEMA)
+        return connection
+    
+    def _connect_readonly(self):
+        """조회용 읽기 전용 연결 (DB나 표가 아직 없으면 None)"""
+        if not os.path.exists(self.path):
+            return None
+        connection = sqlite3.connect(f"{pathlib.Path(os.path.abspath(self.path)).as_uri()}?mode=ro", uri=True, timeout=5)
+        if connection.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'events'").fetchone() is None:
+            connection.close()
+            return None
+        return connection
+    
+    def _encode_thumbnail(self, image: Optional[np.ndarray]) -> Optional[bytes]:
+        if image is None:
+            return None
+        try:
+            height, width = image.shape[:2]
+            if width > self.THUMBNAIL_WIDTH:
+                image = cv2.resize(image, (self.THUMBNAIL_WIDTH, max(1, height * self.THUMBNAIL_WIDTH // width)),
+                                   interpolation=cv2.INTER_AREA)
+            ok, encoded = cv2.imencode('.jpg', image, [cv2.IMWRITE_JPEG_QUALITY, 70])
+            return encoded.tobytes() if ok else None
         except Exception as e:
-            logger.error(f"알림 창 표시 실패: {e}")
+            logger.debug(f"축소 이미지 인코딩 실패: {e}")
+            return None
     
-    def show_patient_alert(self, count: int):
-        """대기환자 알림 (호환성 유지)"""
-        self.show_change_alert(count)
+    def _run(self):
+        try:
+            connection = self._connect()
+        except Exception as e:
+            logger.error(f"이벤트 기록 DB 열기 실패 ({self.path}): {e}")
+            return
+        
+        stopping = False
+        try:
+            while not stopping:
+                try:
+                    event = self.events.get(timeout=self.flush_interval)
+                except queue.Empty:
+                    continue
+                
+                # 첫 이벤트 이후 이미 쌓인 이벤트를 묶어서 한 트랜잭션으로 저장
+                batch = []
+                while event is not None:
+                    batch.append(event)
+                    if len(batch) >= self.batch_size:
+                        break
+                    try:
+                        event = self.events.get_nowait()
+                    except queue.Empty:
+                        break
+                if event is None:
+                    stopping = True
+                if not batch:
+                    continue
+                
+                rows = [(ts, region, number, ratio, pixels, self._encode_thumbnail(image))
+                        for ts, region, number, ratio, pixels, image in batch]
+                try:
+                    with connection:
+                        connection.executemany(
+                            'INSERT INTO events (ts, region, change_number, change_ratio, changed_pixels, thumbnail) '
+                            'VALUES (?, ?, ?, ?, ?, ?)', rows)
+                    self.written_count += len(rows)
+                except Exception as e:
+                    logger.error(f"이벤트 기록 실패 ({len(rows)}건): {e}")
+        finally:
+            connection.close()
+    
+    def query_events(self, start: Optional[float] = None, end: Optional[float] = None, region: Optional[str] = None,
+                     include_thumbnails: bool = False) -> List[dict]:
+        """기간([start, end), 유닉스 시각)과 영역으로 이벤트 조회 (시간순)"""
+        columns = 'ts, region, change_number, change_ratio, changed_pixels' + (', thumbnail' if include_thumbnails else '')
+        conditions, params = [], []
+        if region is not None:
+            conditions.append('region = ?')
+            params.append(region)
+        if start is not None:
+            conditions.append('ts >= ?')
+            params.append(start)
+        if end is not None:
+            conditions.append('ts < ?')
+            params.append(end)
+        sql = f'SELECT {columns} FROM events'
+        if conditions:
+            sql += ' WHERE ' + ' AND '.join(conditions)
+        sql += ' ORDER BY ts'
+        
+        connection = self._connect_readonly()
+        if connection is None:
+            return []
+        try:
+            connection.row_factory = sqlite3.Row
+            return [dict(row) for row in connection.execute(sql, params)]
+        finally:
+            connection.close()
+    
+    def daily_report(self, day: Optional[str] = None) -> dict:
+        """하루(YYYY-MM-DD, 기본값 오늘) 영역별 변화 건수, 평균 변화율, 시간대별 건수"""
+        start = datetime.strptime(day, '%Y-%m-%d') if day else datetime.now().replace(hour=0, minute=0, second=0,
+                                                                                        microsecond=0)
+        end = start + timedelta(days=1)
+        
+        rows = []
+        connection = self._connect_readonly()
+        if connection is not None:
+            try:
+                rows = connection.execute(
+                    "SELECT region, CAST(strftime('%H', ts, 'unixepoch', 'localtime') AS INTEGER) AS hour, "
+                    "COUNT(*), AVG(change_ratio) FROM events WHERE ts >= ? AND ts < ? "
+                    "GROUP BY region, hour ORDER BY region, hour",
+                    (start.timestamp(), end.timestamp())).fetchall()
+            finally:
+                connection.close()
+        
+        regions = {}
+        for region, hour, count, mean_ratio in rows:
+            entry = regions.setdefault(region, {'count': 0, 'ratio_sum': 0.0, 'hourly': [0] * 24})
+            entry['count'] += count
+            entry['ratio_sum'] += (mean_ratio or 0.0) * count
+            entry['hourly'][hour] = count
+        for entry in regions.values():
+            entry['mean_change_ratio'] = entry.pop('ratio_sum') / entry['count']
+            entry['peak_hour'] = max(range(24), key=lambda hour: entry['hourly'][hour])
+        
+        return {
+            'date': start.strftime('%Y-%m-%d'),
+            'total': sum(entry['count'] for entry in regions.values()),
+            'regions': regions,
+        }
+
+def print_daily_report(report: dict):
+    """일별 보고서를 콘솔에 출력"""
+    print(f"📅 {report['date']} 변화 감지 {report['total']}건")
+    for region, entry in report['regions'].items():
+        print(f"\n[{region}] {entry['count']}건, 평균 변화율 {entry['mean_change_ratio']:.3f}, "
+              f"가장 많은 시간대 {entry['peak_hour']:02d}시")
+        for hour, count in enumerate(entry['hourly']):
+            if count:
+                print(f"  {hour:02d}시 {count:4d}건 {'#' * min(count, 50)}")
+
+class AdaptivePollingScheduler:
+    """마감 시각 기반 캡처 스케줄러 - 작업 시간이 주기에 누적되지 않음
+    
+    변화 직후에는 최소 주기로 빠르게 확인하고, 기본 주기로 돌아온 뒤
+    idle_backoff_after 초 동안 변화가 없으면 최대 주기까지 점차 늘립니다.
+    """
+    
+    backoff_factor = 1.5
+    
+    def __init__(self, config_manager: ConfigManager):
+        self.config = config_manager
+        self.current_interval = self.base_interval
+        self.next_deadline = None
+        self.last_change_time = time.monotonic()
+        self.missed_deadlines = 0
+        self.cycles = 0
+    
+    @property
+    def base_interval(self) -> float:
+        return float(self.config.config.get('monitoring_interval', 2.0))
+    
+    def reset(self):
+        """스케줄 초기화 (모니터링 시작 시)"""
+        self.current_interval = self.base_interval
+        self.next_deadline = time.monotonic()
+        self.last_change_time = self.next_deadline
+        self.missed_deadlines = 0
+        self.cycles = 0
+    
+    def record_cycle(self, changed: bool):
+        """이번 주기 결과로 다음 주기 결정"""
+        self.cycles += 1
+        base = self.base_interval
+        
+        if not self.config.config.get('adaptive_polling', True):
+            self.current_interval = base
+            return
+        
+        min_interval = min(base, float(self.config.config.get('min_monitoring_interval', 0.5)))
+        max_interval = max(base, float(self.config.config.get('max_monitoring_interval', 10.0)))
+        now = time.monotonic()
+        
+        if changed:
+            self.last_change_time = now
+            self.current_interval = min_interval
+        elif now - self.last_change_time < float(self.config.config.get('idle_backoff_after', 300.0)):
+            # 변화 직후 빠른 주기에서 기본 주기로 복귀
+            self.current_interval = min(base, self.current_interval * self.backoff_factor)
+        else:
+            # 오랫동안 정적인 화면이면 최대 주기까지 점차 늘림
+            self.current_interval = min(max_interval, max(base, self.current_interval * self.backoff_factor))
+    
+    def wait(self, stop_event: threading.Event) -> bool:
+        """다음 마감 시각까지 대기 (중지 요청 시 False)"""
+        now = time.monotonic()
+        if self.next_deadline is None:
+            self.next_deadline = now
+        
+        deadline = self.next_deadline + self.current_interval
+        if deadline < now:
+            # 마감을 놓친 경우 밀린 주기를 몰아서 실행하지 않고 지금부터 다시 시작
+            self.missed_deadlines += 1
+            if self.missed_deadlines == 1 or self.missed_deadlines % 100 == 0:
+                logger.warning(f"⏱️ 캡처 주기 초과 {now - deadline:.3f}초 (누적 {self.missed_deadlines}회)")
+            deadline = now
+        
+        self.next_deadline = deadline
+        return not stop_event.wait(deadline - now)
 
 class PatientQueueMonitor:
     """환자 대기열 모니터링 클래스 - 변화 감지 방식"""
     
-    def __init__(self, config_manager: ConfigManager):
+    def __init__(self, config_manager: ConfigManager, alert_dispatcher: Optional[AlertDispatcher] = None):
         self.config = config_manager
         self.screen_capture = ScreenCapture(config_manager)
         self.change_detector = ImageChangeDetector(config_manager)
-        self.notification_gui = NotificationGUI(config_manager)
+        # 디스패처가 주어지면 그 알림 GUI(미리 로드된 알림음 포함)를 공유 (헤드리스 디스패처는 GUI 없음)
+        self.notification_gui = alert_dispatcher.notification_gui if alert_dispatcher else NotificationGUI(config_manager)
+        
+        # 알림은 디스패처 큐로만 전달 (모니터 스레드가 팝업에 막히지 않도록)
+        self.alert_dispatcher = alert_dispatcher or AlertDispatcher(self.notification_gui)
         
         self.is_monitoring = False
         self.monitor_thread = None
         self.change_count = 0
+        self.stop_event = threading.Event()
+        self.scheduler = AdaptivePollingScheduler(config_manager)
+        
+        # 단계별 소요 시간 통계 (통계 패널, 로컬 HTTP 엔드포인트)
+        self.metrics = CycleMetrics()
+        self.alert_dispatcher.metrics = self.metrics
+        self.metrics_server = None
+        
+        # 감지 이벤트 기록 (모니터링 중에만 쓰기 스레드 실행, 녹화 재생은 기록하지 않음)
+        self.history = None
+        
+        # 변화 감지 시에만 대기 인원 수 OCR (Tesseract가 있고 ocr_enabled일 때)
+        self.ocr_reader = None
+        if self.config.config.get('ocr_enabled', False):
+            reader = WaitingCountReader(config_manager)
+            if reader.service.is_available():
+                self.ocr_reader = reader
+                self.ocr_reader.metrics = self.metrics
+                if reader.service.backend == 'cli':
+                    logger.warning("tesserocr가 없어 tesseract 실행 파일로 OCR합니다 - 영역마다 프로세스를 새로 띄우므로 "
+                                   "느립니다 (설치: pip install tesserocr)")
+            else:
+                logger.warning("Tesseract를 찾을 수 없어 대기 인원 OCR을 사용하지 않습니다.")
+        
+        # 다중 영역 (영역별 감지기)
+        self.regions: List[MonitoringRegion] = []
+        self.capture_bounds = None
+        self._regions_source = None
+        self.default_sensitivity = None
+        self.sync_regions()
+    
+    def sync_regions(self) -> bool:
+        """설정의 영역 목록이 바뀌었으면 영역별 감지기를 다시 구성"""
+        # 목록이 제자리에서 수정될 수 있으므로 직렬화한 값으로 비교
+        source = json.dumps([self.config.config.get('monitoring_regions'), self.config.config.get('monitoring_region')])
+        if source == self._regions_source:
+            return False
+        
+        self._regions_source = source
+        self.regions = [
+            MonitoringRegion(self.config, entry['label'], entry['region'], entry['sensitivity'])
+            for entry in get_monitoring_regions(self.config.config)
+        ]
+        for region in self.regions:
+            region.detector.metrics = self.metrics
+        if self.default_sensitivity is not None:
+            for region in self.regions:
+                if region.sensitivity is None:
+                    region.detector.set_sensitivity(self.default_sensitivity)
+        
+        if self.regions:
+            # 기존 단일 영역 API 호환용
+            self.change_detector = self.regions[0].detector
+            self.capture_bounds = get_bounding_region([region.region for region in self.regions])
+            logger.info(f"모니터링 영역 {len(self.regions)}개 구성, 공통 캡처 영역: {self.capture_bounds}")
+        else:
+            self.capture_bounds = None
+        return True
         
     def detect_change(self, image: np.ndarray) -> bool:
         """변화 감지"""
@@ -703,47 +3434,243 @@ class PatientQueueMonitor:
         
         return False
     
+    def process_frame(self, frame: np.ndarray, origin: Optional[Tuple[int, int]] = None) -> List[MonitoringRegion]:
+        """공통 캡처 이미지 한 장으로 모든 영역의 변화 감지 후 알림 등록"""
+        origin = origin or self.capture_bounds[:2]
+        changed_regions = []
+        first_crops = []
+        started_at = time.perf_counter()
+        
+        for region in self.regions:
+            crop = region.crop(frame, origin)
+            first_frame = region.detector.previous_image is None
+            if region.detector.detect_change(crop):
+                region.change_count += 1
+                self.change_count += 1
+                changed_regions.append(region)
+                logger.info(f"📈 영역 변화 #{self.change_count} 감지됨! ({region.label})")
+                self.record_history(region, crop)
+            elif first_frame and self.ocr_reader is not None:
+                first_crops.append((region.label, crop))
+        
+        if first_crops:
+            # 모든 영역의 기준 인원 수를 한 묶음으로 미리 읽음
+            self.ocr_reader.prime(first_crops)
+        
+        detected_at = time.perf_counter()
+        self.metrics.observe('detect', detected_at - started_at)
+        
+        if changed_regions:
+            detail = self.describe_changes(changed_regions)
+            self.alert_dispatcher.submit(self.change_count, detail, started_at)
+            # 인원 수는 OCR이 끝나면 이미 띄운 알림에 덧붙임 (알림과 알림음은 OCR을 기다리지 않음)
+            if self.ocr_reader is not None:
+                self.ocr_reader.submit(self.change_count, detail, started_at,
+                                       [(region.label, region.crop(frame, origin)) for region in changed_regions],
+                                       self.alert_dispatcher.update_detail)
+            self.metrics.observe('alert', time.perf_counter() - detected_at)
+            self.metrics.increment('changes', len(changed_regions))
+        
+        return changed_regions
+    
+    def record_history(self, region: MonitoringRegion, crop: Optional[np.ndarray] = None):
+        """변화 이벤트를 기록 DB 대기열에 추가 (기록이 꺼져 있으면 무시)"""
+        if self.history is None:
+            return
+        info = region.detector.last_change_info or {}
+        self.history.record(region.label, info.get('change_ratio'), info.get('changed_pixels'),
+                            self.change_count, crop)
+    
+    def describe_changes(self, changed_regions: List[MonitoringRegion]) -> Optional[str]:
+        """알림에 표시할 변화 위치 설명 (영역 이름, 타일 격자 사용 시 변화한 행)"""
+        parts = []
+        for region in changed_regions:
+            text = region.label if len(self.regions) > 1 else ""
+            info = region.detector.last_change_info or {}
+            if info.get('changed_rows') and region.detector.tile_grid and region.detector.tile_grid[0] > 1:
+                rows = ", ".join(str(row + 1) for row in info['changed_rows'])
+                text = f"{text} {rows}행".strip()
+            if text:
+                parts.append(text)
+        return "변화 위치: " + " / ".join(parts) if parts else None
+    
     def run_continuous_monitoring(self):
         """연속 모니터링 실행"""
+        if self.config.config.get('pipeline_mode', False):
+            self.run_pipeline_monitoring()
+            return
+        
         logger.info("🔍 영역 변화 모니터링 시작")
         consecutive_failures = 0
         max_failures = 5
         
+        self.scheduler.reset()
+        recorder = None
+        
         while self.is_monitoring:
             try:
-                region = self.config.config.get('monitoring_region')
-                if not region:
+                self.sync_regions()
+                if not self.regions:
                     logger.warning("모니터링 영역이 설정되지 않았습니다.")
-                    time.sleep(5)
+                    self.stop_event.wait(5)
                     continue
                 
-                captured_image = self.screen_capture.capture_region(region)
+                # 모든 영역을 포함하는 사각형을 한 번만 캡처
+                cycle_start = time.perf_counter()
+                captured_image = self.screen_capture.capture_region(self.capture_bounds)
+                self.metrics.observe('capture', time.perf_counter() - cycle_start)
                 
                 if captured_image is not None:
-                    if self.detect_change(captured_image):
-                        self.notification_gui.show_change_alert(self.change_count)
+                    # 재현용 프레임 녹화 (설정이 켜져 있을 때만)
+                    if self.config.config.get('record_frames', False):
+                        if recorder is None:
+                            recorder = FrameRecorder(self.config.config.get('recording_file', 'frame_recording.pqmrec'),
+                                                     int(self.config.config.get('recording_max_mb', 64) * 1024 * 1024))
+                        recorder.record(captured_image, self.capture_bounds[:2])
+                    elif recorder is not None:
+                        recorder.close()
+                        recorder = None
+                    
+                    changed_regions = self.process_frame(captured_image)
+                    self.scheduler.record_cycle(bool(changed_regions))
                     
                     consecutive_failures = 0
                 else:
                     consecutive_failures += 1
-                    logger.debug(f"화면 캡처 실패 {consecutive_failures}/{max_failures}")
+                    self.metrics.increment('capture_failures')
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"화면 캡처 실패 {consecutive_failures}/{max_failures}")
                     
                     if consecutive_failures >= max_failures:
                         logger.warning("연속 화면 캡처 실패. 설정을 확인해주세요.")
                         consecutive_failures = 0
                 
-                time.sleep(self.config.config['monitoring_interval'])
+                self.metrics.observe('cycle', time.perf_counter() - cycle_start)
+                self.metrics.increment('cycles')
+                
+                # 작업 시간과 무관하게 마감 시각 기준으로 대기
+                missed_before = self.scheduler.missed_deadlines
+                self.scheduler.wait(self.stop_event)
+                if self.scheduler.missed_deadlines != missed_before:
+                    self.metrics.increment('cycle_overruns')
                 
             except Exception as e:
                 logger.error(f"모니터링 중 오류: {e}")
-                time.sleep(2)
+                self.stop_event.wait(2)
+        
+        # 캡처 컨텍스트는 모니터 스레드 소유이므로 여기서 정리
+        self.screen_capture.close()
+        if recorder is not None:
+            recorder.close()
+        self.log_monitoring_summary()
+    
+    def run_pipeline_monitoring(self):
+        """다중 프로세스 파이프라인으로 모니터링 (pipeline_mode)
+        
+        이 스레드는 주기마다 캡처만 요청하고, 감지 결과 처리와 알림은 파이프라인 수집 스레드가 맡습니다.
+        """
+        logger.info("🔍 영역 변화 모니터링 시작 (다중 프로세스 파이프라인)")
+        self.scheduler.reset()
+        pipeline = None
+        
+        try:
+            while self.is_monitoring:
+                try:
+                    # 영역 구성이 바뀌거나 작업 프로세스가 죽으면 파이프라인 재구성
+                    regions_changed = self.sync_regions()
+                    if pipeline is not None and (regions_changed or not pipeline.is_healthy()):
+                        if not regions_changed:
+                            logger.error("파이프라인 프로세스가 종료되어 다시 시작합니다.")
+                        pipeline.stop()
+                        pipeline = None
+                    
+                    if not self.regions:
+                        logger.warning("모니터링 영역이 설정되지 않았습니다.")
+                        self.stop_event.wait(5)
+                        continue
+                    
+                    if pipeline is None:
+                        pipeline = DetectionPipeline(self)
+                        pipeline.start()
+                    
+                    if not pipeline.request_capture():
+                        # 모든 슬롯이 아직 처리 중이면 이번 주기는 건너뜀 (요청이 쌓이지 않도록)
+                        self.metrics.increment('skipped_cycles')
+                    
+                    missed_before = self.scheduler.missed_deadlines
+                    self.scheduler.wait(self.stop_event)
+                    if self.scheduler.missed_deadlines != missed_before:
+                        self.metrics.increment('cycle_overruns')
+                    
+                except Exception as e:
+                    logger.error(f"모니터링 중 오류: {e}")
+                    self.stop_event.wait(2)
+        finally:
+            if pipeline is not None:
+                pipeline.stop()
+        
+        self.log_monitoring_summary()
+    
+    def log_monitoring_summary(self):
+        """모니터링 종료 시 주기/지문 통계 기록"""
+        logger.info(f"모니터링 종료: {self.scheduler.cycles}회 캡처, 주기 초과 {self.scheduler.missed_deadlines}회")
+        for region in self.regions:
+            stats = region.detector.get_fingerprint_stats()
+            logger.info(f"[{region.label}] 동일 프레임 생략 {stats['hits']}/{stats['checks']}회 ({stats['hit_rate']:.1%})")
+            cost = region.detector.engine.get_cost_stats()
+            logger.info(f"[{region.label}] 감지 엔진 {cost['engine']}: 프레임당 평균 {cost['mean_ms']:.2f}ms, "
+                        f"p99 {cost['p99_ms']:.2f}ms ({cost['frames']}프레임)")
+            if region.detector.suppressed_changes:
+                logger.info(f"[{region.label}] 확인되지 않은 일시적 변화 무시 {region.detector.suppressed_changes}회")
+            known_hits = region.detector.known_state_hits
+            if known_hits['alert'] or known_hits['ignore']:
+                logger.info(f"[{region.label}] 알려진 상태 재등장: 알림 {known_hits['alert']}회, 무시 {known_hits['ignore']}회")
+    
+    def replay_recording(self, path: str, realtime: bool = False) -> int:
+        """녹화 파일을 재생하며 변화 감지 (realtime=False이면 최대 속도)
+        
+        녹화 당시와 같은 영역 설정으로 알림이 재현되는지 확인할 때 사용하며, 감지된 변화 수를 반환합니다.
+        """
+        source = FrameReplaySource(path, realtime=realtime)
+        try:
+            self.sync_regions()
+            self.change_count = 0
+            for region in self.regions:
+                region.change_count = 0
+                region.detector.reset_baseline()
+            
+            logger.info(f"▶️ 녹화 재생 시작: {path} ({len(source)}프레임, {'실시간' if realtime else '최대 속도'})")
+            for _, frame in source.iter_frames():
+                self.process_frame(frame, source.origin)
+            logger.info(f"⏹️ 녹화 재생 완료: 변화 {self.change_count}회")
+            return self.change_count
+        finally:
+            source.close()
     
     def start_monitoring(self):
         """모니터링 시작"""
         if not self.is_monitoring:
             self.change_count = 0
-            self.change_detector.reset_baseline()
+            self.sync_regions()
+            for region in self.regions:
+                region.change_count = 0
+                region.detector.reset_baseline()
+            
+            self.alert_dispatcher.start()
+            
+            if self.config.config.get('history_enabled', True) and self.history is None:
+                self.history = EventHistoryStore(self.config.config.get('history_db', 'event_history.db'),
+                                                 thumbnails=self.config.config.get('history_thumbnails', False))
+                self.history.start()
+            
+            self.metrics.reset()
+            metrics_port = self.config.config.get('metrics_port')
+            if metrics_port and self.metrics_server is None:
+                self.metrics_server = MetricsServer(self.metrics, int(metrics_port))
+                if not self.metrics_server.start():
+                    self.metrics_server = None
             
+            self.stop_event.clear()
             self.is_monitoring = True
             self.monitor_thread = threading.Thread(target=self.run_continuous_monitoring)
             self.monitor_thread.daemon = True
@@ -752,12 +3679,361 @@ class PatientQueueMonitor:
     def stop_monitoring(self):
         """모니터링 중지"""
         self.is_monitoring = False
+        self.stop_event.set()
         if self.monitor_thread:
             self.monitor_thread.join(timeout=3)
+        if self.metrics_server is not None:
+            self.metrics_server.stop()
+            self.metrics_server = None
+        if self.ocr_reader is not None:
+            self.ocr_reader.shutdown()
+        if self.history is not None:
+            self.history.stop()
+            logger.info(f"🗂️ 이벤트 기록 {self.history.written_count}건 저장 ({self.history.path})")
+            self.history = None
+        if self.alert_dispatcher.owns_root:
+            self.alert_dispatcher.stop()
+    
+    def get_fingerprint_stats(self) -> dict:
+        """전체 영역의 동일 프레임 생략 통계"""
+        checks = sum(region.detector.fingerprint_checks for region in self.regions)
+        hits = sum(region.detector.fingerprint_hits for region in self.regions)
+        return {
+            'checks': checks,
+            'hits': hits,
+            'hit_rate': hits / checks if checks else 0.0,
+        }
     
     def set_change_sensitivity(self, threshold: float):
-        """변화 감지 감도 조정"""
-        self.change_detector.set_sensitivity(threshold)
+        """변화 감지 감도 조정 (영역별 민감도가 지정되지 않은 영역에 적용)"""
+        self.default_sensitivity = threshold
+        for region in self.regions:
+            if region.sensitivity is None:
+                region.detector.set_sensitivity(threshold)
+
+def pipeline_capture_process(config: dict, bounds: Tuple[int, int, int, int], shm_name: str, slot_count: int,
+                             request_queue, task_queues: list, result_queue, log_queue):
+    """캡처 프로세스 - 요청받은 공유 메모리 슬롯에 공통 캡처 영역을 기록하고 작업 프로세스에는 슬롯 번호만 전달"""
+    from multiprocessing import shared_memory
+    
+    # 터미널 Ctrl+C는 프로세스 그룹 전체에 전달되므로 무시하고 부모의 종료 요청(None)으로만 끝냄
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    setup_worker_logging(log_queue, config)
+    screen_capture = ScreenCapture(ConfigManager(initial_config=config))
+    shm = shared_memory.SharedMemory(name=shm_name)
+    frame_shape = (bounds[3], bounds[2], 3)
+    frame_bytes = bounds[3] * bounds[2] * 3
+    frames = [np.ndarray(frame_shape, dtype=np.uint8, buffer=shm.buf, offset=slot * frame_bytes)
+              for slot in range(slot_count)]
+    
+    try:
+        while True:
+            request = request_queue.get()
+            if request is None:
+                break
+            
+            slot, seq = request
+            started_at = time.perf_counter()
+            image = screen_capture.capture_region(bounds)
+            captured = image is not None and image.shape == frame_shape
+            if captured:
+                np.copyto(frames[slot], image)
+                for task_queue in task_queues:
+                    task_queue.put((slot, seq))
+            result_queue.put(('captured', slot, seq, captured, time.perf_counter() - started_at))
+    finally:
+        screen_capture.close()
+        # 공유 메모리를 닫기 전에 뷰를 먼저 해제해야 함
+        frames.clear()
+        shm.close()
+
+def pipeline_detector_process(worker_id: int, config: dict, regions: list, default_sensitivity: Optional[float],
+                              origin: Tuple[int, int], frame_shape: tuple, shm_name: str, slot_count: int,
+                              task_queue, result_queue, log_queue):
+    """감지 작업 프로세스 - 공유 메모리 슬롯의 프레임에서 맡은 영역들의 변화를 감지해 결과만 반환"""
+    from multiprocessing import shared_memory
+    
+    # 부모가 stop()으로 종료 요청을 보내고 마지막 통계를 받을 수 있도록 Ctrl+C 무시
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    setup_worker_logging(log_queue, config)
+    config_manager = ConfigManager(initial_config=config)
+    shm = shared_memory.SharedMemory(name=shm_name)
+    frame_bytes = frame_shape[0] * frame_shape[1] * frame_shape[2]
+    frames = [np.ndarray(frame_shape, dtype=np.uint8, buffer=shm.buf, offset=slot * frame_bytes)
+              for slot in range(slot_count)]
+    
+    # 감지기 단계 시간은 합계 차이로 부모에게 전달
+    stage_metrics = CycleMetrics(window=1)
+    monitored = []
+    for index, label, region, sensitivity in regions:
+        monitoring_region = MonitoringRegion(config_manager, label, region, sensitivity)
+        if sensitivity is None and default_sensitivity is not None:
+            monitoring_region.detector.set_sensitivity(default_sensitivity)
+        monitoring_region.detector.metrics = stage_metrics
+        monitored.append((index, monitoring_region))
+    
+    try:
+        while True:
+            task = task_queue.get()
+            if task is None:
+                break
+            
+            slot, seq = task
+            preprocess_before = stage_metrics.sums['preprocess']
+            calculate_before = stage_metrics.sums['calculate']
+            started_at = time.perf_counter()
+            changed = []
+            for index, monitoring_region in monitored:
+                if monitoring_region.detector.detect_change(monitoring_region.crop(frames[slot], origin)):
+                    changed.append((index, monitoring_region.detector.last_change_info))
+            timings = {
+                'detect': time.perf_counter() - started_at,
+                'preprocess': stage_metrics.sums['preprocess'] - preprocess_before,
+                'calculate': stage_metrics.sums['calculate'] - calculate_before,
+            }
+            result_queue.put(('detected', slot, seq, worker_id, changed, timings))
+        
+        # 종료 요약에 쓰도록 영역별 감지기 통계를 부모에게 전달
+        detector_stats = {
+            index: {
+                'fingerprint': (monitoring_region.detector.fingerprint_checks,
+                                monitoring_region.detector.fingerprint_hits),
+                'engine_cost': monitoring_region.detector.engine.get_cost_state(),
+                'suppressed_changes': monitoring_region.detector.suppressed_changes,
+                'known_state_hits': monitoring_region.detector.known_state_hits,
+            }
+            for index, monitoring_region in monitored
+        }
+        result_queue.put(('stats', worker_id, detector_stats))
+    finally:
+        frames.clear()
+        monitored.clear()
+        shm.close()
+
+class DetectionPipeline:
+    """다중 프로세스 감지 파이프라인 (pipeline_mode)
+    
+    캡처 프로세스 하나가 공통 캡처 영역을 공유 메모리 링의 빈 슬롯에 기록하고, 감지 작업 프로세스들은
+    슬롯 번호만 받아 자기 영역을 감지합니다 (프레임은 피클링하지 않음). 슬롯마다 남은 처리 수를 세어
+    캡처 결과와 모든 작업 프로세스의 결과가 돌아온 슬롯만 다시 캡처에 사용합니다.
+    """
+    
+    SLOTS = 3
+    
+    def __init__(self, monitor: PatientQueueMonitor):
+        self.monitor = monitor
+        self.config = monitor.config
+        self.metrics = monitor.metrics
+        self.regions = list(monitor.regions)
+        self.bounds = tuple(monitor.capture_bounds)
+        self.frame_shape = (self.bounds[3], self.bounds[2], 3)
+        
+        workers = int(self.config.config.get('pipeline_workers', 0) or 0)
+        if workers <= 0:
+            # 캡처 프로세스와 이 프로세스 몫으로 코어 하나는 남겨 둠
+            workers = max(1, (os.cpu_count() or 2) - 1)
+        self.worker_count = max(1, min(workers, len(self.regions)))
+        
+        self.lock = threading.Lock()
+        self.slot_pending = [0] * self.SLOTS
+        self.cycles = {}
+        self.seq = 0
+        self.consecutive_failures = 0
+        
+        self.shm = None
+        self.processes = []
+        self.collector = None
+        self.log_listener = None
+    
+    def start(self):
+        """공유 메모리, 큐, 캡처/작업 프로세스와 결과 수집 스레드 시작"""
+        from multiprocessing import shared_memory
+        
+        # 스레드가 있는 프로세스에서 fork하지 않도록 모든 플랫폼에서 spawn 사용
+        context = multiprocessing.get_context('spawn')
+        frame_bytes = self.frame_shape[0] * self.frame_shape[1] * self.frame_shape[2]
+        self.shm = shared_memory.SharedMemory(create=True, size=frame_bytes * self.SLOTS)
+        
+        self.log_queue = context.Queue()
+        self.log_listener = logging.handlers.QueueListener(self.log_queue, ProcessLogForwarder())
+        self.log_listener.start()
+        
+        self.result_queue = context.SimpleQueue()
+        self.request_queue = context.SimpleQueue()
+        self.task_queues = [context.SimpleQueue() for _ in range(self.worker_count)]
+        
+        config = dict(self.config.config)
+        assignments = [[] for _ in range(self.worker_count)]
+        for index, region in enumerate(self.regions):
+            assignments[index % self.worker_count].append((index, region.label, tuple(region.region), region.sensitivity))
+        
+        for worker_id, regions in enumerate(assignments):
+            self.processes.append(context.Process(
+                target=pipeline_detector_process,
+                args=(worker_id, config, regions, self.monitor.default_sensitivity, self.bounds[:2], self.frame_shape,
+                      self.shm.name, self.SLOTS, self.task_queues[worker_id], self.result_queue, self.log_queue),
+                name=f"PQM-Detector-{worker_id}",
+                daemon=True,
+            ))
+        self.processes.append(context.Process(
+            target=pipeline_capture_process,
+            args=(config, self.bounds, self.shm.name, self.SLOTS, self.request_queue, self.task_queues,
+                  self.result_queue, self.log_queue),
+            name="PQM-Capture",
+            daemon=True,
+        ))
+        for process in self.processes:
+            process.start()
+        
+        self.collector = threading.Thread(target=self._collect_results, name="PipelineCollector", daemon=True)
+        self.collector.start()
+        logger.info(f"⚙️ 감지 파이프라인 시작: 작업 프로세스 {self.worker_count}개, 영역 {len(self.regions)}개, "
+                    f"공유 프레임 슬롯 {self.SLOTS}개 ({frame_bytes * self.SLOTS / 1024:.0f}KB)")
+    
+    def is_healthy(self) -> bool:
+        """모든 프로세스가 살아 있는지"""
+        return all(process.is_alive() for process in self.processes)
+    
+    def request_capture(self) -> bool:
+        """빈 슬롯에 캡처 요청 (모든 슬롯이 처리 중이면 False)"""
+        with self.lock:
+            for slot, pending in enumerate(self.slot_pending):
+                if pending == 0:
+                    break
+            else:
+                return False
+            
+            self.seq += 1
+            # 캡처 결과 1건 + 작업 프로세스별 감지 결과
+            self.slot_pending[slot] = self.worker_count + 1
+            self.cycles[slot] = {
+                'seq': self.seq,
+                'issued_at': time.perf_counter(),
+                'captured': False,
+                'changed': [],
+                'detect': 0.0,
+            }
+        self.request_queue.put((slot, self.seq))
+        return True
+    
+    def _collect_results(self):
+        """결과 큐를 읽어 슬롯별 처리 수를 갱신하고 끝난 주기를 마무리"""
+        while True:
+            message = self.result_queue.get()
+            if message is None:
+                break
+            
+            try:
+                kind = message[0]
+                finished = None
+                
+                if kind == 'captured':
+                    _, slot, seq, captured, seconds = message
+                    self.metrics.observe('capture', seconds)
+                    with self.lock:
+                        cycle = self.cycles[slot]
+                        cycle['captured'] = captured
+                        # 캡처 실패 시 작업 프로세스에는 전달되지 않으므로 바로 마무리
+                        self.slot_pending[slot] = self.slot_pending[slot] - 1 if captured else 0
+                        if self.slot_pending[slot] == 0:
+                            finished = self.cycles.pop(slot)
+                
+                elif kind == 'detected':
+                    _, slot, seq, worker_id, changed, timings = message
+                    if timings['preprocess']:
+                        self.metrics.observe('preprocess', timings['preprocess'])
+                    if timings['calculate']:
+                        self.metrics.observe('calculate', timings['calculate'])
+                    with self.lock:
+                        cycle = self.cycles[slot]
+                        cycle['changed'].extend(changed)
+                        cycle['detect'] = max(cycle['detect'], timings['detect'])
+                        self.slot_pending[slot] -= 1
+                        if self.slot_pending[slot] == 0:
+                            finished = self.cycles.pop(slot)
+                
+                elif kind == 'stats':
+                    _, worker_id, detector_stats = message
+                    for index, stats in detector_stats.items():
+                        detector = self.regions[index].detector
+                        detector.fingerprint_checks, detector.fingerprint_hits = stats['fingerprint']
+                        detector.engine.set_cost_state(stats['engine_cost'])
+                        detector.suppressed_changes = stats['suppressed_changes']
+                        detector.known_state_hits = stats['known_state_hits']
+                
+                if finished is not None:
+                    self._finish_cycle(finished)
+            
+            except Exception as e:
+                logger.error(f"파이프라인 결과 처리 실패: {e}")
+    
+    def _finish_cycle(self, cycle: dict):
+        """한 주기의 모든 결과가 모이면 변화 수 갱신, 알림 등록, 다음 주기 결정"""
+        monitor = self.monitor
+        
+        if not cycle['captured']:
+            self.metrics.increment('capture_failures')
+            self.consecutive_failures += 1
+            if self.consecutive_failures >= 5:
+                logger.warning("연속 화면 캡처 실패. 설정을 확인해주세요.")
+                self.consecutive_failures = 0
+        else:
+            self.consecutive_failures = 0
+            self.metrics.observe('detect', cycle['detect'])
+            
+            changed_regions = []
+            for index, change_info in sorted(cycle['changed'], key=lambda item: item[0]):
+                region = self.regions[index]
+                region.detector.last_change_info = change_info
+                region.change_count += 1
+                monitor.change_count += 1
+                changed_regions.append(region)
+                logger.info(f"📈 영역 변화 #{monitor.change_count} 감지됨! ({region.label})")
+                monitor.record_history(region)
+            
+            if changed_regions:
+                alert_start = time.perf_counter()
+                monitor.alert_dispatcher.submit(monitor.change_count, monitor.describe_changes(changed_regions),
+                                                cycle['issued_at'])
+                self.metrics.observe('alert', time.perf_counter() - alert_start)
+                self.metrics.increment('changes', len(changed_regions))
+            monitor.scheduler.record_cycle(bool(changed_regions))
+        
+        self.metrics.observe('cycle', time.perf_counter() - cycle['issued_at'])
+        self.metrics.increment('cycles')
+    
+    def stop(self):
+        """프로세스 종료, 남은 결과 처리, 공유 메모리 해제"""
+        try:
+            self.request_queue.put(None)
+            for task_queue in self.task_queues:
+                task_queue.put(None)
+        except Exception as e:
+            logger.debug(f"파이프라인 종료 요청 실패: {e}")
+        
+        for process in self.processes:
+            process.join(timeout=3)
+            if process.is_alive():
+                logger.warning(f"{process.name} 프로세스가 응답하지 않아 강제 종료합니다.")
+                process.terminate()
+                process.join(timeout=1)
+        self.processes = []
+        
+        # 작업 프로세스가 마지막으로 보낸 결과/통계까지 처리한 뒤 수집 스레드 종료
+        if self.collector is not None:
+            self.result_queue.put(None)
+            self.collector.join(timeout=3)
+            self.collector = None
+        
+        if self.log_listener is not None:
+            self.log_listener.stop()
+            self.log_listener = None
+        
+        if self.shm is not None:
+            self.shm.close()
+            self.shm.unlink()
+            self.shm = None
+        logger.info("⚙️ 감지 파이프라인 종료")
 
 class CalibrationTool:
     """초기 설정 및 보정 도구"""
@@ -766,6 +4042,8 @@ class CalibrationTool:
         self.config = config_manager
         self.screen_capture = ScreenCapture(config_manager)
         self.region_selector = ScreenRegionSelector()
+        self.notification_gui = NotificationGUI(config_manager)
+        self.alert_dispatcher = AlertDispatcher(self.notification_gui)
         self.root = None
         self.monitor = None
         
@@ -776,6 +4054,9 @@ class CalibrationTool:
         self.root.geometry("500x750")
         self.root.resizable(True, True)
         
+        # 알림은 이 창의 이벤트 루프에서 표시
+        self.alert_dispatcher.attach(self.root)
+        
         # 스크롤 가능한 메인 프레임 생성
         main_canvas = tk.Canvas(self.root)
         scrollbar = tk.Scrollbar(self.root, orient="vertical", command=main_canvas.yview)
@@ -840,6 +4121,42 @@ class CalibrationTool:
         )
         manual_button.pack(pady=5, fill='x')
         
+        # 다중 영역 추가/초기화 버튼
+        add_region_button = tk.Button(
+            button_frame,
+            text="➕ 감시 영역 추가 (다중 영역)",
+            command=lambda: self.manual_select_region(append=True),
+            font=('맑은 고딕', 10),
+            bg='#4a90e2',
+            fg='white',
+            padx=20,
+            pady=5,
+            relief='flat'
+        )
+        add_region_button.pack(pady=5, fill='x')
+        
+        clear_regions_button = tk.Button(
+            button_frame,
+            text="🗑️ 추가 영역 초기화",
+            command=self.clear_regions,
+            font=('맑은 고딕', 10),
+            padx=20,
+            pady=3,
+            relief='flat'
+        )
+        clear_regions_button.pack(pady=(0, 5), fill='x')
+        
+        ignore_state_button = tk.Button(
+            button_frame,
+            text="🙈 현재 화면 상태 무시",
+            command=self.ignore_current_state,
+            font=('맑은 고딕', 10),
+            padx=20,
+            pady=3,
+            relief='flat'
+        )
+        ignore_state_button.pack(pady=(0, 5), fill='x')
+        
         # 현재 설정 표시
         self.status_label = tk.Label(
             region_frame,
@@ -926,6 +4243,17 @@ class CalibrationTool:
         )
         debug_check.pack(anchor='w', pady=5)
         
+        # 프레임 녹화 (오탐/미탐 재현용)
+        self.record_var = tk.BooleanVar(value=self.config.config.get('record_frames', False))
+        record_check = tk.Checkbutton(
+            advanced_frame,
+            text="프레임 녹화 (알림 문제 재현용)",
+            variable=self.record_var,
+            command=self.toggle_recording,
+            font=('맑은 고딕', 10)
+        )
+        record_check.pack(anchor='w', pady=(0, 5))
+        
         # 테스트 및 실행 버튼 섹션
         control_frame = tk.LabelFrame(main_frame, text="테스트 및 실행", font=('맑은 고딕', 10), pady=10)
         control_frame.pack(fill='x', pady=(0, 20))
@@ -958,6 +4286,21 @@ class CalibrationTool:
         )
         start_button.pack(fill='x', pady=(0, 5))
         
+        # 실시간 통계 섹션 (단계별 소요 시간, 주기 초과, 캡처 실패율)
+        stats_frame = tk.LabelFrame(main_frame, text="실시간 통계", font=('맑은 고딕', 10), pady=10)
+        stats_frame.pack(fill='x', pady=(0, 20))
+        
+        self.stats_label = tk.Label(
+            stats_frame,
+            text="",
+            font=('맑은 고딕', 9),
+            fg='gray',
+            justify='left',
+            anchor='w'
+        )
+        self.stats_label.pack(fill='x', padx=10)
+        self.refresh_stats_panel()
+        
         # 종료 시 정리
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
         
@@ -974,20 +4317,18 @@ class CalibrationTool:
     
     def check_system_status(self, parent_frame):
         """시스템 상태 확인 및 표시"""
-        # Tesseract 상태
-        tesseract_status, tesseract_msg = TesseractSetup.check_tesseract_installation()
-        
+        # Tesseract 상태 (외부 프로세스 실행이 필요하므로 창을 띄운 뒤 백그라운드에서 확인)
         tesseract_frame = tk.Frame(parent_frame)
         tesseract_frame.pack(fill='x', pady=2)
         
-        tesseract_icon = "✅" if tesseract_status else "❌"
         tesseract_label = tk.Label(
             tesseract_frame,
-            text=f"{tesseract_icon} Tesseract OCR: {tesseract_msg}",
+            text="⏳ Tesseract OCR: 확인 중...",
             font=('맑은 고딕', 9),
             anchor='w'
         )
         tesseract_label.pack(side='left', fill='x', expand=True)
+        self.probe_tesseract_in_background(tesseract_label)
         
         # PyAutoGUI 상태
         pyautogui_frame = tk.Frame(parent_frame)
@@ -1033,16 +4374,131 @@ class CalibrationTool:
         )
         sound_label.pack(side='left', fill='x', expand=True)
     
+    def probe_tesseract_in_background(self, label):
+        """Tesseract 설치 확인을 백그라운드 스레드에서 실행하고 결과를 라벨에 반영"""
+        results = queue.Queue()
+        
+        def probe():
+            results.put(TesseractSetup.check_tesseract_installation())
+        
+        def poll():
+            try:
+                tesseract_status, tesseract_msg = results.get_nowait()
+            except queue.Empty:
+                self.root.after(200, poll)
+                return
+            tesseract_icon = "✅" if tesseract_status else "❌"
+            if label.winfo_exists():
+                label.config(text=f"{tesseract_icon} Tesseract OCR: {tesseract_msg}")
+        
+        threading.Thread(target=probe, name="TesseractProbe", daemon=True).start()
+        self.root.after(200, poll)
+    
+    def refresh_stats_panel(self):
+        """통계 패널 갱신 (1초마다)"""
+        if self.root is None or not hasattr(self, 'stats_label'):
+            return
+        
+        if self.monitor is None or not self.monitor.is_monitoring:
+            text = "모니터링 중이 아닙니다."
+        else:
+            stats = self.monitor.metrics.summary()
+            lines = [
+                f"캡처 {stats['cycles']}회 · 변화 {stats['changes']}회 · 주기 초과 {stats['cycle_overruns']}회 · "
+                f"캡처 실패율 {stats['capture_failure_rate']:.1%}"
+            ]
+            for stage, values in stats['stages'].items():
+                lines.append(f"{CycleMetrics.STAGE_LABELS[stage]}: p50 {values['p50_ms']:.1f}ms · "
+                             f"p99 {values['p99_ms']:.1f}ms · 최대 {values['max_ms']:.1f}ms")
+            if stats['alerts_dropped']:
+                lines.append(f"버려진 알림: {stats['alerts_dropped']}건")
+            text = "\n".join(lines)
+        
+        try:
+            self.stats_label.config(text=text)
+            self.root.after(1000, self.refresh_stats_panel)
+        except Exception:
+            # 창이 닫힌 뒤에는 갱신 중지
+            pass
+    
     def update_status_display(self):
         """현재 설정 상태 표시 업데이트"""
-        current_region = self.config.config.get('monitoring_region')
-        if current_region:
-            x, y, w, h = current_region
+        regions = get_monitoring_regions(self.config.config)
+        if len(regions) > 1:
+            lines = [f"✅ 설정된 영역 {len(regions)}개"]
+            for entry in regions:
+                x, y, w, h = entry['region']
+                lines.append(f"{entry['label']}: 위치({x}, {y}) 크기({w}×{h})")
+            self.status_label.config(text="\n".join(lines), fg='green')
+        elif regions:
+            x, y, w, h = regions[0]['region']
             status_text = f"✅ 설정된 영역: 위치({x}, {y}) 크기({w}×{h})"
             self.status_label.config(text=status_text, fg='green')
         else:
             self.status_label.config(text="⚠️ 모니터링 영역이 설정되지 않았습니다", fg='red')
     
+    def clear_regions(self):
+        """추가한 다중 영역 초기화 (단일 영역 설정만 유지)"""
+        self.config.config['monitoring_regions'] = []
+        self.config.save_config()
+        self.update_status_display()
+    
+    def ignore_current_state(self):
+        """3초 뒤 현재 화면을 무시 상태로 등록 (툴팁, 행 강조처럼 반복해서 나타나는 화면)"""
+        if not get_monitoring_regions(self.config.config):
+            messagebox.showwarning("경고", "먼저 모니터링 영역을 설정해주세요.")
+            return
+        
+        messagebox.showinfo("현재 화면 상태 무시",
+                            "확인을 누르면 3초 뒤 감시 영역을 캡처합니다.\n"
+                            "무시할 화면(툴팁, 강조 표시 등)을 띄워 두세요.")
+        # 버튼을 누르는 동안 사라지는 툴팁도 잡을 수 있도록 창을 내린 뒤 캡처
+        self.root.iconify()
+        self.root.after(3000, self._capture_ignored_state)
+    
+    def _capture_ignored_state(self):
+        """감시 영역별 현재 상태 해시를 그 영역 라벨의 ignored_states에 추가하고 실행 중인 같은 영역 감지기에도 반영"""
+        self.root.deiconify()
+        try:
+            regions = get_monitoring_regions(self.config.config)
+            bounds = get_bounding_region([entry['region'] for entry in regions])
+            frame = self.screen_capture.capture_region(bounds)
+            if frame is None:
+                messagebox.showerror("오류", "화면 캡처에 실패했습니다.")
+                return
+            
+            ignored = self.config.config.get('ignored_states') or {}
+            if isinstance(ignored, dict):
+                ignored = {label: list(values) for label, values in ignored.items()}
+            else:
+                # 예전 목록 형식은 모든 영역에 적용되던 것이므로 현재 영역마다 옮겨 둠
+                ignored = {entry['label']: list(ignored) for entry in regions}
+            
+            added = 0
+            for entry in regions:
+                region = MonitoringRegion(self.config, entry['label'], entry['region'], entry['sensitivity'])
+                state_hash = region.detector.state_hash(region.crop(frame, bounds[:2]))
+                key = f"{state_hash:016x}"
+                keys = ignored.setdefault(entry['label'], [])
+                if key not in keys:
+                    keys.append(key)
+                    added += 1
+                
+                # 다른 영역의 화면 상태로 이 영역의 알림을 막지 않도록 같은 라벨의 감지기에만 반영
+                if self.monitor is not None:
+                    for running in self.monitor.regions:
+                        if running.label == entry['label']:
+                            running.detector.ignore_state(state_hash)
+            
+            total = sum(len(keys) for keys in ignored.values())
+            self.config.config['ignored_states'] = ignored
+            self.config.save_config()
+            logger.info(f"🙈 무시 상태 {added}개 추가 (총 {total}개)")
+            messagebox.showinfo("현재 화면 상태 무시", f"무시 상태 {added}개를 추가했습니다. (총 {total}개)")
+            
+        except Exception as e:
+            messagebox.showerror("오류", f"화면 상태 등록 중 오류가 발생했습니다:\n{str(e)}")
+    
     def update_sensitivity(self, value):
         """변화 감지 민감도 업데이트"""
         sensitivity = float(value)
@@ -1066,6 +4522,11 @@ class CalibrationTool:
         self.config.config['debug_mode'] = self.debug_var.get()
         self.config.save_config()
     
+    def toggle_recording(self):
+        """프레임 녹화 토글"""
+        self.config.config['record_frames'] = self.record_var.get()
+        self.config.save_config()
+    
     # 자동 영역 탐지 메서드 주석 처리 (요청사항 #1)
     """
     def auto_detect_region(self):
@@ -1107,8 +4568,8 @@ class CalibrationTool:
             messagebox.showerror("오류", f"자동 탐지 중 오류가 발생했습니다:\n{str(e)}")
     """
     
-    def manual_select_region(self):
-        """수동 영역 선택"""
+    def manual_select_region(self, append: bool = False):
+        """수동 영역 선택 (append=True이면 감시 영역 목록에 추가)"""
         try:
             messagebox.showinfo("안내", 
                 "화면이 반투명해지면 마우스로 드래그하여\n"
@@ -1118,12 +4579,12 @@ class CalibrationTool:
                 "- 선택 완료 후 자동으로 설정됩니다")
             
             self.root.iconify()
-            self.root.after(500, self._perform_region_selection)
+            self.root.after(500, lambda: self._perform_region_selection(append))
             
         except Exception as e:
             messagebox.showerror("오류", f"수동 선택 중 오류가 발생했습니다:\n{str(e)}")
     
-    def _perform_region_selection(self):
+    def _perform_region_selection(self, append: bool = False):
         """실제 영역 선택 수행"""
         try:
             region = self.region_selector.select_region()
@@ -1132,8 +4593,24 @@ class CalibrationTool:
             self.root.lift()
             self.root.focus_force()
             
-            if region:
+            if region and append:
+                regions = self.config.config.get('monitoring_regions') or []
+                if not regions and self.config.config.get('monitoring_region'):
+                    # 기존 단일 영역을 목록의 첫 영역으로 옮김
+                    regions = [{'label': '영역 1', 'region': list(self.config.config['monitoring_region'])}]
+                
+                default_label = f"영역 {len(regions) + 1}"
+                label = simpledialog.askstring("영역 이름", "영역 이름을 입력하세요 (예: 접수, 진료실, 검사실)",
+                                               initialvalue=default_label, parent=self.root)
+                regions.append({'label': label or default_label, 'region': list(region)})
+                self.config.config['monitoring_regions'] = regions
+                self.config.save_config()
+                self.update_status_display()
+                
+                messagebox.showinfo("✅ 영역 추가 성공", f"감시 영역이 {len(regions)}개로 설정되었습니다.")
+            elif region:
                 self.config.config['monitoring_region'] = region
+                self.config.config['monitoring_regions'] = []
                 self.config.save_config()
                 self.update_status_display()
                 
@@ -1154,10 +4631,11 @@ class CalibrationTool:
     def test_current_setup(self):
         """현재 설정 테스트 - 변화 감지 방식"""
         try:
-            region = self.config.config.get('monitoring_region')
-            if not region:
+            regions = get_monitoring_regions(self.config.config)
+            if not regions:
                 messagebox.showwarning("경고", "먼저 모니터링 영역을 설정해주세요.")
                 return
+            region = regions[0]['region']
             
             test_window = tk.Toplevel(self.root)
             test_window.title("변화 감지 테스트 중...")
@@ -1201,8 +4679,7 @@ class CalibrationTool:
                         if change_detector.detect_change(test_image):
                             log_to_widget(f"   🎉 변화 감지됨! ({i+1}초 시점)")
                             
-                            notification_gui = NotificationGUI(self.config)
-                            notification_gui.show_change_alert(1)
+                            self.notification_gui.show_change_alert(1, master=self.root)
                             
                             log_to_widget("   ✅ 알림 표시 성공")
                             log_to_widget("\n🎉 모든 테스트 통과!")
@@ -1227,15 +4704,14 @@ class CalibrationTool:
     def start_monitoring(self):
         """모니터링 시작"""
         try:
-            region = self.config.config.get('monitoring_region')
-            if not region:
+            if not get_monitoring_regions(self.config.config):
                 messagebox.showwarning("경고", "먼저 모니터링 영역을 설정해주세요.")
                 return
             
             if self.monitor:
                 self.monitor.stop_monitoring()
             
-            self.monitor = PatientQueueMonitor(self.config)
+            self.monitor = PatientQueueMonitor(self.config, self.alert_dispatcher)
             
             sensitivity = self.config.config.get('change_sensitivity', 0.05)
             self.monitor.set_change_sensitivity(sensitivity)
@@ -1258,12 +4734,92 @@ class CalibrationTool:
         try:
             if self.monitor:
                 self.monitor.stop_monitoring()
+            self.config.flush()
+            self.alert_dispatcher.stop()
+            self.notification_gui.close_all_alerts()
             self.root.destroy()
         except:
             pass
 
-def main():
+def run_headless(config_manager: ConfigManager, sinks: Optional[List[str]] = None,
+                 command: Optional[str] = None) -> int:
+    """설정 창 없이 모니터링 실행 - SIGINT/SIGTERM을 받으면 정리 후 종료"""
+    sinks = sinks or config_manager.config.get('alert_sinks') or ['log']
+    command = command or config_manager.config.get('alert_command')
+    
+    try:
+        dispatcher = HeadlessAlertDispatcher(sinks, command)
+    except ValueError as e:
+        logger.error(f"알림 설정 오류: {e}")
+        return 2
+    
+    monitor = PatientQueueMonitor(config_manager, dispatcher)
+    if not monitor.regions:
+        logger.error(f"모니터링 영역이 설정되지 않았습니다. 설정 창에서 영역을 먼저 선택하세요 ({config_manager.config_file})")
+        return 2
+    monitor.set_change_sensitivity(config_manager.config.get('change_sensitivity', 0.05))
+    
+    stop_requested = threading.Event()
+    
+    def handle_signal(signum, frame):
+        logger.info(f"종료 신호 수신 ({signal.Signals(signum).name}), 모니터링을 정리합니다")
+        stop_requested.set()
+    
+    signal.signal(signal.SIGINT, handle_signal)
+    signal.signal(signal.SIGTERM, handle_signal)
+    if hasattr(signal, 'SIGBREAK'):
+        # Windows 콘솔의 Ctrl+Break
+        signal.signal(signal.SIGBREAK, handle_signal)
+    
+    logger.info(f"🖥️ 헤드리스 모드 시작: 영역 {len(monitor.regions)}개, 알림 대상 {', '.join(dispatcher.sinks)}")
+    monitor.start_monitoring()
+    try:
+        # 신호 처리가 지연되지 않도록 짧게 나눠 대기
+        while not stop_requested.wait(1.0):
+            if not monitor.monitor_thread.is_alive():
+                logger.error("모니터 스레드가 종료되었습니다")
+                break
+    finally:
+        monitor.stop_monitoring()
+        dispatcher.stop()
+        config_manager.flush()
+    
+    logger.info("헤드리스 모드 종료")
+    return 0
+
+def parse_report_date(value: str) -> str:
+    """--report 날짜 인자 검사 (잘못된 날짜는 argparse 오류로 안내)"""
+    try:
+        datetime.strptime(value, '%Y-%m-%d')
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"날짜는 YYYY-MM-DD 형식이어야 합니다: {value!r}")
+    return value
+
+def main(argv: Optional[List[str]] = None):
     """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description="대기환자 모니터링 시스템")
+    parser.add_argument('--headless', action='store_true',
+                        help="설정 창 없이 백그라운드 서비스로 모니터링 (tkinter 미사용)")
+    parser.add_argument('--config', default='monitor_config.json', help="설정 파일 경로")
+    parser.add_argument('--alert-sink', action='append', choices=HeadlessAlertDispatcher.SINKS,
+                        help="헤드리스 모드 알림 대상 (여러 번 지정 가능, 기본값: 설정의 alert_sinks)")
+    parser.add_argument('--alert-command',
+                        help="command 알림 대상에서 실행할 명령 (PQM_CHANGE_NUMBER, PQM_DETAIL 환경 변수 전달)")
+    parser.add_argument('--report', nargs='?', const='', metavar='YYYY-MM-DD', type=parse_report_date,
+                        help="이벤트 기록 DB의 일별 보고서 출력 후 종료 (날짜 생략 시 오늘)")
+    args = parser.parse_args(argv)
+    
+    if args.report is not None:
+        config_manager = ConfigManager(args.config)
+        store = EventHistoryStore(config_manager.config.get('history_db', 'event_history.db'))
+        print_daily_report(store.daily_report(args.report or None))
+        return 0
+    
+    if args.headless:
+        config_manager = ConfigManager(args.config)
+        setup_logging(config_manager.config)
+        return run_headless(config_manager, args.alert_sink, args.alert_command)
+    
     try:
         # 의존성 체크
         missing_deps = []
@@ -1279,12 +4835,16 @@ def main():
             print("pip install opencv-python pillow pytesseract pyautogui pygame 명령으로 설치하세요.")
         
         # 설정 관리자 초기화
-        config_manager = ConfigManager()
+        config_manager = ConfigManager(args.config)
+        setup_logging(config_manager.config)
         
         # 보정 도구 실행
         calibration_tool = CalibrationTool(config_manager)
         calibration_tool.run_calibration_gui()
         
+        # 예약된 설정 저장 마무리
+        config_manager.flush()
+        
     except Exception as e:
         logger.error(f"프로그램 실행 중 오류: {e}")
         try:
@@ -1293,4 +4853,6 @@ def main():
             print(f"오류: {e}")
 
 if __name__ == "__main__":
-    main()
+    # PyInstaller 실행 파일에서 파이프라인 하위 프로세스 실행 지원
+    multiprocessing.freeze_support()
+    sys.exit(main())
@@ -0,0 +1,54 @@
+import os
+import sys
+
+import cv2
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import main_monitior
+from main_monitior import ConfigManager, ImageChangeDetector, SyntheticCaptureBackend
+
+REGION = (0, 0, 160, 128)
+
+
+@pytest.fixture(autouse=True, scope='session')
+def _log_to_tmp(tmp_path_factory):
+    """테스트 로그는 저장소 대신 임시 폴더에 기록"""
+    log_dir = tmp_path_factory.mktemp('logs')
+    main_monitior.setup_logging({'log_file': str(log_dir / 'patient_monitor.log')})
+    yield
+    main_monitior.shutdown_logging()
+
+
+@pytest.fixture
+def make_detector():
+    """설정 값을 덮어쓴 ImageChangeDetector 생성 함수"""
+    def factory(**config) -> ImageChangeDetector:
+        return ImageChangeDetector(ConfigManager(initial_config=config))
+    return factory
+
+
+@pytest.fixture
+def synthetic_state():
+    """SyntheticCaptureBackend가 state번째 상태에서 그리는 프레임 (대기열 행이 state개)"""
+    def factory(state: int, region=REGION) -> np.ndarray:
+        backend = SyntheticCaptureBackend(change_every=1)
+        frame = None
+        for _ in range(state + 1):
+            frame = backend.grab(region)
+        return frame.copy()
+    return factory
+
+
+@pytest.fixture
+def frame_folder(tmp_path):
+    """프레임을 파일 이름 순서대로 저장해 FileCaptureBackend 소스 폴더를 만드는 함수"""
+    def factory(frames, name='frames') -> str:
+        folder = tmp_path / name
+        folder.mkdir(exist_ok=True)
+        for index, frame in enumerate(frames):
+            cv2.imwrite(str(folder / f'{index:03d}.png'), frame)
+        return str(folder)
+    return factory
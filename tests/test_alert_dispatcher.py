@@ -0,0 +1,117 @@
+import threading
+
+import main_monitior
+from main_monitior import AlertDispatcher
+
+
+class FakeRoot:
+    """Tk 루트 대신 after() 예약만 기록 (화면 없이 폴링을 직접 실행)"""
+
+    def __init__(self):
+        self.scheduled = {}
+        self.next_id = 0
+
+    def after(self, ms, callback):
+        self.next_id += 1
+        self.scheduled[self.next_id] = callback
+        return self.next_id
+
+    def after_cancel(self, poll_id):
+        self.scheduled.pop(poll_id, None)
+
+    def run_pending(self):
+        pending, self.scheduled = self.scheduled, {}
+        for callback in pending.values():
+            callback()
+
+
+class FakeNotificationGUI:
+    def __init__(self):
+        self.shown = []
+        self.updates = []
+        self.sounds = 0
+
+    def play_alert_sound(self, triggered_at=None):
+        self.sounds += 1
+
+    def show_change_alert(self, change_number, master=None, detail=None, play_sound=True):
+        self.shown.append((change_number, detail))
+        return f'window-{change_number}'
+
+    def update_alert_detail(self, window, change_number, detail):
+        self.updates.append((window, change_number, detail))
+
+    def close_all_alerts(self):
+        pass
+
+
+def test_pending_alerts_are_coalesced_into_one_window():
+    gui, root = FakeNotificationGUI(), FakeRoot()
+    dispatcher = AlertDispatcher(gui)
+    dispatcher.attach(root)
+
+    for number in (1, 2, 3):
+        assert dispatcher.submit(number, detail=f'행 {number}')
+    root.run_pending()
+
+    # 알림음은 감지 즉시 세 번, 창은 최신 알림 하나에 나머지 건수를 덧붙여 표시
+    assert gui.sounds == 3
+    assert gui.shown == [(3, '행 3\n(표시 대기 중 추가 변화 2건)')]
+    assert len(root.scheduled) == 1
+
+
+def test_full_queue_keeps_latest_alerts():
+    gui, root = FakeNotificationGUI(), FakeRoot()
+    dispatcher = AlertDispatcher(gui, max_pending=2)
+    dispatcher.attach(root)
+
+    results = [dispatcher.submit(number) for number in (1, 2, 3)]
+    root.run_pending()
+
+    assert results == [True, True, False]
+    assert dispatcher.dropped_count == 1
+    assert gui.shown == [(3, '(표시 대기 중 추가 변화 1건)')]
+
+
+def test_detail_update_applies_to_active_alert_only():
+    gui, root = FakeNotificationGUI(), FakeRoot()
+    dispatcher = AlertDispatcher(gui)
+    dispatcher.attach(root)
+    dispatcher.submit(1)
+    root.run_pending()
+
+    dispatcher.update_detail(1, '3 → 4명 대기')
+    dispatcher.update_detail(7, '9명 대기')
+    root.run_pending()
+
+    assert gui.updates == [('window-1', 1, '3 → 4명 대기')]
+
+
+def test_attach_after_stop_keeps_single_poll_loop():
+    root = FakeRoot()
+    dispatcher = AlertDispatcher(FakeNotificationGUI())
+    dispatcher.attach(root)
+    dispatcher.attach(root)
+    dispatcher.stop()
+    dispatcher.attach(root)
+
+    assert len(root.scheduled) == 1
+    root.run_pending()
+    assert len(root.scheduled) == 1
+
+
+def test_start_off_main_thread_does_not_create_tk(monkeypatch):
+    class NoTk:
+        def Tk(self):
+            raise AssertionError("Tk created off the main thread")
+
+    monkeypatch.setattr(main_monitior, 'tk', NoTk())
+    gui = FakeNotificationGUI()
+    dispatcher = AlertDispatcher(gui)
+    thread = threading.Thread(target=dispatcher.start)
+    thread.start()
+    thread.join()
+
+    assert dispatcher.root is None and dispatcher.log_only
+    assert dispatcher.submit(5, detail='행 2')
+    assert gui.sounds == 1 and gui.shown == []
@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from main_monitior import FileCaptureBackend
+
+REGION = (0, 0, 160, 128)
+
+
+@pytest.fixture
+def gradient():
+    """가로 밝기 그라데이션 화면 (평활화 후에도 국소 밝기 변화가 드러남)"""
+    row = np.linspace(0, 255, REGION[2]).astype(np.uint8)
+    return np.dstack([np.tile(row, (REGION[3], 1))] * 3)
+
+
+def brighten(frame, amount):
+    frame = frame.copy()
+    patch = frame[40:100, 40:120].astype(np.int16) + amount
+    frame[40:100, 40:120] = np.clip(patch, 0, 255).astype(np.uint8)
+    return frame
+
+
+def changes(detector, frames):
+    return [index for index, frame in enumerate(frames) if detector.detect_change(frame)]
+
+
+def test_running_average_absorbs_gradual_drift(make_detector, gradient):
+    drift = [brighten(gradient, 3 * step) for step in range(40)]
+
+    # 스냅샷 기준은 누적된 밝기 변화를 여러 번 알리지만 이동 평균 배경은 흡수
+    assert changes(make_detector(), drift) != []
+    assert changes(make_detector(baseline_mode='running_average', background_alpha=0.2), drift) == []
+
+
+def test_running_average_still_detects_sudden_change(make_detector, gradient, synthetic_state):
+    detector = make_detector(baseline_mode='running_average', background_alpha=0.2)
+    frames = [brighten(gradient, step) for step in range(5)] + [synthetic_state(3)]
+
+    assert changes(detector, frames) == [5]
+    # 변화가 확정되면 배경을 새 화면으로 다시 시작
+    assert np.array_equal(detector.previous_image, detector.preprocess_for_comparison(synthetic_state(3)))
+
+
+def test_confirm_ring_ignores_single_frame_flicker(make_detector, synthetic_state, frame_folder, caplog):
+    state_a, state_b = synthetic_state(0), synthetic_state(2)
+    backend = FileCaptureBackend(frame_folder([state_a, state_b, state_a, state_a, state_b, state_b]))
+    detector = make_detector(confirm_frames=2)
+
+    caplog.set_level('INFO', logger='main_monitior')
+    assert changes(detector, [backend.grab(REGION) for _ in range(6)]) == [5]
+    assert detector.suppressed_changes == 1
+    # 확인을 통과한 변화만 "변화 감지됨"으로 기록
+    assert sum('변화 감지됨' in record.getMessage() for record in caplog.records) == 1
+
+
+def test_confirm_ring_counts_repeated_identical_frames(make_detector, synthetic_state):
+    detector = make_detector(confirm_frames=3)
+    detector.detect_change(synthetic_state(0))
+    changed = synthetic_state(1)
+
+    # 지문이 같은 프레임도 확인 중에는 비교해 연속 횟수에 포함
+    assert [detector.detect_change(changed) for _ in range(4)] == [False, False, True, False]
+    assert not detector.confirmation_pending
@@ -0,0 +1,17 @@
+import json
+import os
+import subprocess
+import sys
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_stdout_report_is_valid_json(tmp_path):
+    # 선택 라이브러리가 없을 때의 안내 메시지가 stdout 결과 JSON에 섞이지 않아야 함
+    result = subprocess.run(
+        [sys.executable, os.path.join(PROJECT_DIR, 'benchmark_detector.py'),
+         '--sizes', '64x32', '--frames', '4', '--warmup', '1'],
+        cwd=tmp_path, capture_output=True, text=True, check=True, timeout=120)
+
+    report = json.loads(result.stdout)
+    assert [(entry['sequence'], entry['frames']) for entry in report['results']] == [('synthetic-64x32', 4)]
@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from conftest import REGION
+from main_monitior import (
+    ConfigManager,
+    FileCaptureBackend,
+    ScreenCapture,
+    SyntheticCaptureBackend,
+    create_capture_backend,
+)
+
+
+def test_file_backend_cycles_frames_and_crops(frame_folder, synthetic_state):
+    source = frame_folder([synthetic_state(0, (0, 0, 64, 48)), synthetic_state(1, (0, 0, 64, 48))])
+    backend = FileCaptureBackend(source)
+
+    crops = [backend.grab((8, 4, 32, 16)) for _ in range(3)]
+
+    assert [crop.shape for crop in crops] == [(16, 32, 3)] * 3
+    # 0, 1번 파일 다음에는 다시 0번 파일 (잘라낸 영역은 원본 프레임의 뷰)
+    assert np.array_equal(crops[0], crops[2])
+    assert not np.array_equal(crops[0], crops[1])
+    assert crops[0].base is backend.frames[0]
+
+
+def test_file_backend_rejects_missing_source(tmp_path):
+    with pytest.raises(RuntimeError):
+        FileCaptureBackend(str(tmp_path / 'missing'))
+
+
+def test_synthetic_backend_changes_every_n_frames():
+    backend = SyntheticCaptureBackend(change_every=2)
+
+    frames = [backend.grab(REGION).copy() for _ in range(5)]
+
+    assert backend.state == 2
+    assert np.array_equal(frames[0], frames[1])
+    assert not np.array_equal(frames[1], frames[2])
+    assert np.array_equal(frames[2], frames[3])
+    assert frames[0].shape == (REGION[3], REGION[2], 3)
+
+
+def test_config_selects_backend(frame_folder, synthetic_state):
+    source = frame_folder([synthetic_state(0)])
+
+    assert isinstance(create_capture_backend({'capture_backend': 'file', 'capture_source': source}),
+                      FileCaptureBackend)
+
+    capture = ScreenCapture(ConfigManager(initial_config={'capture_backend': 'synthetic'}))
+    try:
+        assert capture.capture_region(REGION).shape == (REGION[3], REGION[2], 3)
+        assert capture.get_backend().name == 'synthetic'
+    finally:
+        capture.close()
@@ -0,0 +1,55 @@
+import json
+import threading
+import time
+
+from main_monitior import ConfigManager
+
+
+def counting_writer(manager, monkeypatch):
+    """_write_file 호출을 기록하고 첫 쓰기를 알리는 Event 반환"""
+    writes = []
+    written = threading.Event()
+    original_write = manager._write_file
+
+    def write(text):
+        original_write(text)
+        writes.append(text)
+        written.set()
+
+    monkeypatch.setattr(manager, '_write_file', write)
+    return writes, written
+
+
+def test_config_writes_are_coalesced(tmp_path, monkeypatch):
+    config_file = tmp_path / 'monitor_config.json'
+    manager = ConfigManager(str(config_file))
+    monkeypatch.setattr(manager, 'WRITE_DELAY', 0.1)
+    writes, written = counting_writer(manager, monkeypatch)
+
+    for value in range(20):
+        manager.config['change_sensitivity'] = value / 100
+        manager.save_config()
+
+    assert written.wait(2.0)
+    time.sleep(0.3)
+    assert len(writes) == 1
+    assert json.loads(config_file.read_text(encoding='utf-8'))['change_sensitivity'] == 0.19
+    assert not (tmp_path / 'monitor_config.json.tmp').exists()
+
+    # 저장할 변경이 없으면 flush()는 쓰지 않음
+    manager.flush()
+    assert len(writes) == 1
+
+
+def test_flush_writes_pending_changes_immediately(tmp_path, monkeypatch):
+    config_file = tmp_path / 'monitor_config.json'
+    manager = ConfigManager(str(config_file))
+    monkeypatch.setattr(manager, 'WRITE_DELAY', 60.0)
+    writes, _ = counting_writer(manager, monkeypatch)
+
+    manager.config['monitoring_interval'] = 1.5
+    manager.save_config()
+    manager.flush()
+
+    assert len(writes) == 1
+    assert ConfigManager(str(config_file)).config['monitoring_interval'] == 1.5
@@ -0,0 +1,78 @@
+import os
+import threading
+import time
+
+import numpy as np
+
+from main_monitior import ConfigManager, DebugArtifactWriter
+
+
+def make_writer(tmp_path, **config) -> DebugArtifactWriter:
+    return DebugArtifactWriter(ConfigManager(initial_config={'debug_dir': str(tmp_path / 'debug'), **config}))
+
+
+def wait_until(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+def noise(seed: int) -> np.ndarray:
+    # 압축되지 않는 잡음 이미지 (PNG 크기가 일정)
+    return np.random.default_rng(seed).integers(0, 256, (64, 64), dtype=np.uint8)
+
+
+def test_full_queue_drops_oldest_images(tmp_path, monkeypatch):
+    writer = make_writer(tmp_path)
+    started, release = threading.Event(), threading.Event()
+    write = writer._write
+
+    def blocked_write(name, timestamp, image):
+        started.set()
+        release.wait(5)
+        write(name, timestamp, image)
+
+    monkeypatch.setattr(writer, '_write', blocked_write)
+    writer.submit('first', noise(0))
+    assert started.wait(5)
+
+    # 저장 스레드가 막혀 있는 동안 큐 크기보다 2장 더 요청
+    for index in range(writer.MAX_QUEUE + 2):
+        writer.submit(f'queued{index:02d}', noise(index))
+    assert writer.dropped_count == 2
+    assert [name for name, _, _ in writer.pending][0] == 'queued02'
+
+    release.set()
+    wait_until(lambda: writer.written_count == writer.MAX_QUEUE + 1)
+    names = sorted(os.listdir(tmp_path / 'debug'))
+    assert not any('queued00' in name or 'queued01' in name for name in names)
+
+
+def test_submit_copies_reused_buffer(tmp_path):
+    writer = make_writer(tmp_path)
+    writer.thread = threading.current_thread()   # 저장 스레드를 시작하지 않음
+    image = np.zeros((8, 8), dtype=np.uint8)
+    writer.submit('frame', image)
+    image[:] = 255
+
+    assert writer.pending[0][2].max() == 0
+
+
+def test_disk_budget_removes_oldest_files(tmp_path):
+    debug_dir = tmp_path / 'debug'
+    debug_dir.mkdir()
+    (debug_dir / 'debug_old.png').write_bytes(b'x' * 5000)
+    writer = make_writer(tmp_path, debug_png_compression=0, debug_max_mb=12000 / (1024 * 1024))
+
+    for index in range(4):
+        writer.submit(f'frame{index}', noise(index))
+    wait_until(lambda: writer.written_count == 4)
+
+    names = sorted(os.listdir(debug_dir))
+    sizes = sum(os.path.getsize(debug_dir / name) for name in names)
+    # 이전 실행에서 남은 파일도 한도에 포함되어 가장 먼저 지워짐
+    assert 'debug_old.png' not in names
+    assert sizes == writer.total_bytes <= 12000
+    assert any('frame3' in name for name in names)
+    assert not any('frame0' in name for name in names)
@@ -0,0 +1,44 @@
+import pytest
+
+from main_monitior import FileCaptureBackend
+
+LARGE = (0, 0, 640, 512)
+
+
+def detect_pair(detector, backend):
+    first = detector.detect_change(backend.grab(LARGE))
+    second = detector.detect_change(backend.grab(LARGE))
+    return first, second
+
+
+def test_scaled_detection_matches_full_resolution(make_detector, synthetic_state, frame_folder):
+    source = frame_folder([synthetic_state(2, LARGE), synthetic_state(3, LARGE)])
+    # 블러가 이웃 타일로 번지는 만큼은 무시 (추가된 행 하나는 약 4만 픽셀)
+    full = make_detector(tile_grid=[8, 1], tile_min_pixels=10000)
+    scaled = make_detector(tile_grid=[8, 1], tile_min_pixels=10000, detection_scale=0.25)
+
+    assert detect_pair(full, FileCaptureBackend(source)) == (False, True)
+    assert detect_pair(scaled, FileCaptureBackend(source)) == (False, True)
+
+    # 비교는 1/4 해상도에서 하지만 픽셀 수와 범위는 원본 해상도로 환산
+    assert scaled.previous_image.shape == (128, 160)
+    assert scaled.scale_factors == (4.0, 4.0)
+    assert scaled.last_change_info['change_ratio'] == pytest.approx(full.last_change_info['change_ratio'], rel=0.15)
+    assert scaled.last_change_info['changed_pixels'] == pytest.approx(full.last_change_info['changed_pixels'], rel=0.15)
+    assert scaled.last_change_info['changed_rows'] == full.last_change_info['changed_rows'] == [2]
+    assert scaled.last_change_info['bbox'] == full.last_change_info['bbox'] == (0, 128, 640, 64)
+
+
+def test_tile_min_pixels_is_in_original_pixels(make_detector, synthetic_state):
+    detector = make_detector(tile_grid=[8, 1], tile_min_pixels=160, detection_scale=0.25)
+    detector.detect_change(synthetic_state(0, LARGE))
+
+    assert detector.detection_tile_min_pixels == 10.0
+
+
+def test_small_regions_are_not_scaled(make_detector, synthetic_state):
+    detector = make_detector(detection_scale=0.5)
+    image = synthetic_state(0, (0, 0, 2, 2))
+
+    assert detector.downscale_for_detection(image).shape == (1, 1, 3)
+    assert detector.detection_shape((1, 1)) == (1, 1)
@@ -0,0 +1,68 @@
+import pytest
+
+from main_monitior import DETECTOR_ENGINES, AbsDiffEngine
+
+ENGINE_INFO = {
+    'absdiff': set(),
+    'ssim': {'similarity'},
+    'histogram': set(),
+    'phash': {'hash_distance'},
+}
+
+
+@pytest.mark.parametrize('engine', sorted(DETECTOR_ENGINES))
+def test_engine_detects_queue_change_only(make_detector, synthetic_state, engine):
+    detector = make_detector(detector_engine=engine, frame_fingerprint=False)
+    assert detector.engine.name == engine
+
+    # 같은 화면은 변화 없음, 대기열이 0행 → 4행이 되면 변화
+    assert detector.detect_change(synthetic_state(0)) is False
+    assert detector.detect_change(synthetic_state(0)) is False
+    assert detector.detect_change(synthetic_state(4)) is True
+    info = detector.last_change_info
+    assert info['change_ratio'] >= detector.change_threshold
+    assert ENGINE_INFO[engine] <= set(info)
+
+    assert detector.detect_change(synthetic_state(4)) is False
+
+
+@pytest.mark.parametrize('engine', sorted(DETECTOR_ENGINES))
+def test_engine_reports_zero_for_identical_frames(make_detector, synthetic_state, engine):
+    detector = make_detector(detector_engine=engine)
+    processed = detector.preprocess_for_comparison(synthetic_state(3)).copy()
+
+    changed_pixels, _ = detector.engine.run(processed, processed.copy())
+
+    assert changed_pixels == 0
+
+
+@pytest.mark.parametrize('engine', ['absdiff', 'ssim', 'histogram'])
+def test_engine_reports_changed_rows(make_detector, synthetic_state, engine):
+    detector = make_detector(detector_engine=engine, tile_grid=[8, 1], tile_min_pixels=200)
+    detector.detect_change(synthetic_state(2))
+
+    assert detector.detect_change(synthetic_state(3)) is True
+    # 새로 추가된 2번 행은 반드시 포함, 창/히스토그램 기반 엔진은 이웃 행까지 번질 수 있음
+    rows = detector.last_change_info['changed_rows']
+    assert 2 in rows
+    assert not any(row > 3 for row in rows)
+
+
+def test_engine_cost_accounting(make_detector, synthetic_state):
+    detector = make_detector(detector_engine='ssim', frame_fingerprint=False)
+    for state in (0, 0, 1, 1):
+        detector.detect_change(synthetic_state(state))
+
+    stats = detector.engine.get_cost_stats()
+    assert stats['engine'] == 'ssim'
+    assert stats['frames'] == 3   # 첫 프레임은 기준 설정만
+    assert 0 < stats['p50_ms'] <= stats['max_ms']
+
+    # 파이프라인 작업 프로세스에서 받은 집계로 교체
+    other = make_detector(detector_engine='ssim')
+    other.engine.set_cost_state(detector.engine.get_cost_state())
+    assert other.engine.get_cost_stats() == stats
+
+
+def test_unknown_engine_falls_back_to_absdiff(make_detector):
+    assert isinstance(make_detector(detector_engine='optical-flow').engine, AbsDiffEngine)
@@ -0,0 +1,92 @@
+import threading
+import time
+from datetime import datetime
+
+import pytest
+
+import main_monitior
+from main_monitior import EventHistoryStore
+
+
+def test_history_round_trip(tmp_path):
+    store = EventHistoryStore(str(tmp_path / 'event_history.db'), batch_size=2)
+    store.start()
+    day = datetime(2026, 3, 2)
+    events = [
+        ('대기열', 0.10, 500, 1, day.replace(hour=9, minute=5)),
+        ('대기열', 0.30, 900, 2, day.replace(hour=9, minute=40)),
+        ('호출', 0.20, 300, None, day.replace(hour=14)),
+        ('대기열', 0.50, 100, 3, datetime(2026, 3, 3, 9)),
+    ]
+    for region, ratio, pixels, number, when in events:
+        assert store.record(region, ratio, pixels, change_number=number, timestamp=when.timestamp())
+    store.stop()
+    assert store.written_count == 4
+
+    rows = store.query_events(start=day.timestamp(), end=datetime(2026, 3, 3).timestamp())
+    assert [(row['region'], row['change_number']) for row in rows] == [('대기열', 1), ('대기열', 2), ('호출', None)]
+    assert [row['region'] for row in store.query_events(region='호출')] == ['호출']
+
+    report = store.daily_report('2026-03-02')
+    assert report['date'] == '2026-03-02'
+    assert report['total'] == 3
+    queue_entry = report['regions']['대기열']
+    assert queue_entry['count'] == 2
+    assert queue_entry['hourly'][9] == 2
+    assert queue_entry['peak_hour'] == 9
+    assert queue_entry['mean_change_ratio'] == pytest.approx(0.20)
+    assert report['regions']['호출']['hourly'][14] == 1
+
+
+def test_queries_do_not_create_database(tmp_path):
+    path = tmp_path / 'event_history.db'
+    store = EventHistoryStore(str(path))
+
+    assert store.query_events() == []
+    assert store.daily_report('2026-03-02')['total'] == 0
+    assert not path.exists()
+
+
+def test_stop_does_not_hang_on_full_queue(tmp_path, monkeypatch):
+    store = EventHistoryStore(str(tmp_path / 'event_history.db'), max_pending=2)
+    release = threading.Event()
+    connect = store._connect
+
+    def blocked_connect():
+        release.wait(5)
+        return connect()
+
+    monkeypatch.setattr(store, '_connect', blocked_connect)
+    store.start()
+    for _ in range(3):
+        store.record('대기열', 0.1, 100)
+    assert store.dropped_count == 1
+
+    worker = store.worker
+    started = time.monotonic()
+    store.stop(timeout=0.2)
+    assert time.monotonic() - started < 1.0
+    assert store.dropped_count == 3
+
+    release.set()
+    worker.join(2)
+    assert not worker.is_alive()
+
+
+def test_report_rejects_bad_date(capsys):
+    with pytest.raises(SystemExit) as exit_info:
+        main_monitior.main(['--report', '2026-13-01'])
+
+    assert exit_info.value.code == 2
+    assert 'YYYY-MM-DD' in capsys.readouterr().err
+
+
+def test_report_prints_day(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    store = EventHistoryStore('event_history.db')
+    store.start()
+    store.record('대기열', 0.2, 400, timestamp=datetime(2026, 3, 2, 10).timestamp())
+    store.stop()
+
+    assert main_monitior.main(['--config', str(tmp_path / 'missing.json'), '--report', '2026-03-02']) == 0
+    assert '변화 감지 1건' in capsys.readouterr().out
@@ -0,0 +1,48 @@
+from conftest import REGION
+from main_monitior import SyntheticCaptureBackend
+
+
+def test_fingerprint_skips_identical_frames(make_detector):
+    detector = make_detector()
+    backend = SyntheticCaptureBackend(change_every=3)
+
+    results = [detector.detect_change(backend.grab(REGION)) for _ in range(6)]
+
+    # 0: 기준 설정, 1-2: 같은 프레임, 3: 대기열 한 행 추가, 4-5: 같은 프레임
+    assert results == [False, False, False, True, False, False]
+    assert detector.fingerprint_checks == 6
+    assert detector.fingerprint_hits == 4
+
+
+def test_fingerprint_disabled_compares_every_frame(make_detector):
+    detector = make_detector(frame_fingerprint=False)
+    backend = SyntheticCaptureBackend(change_every=3)
+
+    results = [detector.detect_change(backend.grab(REGION)) for _ in range(6)]
+
+    assert results == [False, False, False, True, False, False]
+    assert detector.fingerprint_checks == 0
+
+
+def test_fingerprint_does_not_skip_pending_confirmation(make_detector, synthetic_state):
+    detector = make_detector(confirm_frames=2)
+    detector.detect_change(synthetic_state(0))
+
+    # 같은 프레임이라도 확인 대기 중이면 확인 횟수에 포함
+    changed = synthetic_state(1)
+    assert [detector.detect_change(changed) for _ in range(2)] == [False, True]
+    assert detector.fingerprint_hits == 0
+
+
+def test_strided_fingerprint_forces_full_compare(make_detector, synthetic_state):
+    detector = make_detector(fingerprint_stride=4, fingerprint_full_check=2)
+    frame = synthetic_state(0)
+    detector.detect_change(frame)
+
+    # 샘플하지 않은 픽셀만 바뀐 프레임: 지문은 같지만 full_check번 생략 후에는 비교해서 찾아냄
+    changed = frame.copy()
+    changed[1::4, 1::4] = 0
+    results = [detector.detect_change(changed) for _ in range(3)]
+
+    assert results == [False, False, True]
+    assert detector.fingerprint_hits == 2
@@ -0,0 +1,75 @@
+import numpy as np
+
+from conftest import REGION
+from main_monitior import FrameRecorder, FrameReplaySource, SyntheticCaptureBackend
+
+SHAPE = (8, 8, 3)
+SLOT_SIZE = FrameRecorder.TIMESTAMP_SIZE + int(np.prod(SHAPE))
+MAX_BYTES = FrameRecorder.HEADER_SIZE + 5 * SLOT_SIZE
+
+
+def record_values(path, values, **kwargs):
+    recorder = FrameRecorder(path, MAX_BYTES)
+    for value in values:
+        recorder.record(np.full(SHAPE, value, dtype=np.uint8), **kwargs)
+    recorder.close()
+
+
+def replay_values(path):
+    replay = FrameReplaySource(path, realtime=False)
+    try:
+        # 재생 프레임은 파일 매핑 뷰이므로 닫기 전에 값을 읽음
+        return [(timestamp, int(frame[0, 0, 0])) for timestamp, frame in replay.iter_frames()]
+    finally:
+        replay.close()
+
+
+def test_recorder_wraps_and_replays_oldest_first(tmp_path):
+    path = str(tmp_path / 'frames.pqmrec')
+    recorder = FrameRecorder(path, MAX_BYTES)
+    for value in range(7):
+        recorder.record(np.full(SHAPE, value, dtype=np.uint8), timestamp=1000.0 + value)
+    recorder.close()
+
+    assert replay_values(path) == [(1002.0, 2), (1003.0, 3), (1004.0, 4), (1005.0, 5), (1006.0, 6)]
+
+
+def test_recorder_resumes_existing_ring(tmp_path):
+    path = str(tmp_path / 'frames.pqmrec')
+    record_values(path, range(4))
+    record_values(path, range(4, 7))
+
+    assert [value for _, value in replay_values(path)] == [2, 3, 4, 5, 6]
+    assert [p.name for p in tmp_path.iterdir()] == ['frames.pqmrec']
+
+
+def test_recorder_rotates_file_with_other_layout(tmp_path):
+    path = str(tmp_path / 'frames.pqmrec')
+    record_values(path, range(3))
+
+    recorder = FrameRecorder(path, MAX_BYTES)
+    recorder.record(np.zeros((4, 4, 3), dtype=np.uint8))
+    recorder.close()
+
+    names = sorted(p.name for p in tmp_path.iterdir())
+    assert len(names) == 2 and 'frames.pqmrec' in names
+    rotated = next(name for name in names if name != 'frames.pqmrec')
+    assert [value for _, value in replay_values(str(tmp_path / rotated))] == [0, 1, 2]
+
+
+def test_replay_crops_recorded_region(tmp_path):
+    path = str(tmp_path / 'frames.pqmrec')
+    backend = SyntheticCaptureBackend(change_every=1)
+    recorder = FrameRecorder(path, 1 << 20)
+    frames = [backend.grab(REGION).copy() for _ in range(3)]
+    for frame in frames:
+        recorder.record(frame, origin=(100, 50))
+    recorder.close()
+
+    replay = FrameReplaySource(path, realtime=False)
+    try:
+        assert len(replay) == 3
+        crop = replay.grab((110, 60, 20, 10))
+        assert np.array_equal(crop, frames[0][10:20, 10:30])
+    finally:
+        replay.close()
@@ -0,0 +1,76 @@
+from conftest import REGION
+from main_monitior import (
+    ConfigManager,
+    FileCaptureBackend,
+    KnownStateCache,
+    MonitoringRegion,
+    get_ignored_states,
+)
+
+
+def region_hash(detector, frame) -> str:
+    return format(detector.state_hash(frame), '016x')
+
+
+def test_ignored_state_suppresses_flip(make_detector, synthetic_state, frame_folder):
+    source = frame_folder([synthetic_state(0), synthetic_state(1)])
+
+    plain = make_detector()
+    backend = FileCaptureBackend(source)
+    assert [plain.detect_change(backend.grab(REGION)) for _ in range(4)] == [False, True, True, True]
+
+    ignored = {'대기열': [region_hash(plain, synthetic_state(1))]}
+    region = MonitoringRegion(ConfigManager(initial_config={'ignored_states': ignored}), '대기열', REGION)
+    backend = FileCaptureBackend(source)
+
+    # A → B(무시) → A → B: 기준은 A로 유지되고 알림 없음
+    assert [region.detector.detect_change(backend.grab(REGION)) for _ in range(4)] == [False, False, False, False]
+    assert region.detector.known_state_hits['ignore'] == 2
+
+
+def test_ignored_state_applies_only_to_its_region(make_detector, synthetic_state, frame_folder):
+    source = frame_folder([synthetic_state(0), synthetic_state(1)])
+    config = ConfigManager(initial_config={
+        'ignored_states': {'대기열': [region_hash(make_detector(), synthetic_state(1))]},
+    })
+    queue_region = MonitoringRegion(config, '대기열', REGION)
+    call_region = MonitoringRegion(config, '호출', REGION)
+
+    backend = FileCaptureBackend(source)
+    frames = [backend.grab(REGION) for _ in range(2)]
+
+    assert [queue_region.detector.detect_change(frame) for frame in frames] == [False, False]
+    assert call_region.detector.known_states is None
+    assert [call_region.detector.detect_change(frame) for frame in frames] == [False, True]
+
+
+def test_legacy_ignored_list_applies_to_every_region():
+    assert get_ignored_states({'ignored_states': ['ff']}, '호출') == [0xff]
+    assert get_ignored_states({'ignored_states': {'대기열': ['ff']}}, '호출') == []
+    assert get_ignored_states({'ignored_states': {'대기열': ['ff', 'not-hex']}}, '대기열') == [0xff]
+
+
+def test_remembered_alert_state_still_passes_thresholds(make_detector, synthetic_state):
+    detector = make_detector(known_state_cache=True)
+    state_a, state_b = synthetic_state(0), synthetic_state(1)
+    detector.detect_change(state_a)
+    assert detector.detect_change(state_b) is True
+
+    # B는 기억된 알림 상태지만 민감도를 올리면 평소 비교처럼 임계값에 걸러짐
+    detector.set_sensitivity(0.9)
+    assert detector.detect_change(state_a) is False
+    assert detector.known_state_hits['alert'] == 1
+
+
+def test_cache_evicts_alert_states_before_ignored():
+    cache = KnownStateCache(capacity=2, ignored=[1])
+    cache.remember(2)
+    cache.remember(3)
+
+    assert cache.lookup(1) == ('ignore', {})
+    assert cache.lookup(2) is None
+    assert cache.lookup(3)[0] == 'alert'
+
+    # 무시로 지정한 상태는 알림 상태로 덮어쓰지 않음
+    cache.remember(1, {'change_ratio': 0.5})
+    assert cache.lookup(1) == ('ignore', {})
@@ -0,0 +1,48 @@
+import logging
+
+import pytest
+
+import main_monitior
+
+
+@pytest.fixture
+def log_file(tmp_path):
+    path = tmp_path / 'patient_monitor.log'
+    yield path
+    # 다른 테스트의 로그는 계속 임시 폴더로
+    main_monitior.setup_logging({'log_file': str(tmp_path / 'after.log')})
+
+
+def read_log(path) -> str:
+    main_monitior.shutdown_logging()   # 리스너가 큐에 남은 기록을 모두 쓰고 파일을 닫음
+    return path.read_text(encoding='utf-8')
+
+
+def test_invalid_log_level_falls_back_to_info(log_file):
+    main_monitior.setup_logging({'log_file': str(log_file), 'log_level': 'verbose'})
+
+    assert logging.getLogger().level == logging.INFO
+    logging.getLogger('test').debug('hidden')
+    text = read_log(log_file)
+    assert "알 수 없는 log_level 'verbose'" in text
+    assert 'hidden' not in text
+
+
+def test_log_level_is_case_insensitive(log_file):
+    main_monitior.setup_logging({'log_file': str(log_file), 'log_level': 'debug'})
+
+    assert logging.getLogger().level == logging.DEBUG
+    logging.getLogger('test').debug('value %d', 42)
+    assert 'value 42' in read_log(log_file)
+
+
+def test_size_rotation_keeps_backups(log_file):
+    main_monitior.setup_logging({'log_file': str(log_file), 'log_max_mb': 0.001, 'log_backup_count': 2})
+
+    for index in range(100):
+        logging.getLogger('test').info('line %03d %s', index, 'x' * 40)
+    read_log(log_file)
+
+    names = sorted(path.name for path in log_file.parent.iterdir())
+    assert names == ['patient_monitor.log', 'patient_monitor.log.1', 'patient_monitor.log.2']
+    assert 'line 099' in log_file.read_text(encoding='utf-8')
@@ -0,0 +1,175 @@
+import queue
+import sys
+import threading
+
+import numpy as np
+import pytest
+
+import main_monitior
+from main_monitior import ConfigManager, OCRService, WaitingCountReader
+
+
+class FakeOCRService:
+    """영역 이미지의 첫 픽셀 값을 인원 수로 읽는 OCR 엔진"""
+
+    backend = 'fake'
+
+    def __init__(self, gate=None):
+        self.gate = gate
+        self.batches = []
+
+    def recognize_batch(self, images):
+        self.batches.append(len(images))
+        if self.gate is not None:
+            self.gate.wait(timeout=5)
+        return [(f"대기 {int(image[0, 0])}명", 0.001) for image in images]
+
+    def close(self):
+        pass
+
+
+def make_reader(workers=1, gate=None):
+    reader = WaitingCountReader(ConfigManager(initial_config={'ocr_workers': workers, 'ocr_timeout': 2.0}))
+    reader.services = [FakeOCRService(gate) for _ in range(workers)]
+    reader.service = reader.services[0]
+    # 전처리(이진화)를 건너뛰어 픽셀 값을 그대로 엔진에 넘김
+    reader.prepare = lambda image: image
+    return reader
+
+
+def crop(count):
+    return np.full((16, 32), count, dtype=np.uint8)
+
+
+@pytest.fixture
+def delivered():
+    return queue.Queue()
+
+
+def deliveries(delivered, n):
+    return sorted(delivered.get(timeout=5) for _ in range(n))
+
+
+@pytest.mark.parametrize('text, expected', [
+    ("대기 4명", 4),
+    ("창구 2 대기 12 명", 12),     # '명'이 붙은 숫자를 우선
+    ("waiting 7", 7),
+    ("", None),
+    (None, None),
+])
+def test_parse_count(text, expected):
+    assert WaitingCountReader.parse_count(text) == expected
+
+
+def test_changed_regions_are_recognized_in_one_batch(delivered):
+    reader = make_reader()
+    try:
+        assert reader.submit(1, "A 변화", 0.0, [('A', crop(3)), ('B', crop(5))],
+                             lambda number, detail: delivered.put((number, detail)))
+        assert deliveries(delivered, 1) == [(1, "A 3명 대기 / B 5명 대기 · A 변화")]
+        assert reader.service.batches == [2]
+
+        # 같은 화면은 캐시된 결과 사용
+        reader.submit(2, None, 0.0, [('A', crop(3)), ('B', crop(5))],
+                      lambda number, detail: delivered.put((number, detail)))
+        assert deliveries(delivered, 1) == [(2, "A 3 → 3명 대기 / B 5 → 5명 대기")]
+        assert reader.service.batches == [2]
+        assert reader.cache_hits == 2
+    finally:
+        reader.shutdown()
+
+
+def test_prime_reads_every_region(delivered):
+    reader = make_reader()
+    try:
+        assert reader.prime([('A', crop(1)), ('B', crop(2)), ('C', crop(3))])
+        reader.submit(1, None, 0.0, [('A', crop(2)), ('B', crop(3)), ('C', crop(4))],
+                      lambda number, detail: delivered.put(detail))
+
+        assert deliveries(delivered, 1) == ["A 1 → 2명 대기 / B 2 → 3명 대기 / C 3 → 4명 대기"]
+        # 기준 화면과 같은 B, C 이미지는 캐시에서 읽고 A만 다시 인식
+        assert reader.service.batches == [3, 1]
+    finally:
+        reader.shutdown()
+
+
+def test_busy_engine_queues_second_alert(delivered):
+    gate = threading.Event()
+    reader = make_reader(gate=gate)
+    try:
+        reader.submit(1, None, 0.0, [('A', crop(3))], lambda number, detail: delivered.put((number, detail)))
+        reader.submit(2, None, 0.0, [('A', crop(4))], lambda number, detail: delivered.put((number, detail)))
+        gate.set()
+
+        # 엔진이 바빠도 두 번째 알림의 인원 수를 버리지 않음
+        assert deliveries(delivered, 2) == [(1, "3명 대기"), (2, "3 → 4명 대기")]
+    finally:
+        reader.shutdown()
+
+
+def test_each_worker_has_its_own_engine(delivered):
+    # 두 엔진이 동시에 인식 중일 때만 통과하는 장벽
+    barrier = threading.Barrier(2)
+    reader = make_reader(workers=2, gate=barrier)
+    try:
+        reader.submit(1, None, 0.0, [('A', crop(3))], lambda number, detail: delivered.put(number))
+        reader.submit(2, None, 0.0, [('B', crop(4))], lambda number, detail: delivered.put(number))
+
+        assert deliveries(delivered, 2) == [1, 2]
+        assert [service.batches for service in reader.services] == [[1], [1]]
+        assert not barrier.broken
+    finally:
+        reader.shutdown()
+
+
+def test_later_request_result_is_not_overwritten():
+    reader = make_reader()
+    assert reader._update_count('A', 2, 5) is None
+    # 먼저 요청했지만 늦게 끝난 결과는 최신 값을 덮어쓰지 않음
+    assert reader._update_count('A', 1, 4) is None
+    assert reader.get_last_count('A') == 5
+    assert reader._update_count('A', 3, 6) == 5
+
+
+FAKE_TESSERACT = """#!{python}
+import sys, time
+import cv2, numpy as np
+image = cv2.imdecode(np.frombuffer(sys.stdin.buffer.read(), np.uint8), cv2.IMREAD_GRAYSCALE)
+value = int(image[0, 0])
+time.sleep(value / 100)  # 픽셀 값 1당 10ms
+sys.stdout.write("대기 %d명\\n" % value)
+"""
+
+
+@pytest.fixture
+def cli_service(tmp_path, monkeypatch):
+    """tesseract 대신 PNG의 첫 픽셀 값을 인원 수로 출력하는 스크립트를 쓰는 cli OCR"""
+    script = tmp_path / 'tesseract'
+    script.write_text(FAKE_TESSERACT.format(python=sys.executable), encoding='utf-8')
+    script.chmod(0o755)
+    monkeypatch.setattr(main_monitior, 'TESSEROCR_AVAILABLE', False)
+    service = OCRService(timeout=1.0)
+    service.tesseract_cmd = str(script)
+    return service
+
+
+def test_auto_backend_falls_back_to_cli(cli_service):
+    assert cli_service.backend == 'cli'
+    assert cli_service.is_available()
+
+
+def test_cli_measures_each_crop(cli_service):
+    results = cli_service.recognize_batch([crop(2), crop(40)])
+
+    assert [WaitingCountReader.parse_count(text) for text, _ in results] == [2, 40]
+    fast, slow = (latency for _, latency in results)
+    assert slow >= 0.4
+    assert fast < slow - 0.2
+
+
+def test_cli_timeout_applies_per_crop(cli_service):
+    results = cli_service.recognize_batch([crop(200), crop(3)])
+
+    # 시간을 넘긴 이미지만 빈 결과, 다음 이미지는 따로 인식
+    assert [text.strip() for text, _ in results] == ["", "대기 3명"]
+    assert results[0][1] < 1.8
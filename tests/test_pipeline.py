@@ -0,0 +1,56 @@
+import time
+
+from main_monitior import ConfigManager, DetectionPipeline, HeadlessAlertDispatcher, PatientQueueMonitor
+
+
+class RecordingDispatcher(HeadlessAlertDispatcher):
+    def __init__(self):
+        super().__init__(['log'])
+        self.alerts = []
+
+    def submit(self, change_number, detail=None, detected_at=None):
+        self.alerts.append((change_number, detail))
+        return True
+
+
+def test_pipeline_round_trip_over_shared_memory():
+    config = ConfigManager(initial_config={
+        'capture_backend': 'synthetic',   # 10프레임마다 대기열 행이 하나씩 늘어남
+        'monitoring_regions': [
+            {'label': '왼쪽', 'region': [0, 0, 160, 128]},
+            {'label': '오른쪽', 'region': [160, 0, 160, 128]},
+        ],
+        'pipeline_workers': 2,
+        'history_enabled': False,
+    })
+    dispatcher = RecordingDispatcher()
+    monitor = PatientQueueMonitor(config, dispatcher)
+    pipeline = DetectionPipeline(monitor)
+    pipeline.start()
+    try:
+        requested = 0
+        deadline = time.monotonic() + 60
+        while requested < 25:
+            assert time.monotonic() < deadline, "pipeline did not keep up"
+            if pipeline.request_capture():
+                requested += 1
+            else:
+                time.sleep(0.005)
+        while pipeline.cycles:
+            assert time.monotonic() < deadline, "pipeline did not drain"
+            time.sleep(0.01)
+    finally:
+        pipeline.stop()
+
+    # 두 영역이 10, 20번째 프레임에서 각각 변화 (한 주기의 변화는 알림 하나로 묶음)
+    assert pipeline.worker_count == 2
+    assert monitor.change_count == 4
+    assert [region.change_count for region in monitor.regions] == [2, 2]
+    assert [number for number, _ in dispatcher.alerts] == [2, 4]
+    assert monitor.metrics.counters['cycles'] == 25
+
+    # 작업 프로세스가 종료하면서 보낸 감지기 통계가 부모 쪽 감지기에 반영됨
+    for region in monitor.regions:
+        assert region.detector.fingerprint_checks == 25
+        assert region.detector.fingerprint_hits == 22
+        assert region.detector.engine.frames == 2
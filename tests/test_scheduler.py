@@ -0,0 +1,103 @@
+import pytest
+
+import main_monitior
+from main_monitior import AdaptivePollingScheduler, ConfigManager
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class RecordingStopEvent:
+    """대기하지 않고 요청된 대기 시간만 기록"""
+
+    def __init__(self, clock):
+        self.clock = clock
+        self.timeouts = []
+
+    def wait(self, timeout):
+        self.timeouts.append(timeout)
+        self.clock.now += timeout
+        return False
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(main_monitior.time, 'monotonic', clock)
+    return clock
+
+
+def make_scheduler(**config) -> AdaptivePollingScheduler:
+    scheduler = AdaptivePollingScheduler(ConfigManager(initial_config={
+        'monitoring_interval': 2.0,
+        'min_monitoring_interval': 0.5,
+        'max_monitoring_interval': 10.0,
+        'idle_backoff_after': 300.0,
+        **config,
+    }))
+    scheduler.reset()
+    return scheduler
+
+
+def test_deadlines_do_not_accumulate_work_time(clock):
+    scheduler = make_scheduler(adaptive_polling=False)
+    stop_event = RecordingStopEvent(clock)
+
+    for _ in range(3):
+        assert scheduler.wait(stop_event)
+        clock.now += 0.3   # 캡처와 감지에 걸린 시간
+        scheduler.record_cycle(False)
+
+    # 첫 주기 뒤로는 작업 시간만큼 덜 기다려 2초 간격을 유지
+    assert stop_event.timeouts == pytest.approx([2.0, 1.7, 1.7])
+    assert scheduler.next_deadline == pytest.approx(1006.0)
+
+
+def test_missed_deadline_restarts_from_now(clock):
+    scheduler = make_scheduler(adaptive_polling=False)
+    stop_event = RecordingStopEvent(clock)
+    scheduler.wait(stop_event)
+
+    clock.now += 7.0   # 주기보다 오래 걸린 작업
+    scheduler.wait(stop_event)
+    scheduler.wait(stop_event)
+
+    assert scheduler.missed_deadlines == 1
+    assert stop_event.timeouts == pytest.approx([2.0, 0.0, 2.0])
+
+
+def test_adaptive_interval_speeds_up_then_backs_off(clock):
+    scheduler = make_scheduler()
+    intervals = []
+    for changed in (True, False, False, False, False):
+        scheduler.record_cycle(changed)
+        intervals.append(scheduler.current_interval)
+
+    # 변화 직후 최소 주기, 이후 기본 주기까지 1.5배씩 복귀
+    assert intervals == pytest.approx([0.5, 0.75, 1.125, 1.6875, 2.0])
+
+    clock.now += 301.0
+    idle = []
+    for _ in range(5):
+        scheduler.record_cycle(False)
+        idle.append(scheduler.current_interval)
+
+    # 오래 변화가 없으면 최대 주기까지 늘림
+    assert idle == pytest.approx([3.0, 4.5, 6.75, 10.0, 10.0])
+
+    scheduler.record_cycle(True)
+    assert scheduler.current_interval == 0.5
+
+
+def test_adaptive_polling_disabled_keeps_base_interval(clock):
+    scheduler = make_scheduler(adaptive_polling=False)
+    scheduler.record_cycle(True)
+    clock.now += 301.0
+    scheduler.record_cycle(False)
+
+    assert scheduler.current_interval == 2.0
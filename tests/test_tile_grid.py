@@ -0,0 +1,49 @@
+import cv2
+import numpy as np
+
+from conftest import REGION
+from main_monitior import FileCaptureBackend
+
+
+def test_tile_rows_report_changed_queue_row(make_detector, synthetic_state, frame_folder):
+    backend = FileCaptureBackend(frame_folder([synthetic_state(2), synthetic_state(3)]))
+    detector = make_detector(tile_grid=[8, 1], tile_min_pixels=200)
+
+    assert detector.detect_change(backend.grab(REGION)) is False
+    assert detector.detect_change(backend.grab(REGION)) is True
+
+    # 상태 3은 상태 2에 세 번째 행(0부터 세면 2번 행)이 추가된 화면
+    info = detector.last_change_info
+    assert info['changed_rows'] == [2]
+    assert info['changed_tiles'] == [(2, 0)]
+    assert info['bbox'] == (0, 32, 160, 16)
+
+
+def test_tile_counts_match_count_non_zero(make_detector):
+    detector = make_detector(tile_grid=[5, 7])
+    mask = np.zeros((97, 131), dtype=np.uint8)
+    mask[np.random.default_rng(0).random(mask.shape) < 0.1] = 255
+
+    changed_pixels, info = detector.locate_changes(mask)
+
+    assert changed_pixels == cv2.countNonZero(mask)
+    assert len(info['changed_tiles']) == 35
+
+
+def test_tiles_located_only_above_threshold(make_detector, monkeypatch):
+    detector = make_detector(tile_grid=[4, 4])
+    calls = []
+    locate = detector.locate_changes
+    monkeypatch.setattr(detector, 'locate_changes', lambda mask: calls.append(mask) or locate(mask))
+
+    quiet = np.zeros((64, 64), dtype=np.uint8)
+    quiet[:2, :2] = 255
+    assert detector.count_changed_pixels(quiet) == (4, {})
+    assert calls == []
+
+    busy = np.zeros((64, 64), dtype=np.uint8)
+    busy[16:32] = 255
+    changed_pixels, info = detector.count_changed_pixels(busy)
+    assert changed_pixels == 16 * 64
+    assert info['changed_rows'] == [1]
+    assert len(calls) == 1